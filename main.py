@@ -11,6 +11,7 @@ from queue import Queue, Empty
 from src.constants import Constants
 from src.config_manager import ConfigManager
 from src.camera_shake import CameraShake
+from src.hud_text import HudText
 from src.sprite_sheet import SpriteSheet
 from src.character import Character
 from src.bullet import Bullet, BulletTargetTypes
@@ -25,14 +26,29 @@ from src.level import Level
 from src.music_manager import MusicManager
 from src.ai_player import AIPlayer1, AIPlayer2, AIAction
 from src.ai_controller import AIController
+from src.enemy_predictor import EnemyPredictor
+from src.danger_map import DangerMapper
+from src.team_planner import TeamPlanner
 from src.game_manager import GameThreadManager  # 🔥 YENİ: Thread Manager
+from src.audio_manager import NullAudioBackend
+from src.audio_events import AudioEvents, SoundEvent
 from src.message_system import MessageBus, Actor, MessageType  # 🔥 YENİ: Message System
-from src.main_game_loop import MainGameLoop
+from src.game_actors import GameActorSystem
+from src.main_game_loop import MainGameLoop, PacingPolicy
 
 class WizardOfWor:
-    def __init__(self):
+    def __init__(self, headless=False):
+        # Headless: pencere ve ses cihazı açılmaz, yardımcı thread başlatılmaz
+        self.headless = headless
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        
         pygame.init()
         pygame.mixer.init()
+        
+        # HUD fontları bir kez çözülür
+        HudText.init()
 
         # Main game loop coordinator
         self.main_loop = None
@@ -83,11 +99,15 @@ class WizardOfWor:
         ConfigManager.load_config("config.ini")
         self.screen_scale = ConfigManager.get_config(Constants.SCREEN_SCALE, Constants.DEFAULT_SCREEN_SCALE)
         
+        # Döngü hızı politikası - vsync pencere oluşturulurken istenmeli
+        self.pacing = PacingPolicy.HEADLESS if headless else PacingPolicy.from_name(
+            ConfigManager.get_config(Constants.LOOP_PACING, Constants.DEFAULT_LOOP_PACING))
+        
         # Ekran ayarları
         self.screen = pygame.display.set_mode((
             self.SCREEN_WIDTH * self.screen_scale, 
             self.SCREEN_HEIGHT * self.screen_scale
-        ))
+        ), vsync=1 if self.pacing == PacingPolicy.VSYNC else 0)
         pygame.display.set_caption("Wizard of Wor")
         
         # Renkler
@@ -160,12 +180,6 @@ class WizardOfWor:
         self.numbers_sheet = None
         
         # Ses efektleri
-        self.player_shoot_sound = None
-        self.level_intro_sound = None
-        self.player_death_sound = None
-        self.worluk_escape_sound = None
-        self.worluk_death_sound = None
-        self.wizard_death_sound = None
         
         # Müzik yöneticisi
         self.music_manager = MusicManager()
@@ -179,9 +193,44 @@ class WizardOfWor:
         # Kamera sarsıntısı
         CameraShake.Enabled = ConfigManager.get_config(Constants.CAMERA_SHAKE, Constants.DEFAULT_CAMERA_SHAKE)
         
+        # Düşman mermi havuzu limitleri
+        Enemy.configure_bullet_pool()
+        
         # AI kontrolcüsü
-        self.ai_controller = AIController()
-        SimpleControls.set_ai_controller(self.ai_controller)
+        ai_seed = ConfigManager.get_config(Constants.AI_SEED, Constants.DEFAULT_AI_SEED)
+        self.ai_controller = AIController(
+            sync_mode=ConfigManager.get_config(Constants.AI_SYNC_MODE, Constants.DEFAULT_AI_SYNC_MODE),
+            decision_budget_ms=ConfigManager.get_config(Constants.AI_DECISION_BUDGET_MS, Constants.DEFAULT_AI_DECISION_BUDGET_MS),
+            seed=ai_seed if ai_seed >= 0 else None
+        )
+        if headless:
+            self.ai_controller.sync_mode = True
+            self.ai_controller.threaded = False
+        
+        # Düşman yörünge tahmini - frame başına bir kez hesaplanıp iki AI'a da verilir
+        self.enemy_predictor = EnemyPredictor(
+            ConfigManager.get_config(Constants.ENEMY_PREDICTION_HORIZON, Constants.DEFAULT_ENEMY_PREDICTION_HORIZON)
+        )
+        # Mermi tehlike haritası - aynı şekilde frame başına bir kez
+        self.danger_mapper = DangerMapper()
+        # İşbirliği modunda hedef/bölge ataması - frame başına bir kez
+        self.team_planner = TeamPlanner()
+        # Headless'ta klavye hiç okunmaz
+        SimpleControls.set_keyboard_enabled(not headless)
+        
+        # Oyun saati - senkron AI kararları bu saatle verilir
+        self.game_time = 0.0
+        
+        # Sabit adımlı simülasyon: gerçek frame süresi biriktirilir, oyun sabit dt ile adımlanır
+        simulation_rate = ConfigManager.get_config(Constants.SIMULATION_RATE, Constants.DEFAULT_SIMULATION_RATE)
+        self.fixed_delta_time = 1.0 / max(1, simulation_rate)
+        self.max_simulation_steps = ConfigManager.get_config(Constants.MAX_SIMULATION_STEPS, Constants.DEFAULT_MAX_SIMULATION_STEPS)
+        self.render_interpolation = ConfigManager.get_config(Constants.RENDER_INTERPOLATION, Constants.DEFAULT_RENDER_INTERPOLATION)
+        self.simulation_accumulator = 0.0
+        self.dropped_simulation_time = 0.0
+        
+        # True ise AsyncGameLoop sürer: AI, ses ve fizik thread'siz adımlanır
+        self.use_async_loop = False
         
         # Oyun modu seçimi
         self.player_selection_mode = False
@@ -196,6 +245,7 @@ class WizardOfWor:
         # 🔥 YENİ: Thread Management Sistemi
         self.thread_manager = None
         self.message_bus = None
+        self.actor_system = None
         self.thread_communication_enabled = True
         
         # 🔥 YENİ: Performance Monitoring
@@ -237,12 +287,6 @@ class WizardOfWor:
         self.levels = []
         
         # Ses efektleri - None
-        self.player_shoot_sound = None
-        self.level_intro_sound = None
-        self.player_death_sound = None
-        self.worluk_escape_sound = None
-        self.worluk_death_sound = None
-        self.wizard_death_sound = None
         
         # Thread sistemi - henüz başlatma
         self.thread_manager = None
@@ -272,17 +316,7 @@ class WizardOfWor:
             self.levels = []
             self.load_all_levels()
             
-            # Ses efektlerini yükle - hata durumunda devam et
-            try:
-                self.player_shoot_sound = pygame.mixer.Sound("assets/sounds/piou.wav")
-                self.level_intro_sound = pygame.mixer.Sound("assets/sounds/intro.wav")
-                self.player_death_sound = pygame.mixer.Sound("assets/sounds/death.wav")
-                self.worluk_escape_sound = pygame.mixer.Sound("assets/sounds/worluk-escape.wav")
-                self.worluk_death_sound = pygame.mixer.Sound("assets/sounds/worluk-kill.wav")
-                self.wizard_death_sound = pygame.mixer.Sound("assets/sounds/wizard-kill.wav")
-            except pygame.error:
-                # Ses dosyaları yoksa sessiz devam et
-                pass
+            # Ses efektleri ses bankasında (AudioManager) - olaylar AudioEvents ile çalınır
             
             # Müzik yöneticisini ayarla
             sound_paths = {
@@ -296,21 +330,26 @@ class WizardOfWor:
             # Thread Management Sistemi - hızlı başlatma
             try:
                 self.thread_manager = GameThreadManager()
-                self.thread_manager.start_threads()
+                threaded = not (self.use_async_loop or self.headless)
+                # Aktör modunda ses ve fizik kendi thread'lerini açmaz, aktörler sürer
+                use_actors = threaded and ConfigManager.get_config(
+                    Constants.ACTOR_SUBSYSTEMS, Constants.DEFAULT_ACTOR_SUBSYSTEMS)
+                self.thread_manager.start_threads(
+                    audio_threaded=threaded and not use_actors,
+                    physics_threaded=threaded and not use_actors,
+                    audio_backend=NullAudioBackend() if self.headless else None
+                )
                 self.audio_manager = self.thread_manager.audio_manager
-                self.message_bus = MessageBus()
-                self.thread_communication_enabled = True
+                AudioEvents.set_audio_manager(self.audio_manager)
                 
-                if self.audio_manager:
-                    sound_files = [
-                        "assets/sounds/piou.wav",
-                        "assets/sounds/intro.wav", 
-                        "assets/sounds/death.wav",
-                        "assets/sounds/worluk-escape.wav",
-                        "assets/sounds/worluk-kill.wav",
-                        "assets/sounds/wizard-kill.wav"
-                    ]
-                    self.audio_manager.preload_sounds(sound_files)
+                if use_actors:
+                    self.actor_system = GameActorSystem(self)
+                    self.message_bus = self.actor_system.bus
+                    self.ai_controller.actor_system = self.actor_system
+                    AudioEvents.set_batch_sink(self.actor_system.submit_audio)
+                else:
+                    self.message_bus = MessageBus()
+                self.thread_communication_enabled = True
                     
             except Exception:
                 # Thread başlatma başarısızsa thread'siz devam et
@@ -387,21 +426,26 @@ class WizardOfWor:
     
     def spawn_player(self, player_number, color, cage_x, cage_y):
         max_lives = ConfigManager.get_config(Constants.PLAYER_MAX_LIVES, Constants.DEFAULT_PLAYER_MAX_LIVES)
-        player = Player(self.player_sheet, max_lives, self.player_shoot_sound, cage_x, cage_y, player_number)
+        player = Player(self.player_sheet, max_lives, SoundEvent.SHOOT, cage_x, cage_y, player_number)
         player.set_speed(ConfigManager.get_config(Constants.PLAYER_SPEED, Constants.DEFAULT_PLAYER_SPEED))
         player.set_animation_speed(ConfigManager.get_config(Constants.PLAYER_ANIMATION_SPEED, Constants.DEFAULT_PLAYER_ANIMATION_SPEED))
         player.set_color(color)
         
         return player
     
-    def start_game(self, multiplayer):
+    def start_game(self, multiplayer, stage=0):
         self.player1 = self.spawn_player(PlayerNumber.PLAYER1, self.PLAYER1_COLOR, 11, 7)
         if multiplayer:
             self.player2 = self.spawn_player(PlayerNumber.PLAYER2, self.PLAYER2_COLOR, 1, 7)
         else:
             self.player2 = None
         
-        self.current_stage = 0
+        # Oyun saati ve hareket beklemeleri her oyunda sıfırdan başlar
+        self.game_time = 0.0
+        self.player1_last_move_time = 0
+        self.player2_last_move_time = 0
+        
+        self.current_stage = stage
         self.game_completed = False
         self.show_victory_screen = False
         
@@ -447,8 +491,7 @@ class WizardOfWor:
         self.kill_count = 0
         self.enemies_to_kill = self.burwors_to_spawn + self.garwor_to_spawn + self.thorwor_to_spawn
         
-        if self.level_intro_sound:
-            self.level_intro_sound.play()
+        AudioEvents.emit(SoundEvent.LEVEL_INTRO)
         
         # Seviye geçiş efekti için başlangıç zamanı ve görüntü ayarları
         self.level_start_timer = 1.5  # Düzeltilmiş süre
@@ -492,9 +535,8 @@ class WizardOfWor:
         transition_surface.fill((0, 0, 0, self.level_transition_alpha))
         
         # Mevcut level numarasını göster - daha büyük ve dikkat çekici
-        font_big = pygame.font.SysFont("Consolas", 32, bold=True)
         current_stage = self.current_stage + 1  # 0-indexed -> 1-indexed
-        level_text = font_big.render(f"LEVEL {current_stage}", True, (255, 255, 0))  # Sarı renk
+        level_text = HudText.render(f"LEVEL {current_stage}", 32, (255, 255, 0), bold=True, antialias=True)  # Sarı renk
         
         # Merkeze hizala
         text_rect = level_text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2))
@@ -617,58 +659,80 @@ class WizardOfWor:
             player.move_to(self.current_level.get_cell_position(player.cage_position_x, player.cage_position_y - 1))
     
     def process_player_input(self, player, delta_time):
+        if SimpleControls.get_player_type(player.player_number) == PlayerType.AI:
+            self.process_ai_command(player, delta_time)
+            return
+        
         # Ateş etme kontrolü - her basışta bir kez ateş et
         if SimpleControls.is_a_newly_pressed(player.player_number) and not player.is_firing():
-            player.fire()
-
-         # Ateş sesini audio thread'de çal
-            if self.audio_manager:
-                self.audio_manager.play_sound(
-                    "assets/sounds/piou.wav",
-                    volume=0.6
-                )
-            
-            CameraShake.shake(2, 50, 0.1)
+            self._player_fire(player)
         
         # Hareket kontrolü - sadece grid hücresindeyse
         if not self.current_level.is_on_grid_cell(player.pixel_position_x, player.pixel_position_y):
             return
         
-        is_moving = False
-        just_turning = False
         can_move, tunnel = self.current_level.can_move(player.pixel_position_x, player.pixel_position_y)
         look_to = pygame.Vector2(0, 0)
         
         # DEĞIŞIKLIK: newly_pressed yerine is_down kullanarak sürekli hareket imkanı
         if SimpleControls.is_left_down(player.player_number) and can_move.left:
             look_to.x = -1
-            is_moving = True
-            just_turning = player.move_direction.x != -1
-        
         elif SimpleControls.is_right_down(player.player_number) and can_move.right:
             look_to.x = 1
-            is_moving = True
-            just_turning = player.move_direction.x != 1
-        
         elif SimpleControls.is_down_down(player.player_number) and can_move.down:
             look_to.y = 1
-            is_moving = True
-            just_turning = player.move_direction.y != 1
-        
         elif SimpleControls.is_up_down(player.player_number) and can_move.up:
             look_to.y = -1
-            is_moving = True
-            just_turning = player.move_direction.y != -1
-        
-        # Tuşa basıldığında yön değiştir ve/veya hareket et
-        if is_moving:
-            # Önce yön değiştir
-            player.look_to(look_to)
-            
-            # Eğer sadece yön değişimi yapmıyorsak hareket et
-            if not just_turning:
-                player.move(delta_time)
-                player.animate(delta_time)
+        
+        self._player_step(player, look_to, delta_time)
+    
+    def process_ai_command(self, player, delta_time):
+        """AI komutunu (hareket niyeti + ateş) tuş katmanı olmadan doğrudan uygula"""
+        command = self.ai_controller.command_for(player.player_number)
+        self.ai_controller.record_effect(player.player_number)
+        
+        if self.ai_controller.take_fire(player.player_number) and not player.is_firing():
+            self._player_fire(player)
+        
+        if not self.current_level.is_on_grid_cell(player.pixel_position_x, player.pixel_position_y):
+            return
+        
+        can_move, tunnel = self.current_level.can_move(player.pixel_position_x, player.pixel_position_y)
+        look_to = pygame.Vector2(0, 0)
+        dx, dy = command.move
+        if (dx < 0 and can_move.left) or (dx > 0 and can_move.right):
+            look_to.x = dx
+        elif (dy > 0 and can_move.down) or (dy < 0 and can_move.up):
+            look_to.y = dy
+        
+        self._player_step(player, look_to, delta_time)
+    
+    def _wants_to_move(self, player):
+        if SimpleControls.get_player_type(player.player_number) == PlayerType.AI:
+            return self.ai_controller.command_for(player.player_number).move != (0, 0)
+        return SimpleControls.is_any_move_key_down(player.player_number)
+    
+    def _player_fire(self, player):
+        player.fire()
+        
+        # Ateş sesi player.fire() içinde AudioEvents'e gönderilir
+        CameraShake.shake(2, 50, 0.1)
+    
+    def _player_step(self, player, look_to, delta_time):
+        """Verilen yöne dön; zaten o yöne bakıyorsa bir adım ilerle"""
+        if look_to.x == 0 and look_to.y == 0:
+            return
+        
+        just_turning = (look_to.x != 0 and player.move_direction.x != look_to.x) or \
+                       (look_to.y != 0 and player.move_direction.y != look_to.y)
+        
+        # Önce yön değiştir
+        player.look_to(look_to)
+        
+        # Eğer sadece yön değişimi yapmıyorsak hareket et
+        if not just_turning:
+            player.move(delta_time)
+            player.animate(delta_time)
     
     def tunnel_teleport(self, character, tunnel):
         if tunnel != Level.NO_TUNNEL:
@@ -701,8 +765,7 @@ class WizardOfWor:
             player.current_scale
         ))
         
-        if self.player_death_sound:
-            self.player_death_sound.play()
+        AudioEvents.emit(SoundEvent.PLAYER_DEATH)
         
         CameraShake.shake(3, 50, 0.5)  # Yarım saniyelik sarsıntı
         
@@ -713,13 +776,6 @@ class WizardOfWor:
         # 1 saniye sonra kafese dön
         self.to_cage(player, 1.0)
 
-        # Ölüm sesini audio thread'de çal
-        if self.audio_manager:
-            self.audio_manager.play_sound(
-                "assets/sounds/death.wav",
-                volume=0.8,
-                priority=5  # Yüksek öncelik
-            )
     
     def kill_enemy(self, enemy):
         enemy.die()
@@ -731,8 +787,7 @@ class WizardOfWor:
             self.level_state = self.LEVEL_WIZARD_DEATH
             self.music_manager.stop_music()
             
-            if self.wizard_death_sound:
-                self.wizard_death_sound.play()
+            AudioEvents.emit(SoundEvent.WIZARD_DEATH)
             
             CameraShake.shake(4, 50, 2.0)  # 2 saniyelik sarsıntı
             self.level_state_timer = 0
@@ -754,7 +809,7 @@ class WizardOfWor:
                     print(f"Player {bullet.origin.player_number.value + 1} accidentally killed Player {player.player_number.value + 1}!")
                 
                 self.kill_player(player)
-                bullet.origin.kill_bullet()
+                bullet.kill()
                 return True
         
         return False
@@ -786,8 +841,7 @@ class WizardOfWor:
                 self.level_state = self.LEVEL_WORLUK_DEATH
                 self.music_manager.stop_music()
                 
-                if self.worluk_death_sound:
-                    self.worluk_death_sound.play()
+                AudioEvents.emit(SoundEvent.WORLUK_DEATH)
                 
                 CameraShake.shake(4, 50, 2.0)  # 2 saniyelik sarsıntı
                 self.level_state_timer = 0
@@ -808,8 +862,7 @@ class WizardOfWor:
     def worluk_escape(self):
         self.music_manager.stop_music()
         
-        if self.worluk_escape_sound:
-            self.worluk_escape_sound.play()
+        AudioEvents.emit(SoundEvent.WORLUK_ESCAPE)
         
         self.level_state_timer = 0
         self.level_state = self.LEVEL_WORLUK_ESCAPE
@@ -853,14 +906,8 @@ class WizardOfWor:
         self.final_score_p1 = self.player1.current_score if self.player1 else 0
         self.final_score_p2 = self.player2.current_score if self.player2 else 0
         
-        # 🔥 YENİ: Victory müziği çal (varsa)
-        try:
-            victory_sound = pygame.mixer.Sound("assets/sounds/victory.wav")
-            victory_sound.play()
-        except:
-            # Victory sesi yoksa normal intro sesini çal
-            if self.level_intro_sound:
-                self.level_intro_sound.play()
+        # Victory sesi
+        AudioEvents.emit(SoundEvent.VICTORY)
         
         # 🔥 YENİ: AI performans verilerini kaydet (eğer aktifse)
         if hasattr(self, 'tracking_enabled') and self.tracking_enabled:
@@ -879,8 +926,8 @@ class WizardOfWor:
         self.render_target.fill((0, 0, 0))
         
         # Font ayarları
-        font_title = pygame.font.SysFont("Consolas", 16, bold=True)
-        font = pygame.font.SysFont("Consolas", 12)
+        font_title = HudText.get_font(16, bold=True)
+        font = HudText.get_font(12)
 
         
         # 🏆 VICTORY başlığı
@@ -913,7 +960,6 @@ class WizardOfWor:
             self.render_target, 
             (self.SCREEN_WIDTH * self.screen_scale, self.SCREEN_HEIGHT * self.screen_scale))
         self.screen.blit(scaled_target, (0, 0))
-        pygame.display.flip()
     
     def end_game(self):
         """Oyunu sonlandır ve Game Over ekranını göster"""
@@ -930,9 +976,8 @@ class WizardOfWor:
         self.game_over = True
         self.game_over_timer = 5.0  # Game Over ekranını 5 saniye göster
         
-        # Game Over müziği veya sesi çal (opsiyonel)
-        if self.player_death_sound:
-            self.player_death_sound.play()
+        # Game Over sesi
+        AudioEvents.emit(SoundEvent.GAME_OVER)
         
         # Her iki oyuncunun skorunu kaydet
         self.final_score_p1 = self.player1.current_score if self.player1 else 0
@@ -944,8 +989,8 @@ class WizardOfWor:
         self.render_target.fill((0, 0, 0))
         
         # Font ayarları - Consolas daha net görünür ve anti-aliasing kapalı
-        font_title = pygame.font.SysFont("Consolas", 18, bold=True)
-        font = pygame.font.SysFont("Consolas", 14)
+        font_title = HudText.get_font(18, bold=True)
+        font = HudText.get_font(14)
         
         # Game Over yazısı
         title_text = font_title.render("GAME OVER", False, (255, 0, 0))
@@ -976,7 +1021,6 @@ class WizardOfWor:
             self.render_target, 
             (self.SCREEN_WIDTH * self.screen_scale, self.SCREEN_HEIGHT * self.screen_scale))
         self.screen.blit(scaled_target, (0, 0))
-        pygame.display.flip()
     
     def clear_level(self):
         self.current_level.reset(self.current_stage)
@@ -1126,9 +1170,8 @@ class WizardOfWor:
                     self.SCREEN_HEIGHT * self.screen_scale - 20 * self.screen_scale  # alt kenardan 25 piksel yukarıda
                 )
             
-            # Skor metni oluştur
-            font = pygame.font.SysFont("Consolas", 48)
-            score_text = font.render(str(score), False, (255, 255, 255))  # Beyaz renk
+            # Skor metni - rakam atlasından, sadece skor değişince yeniden birleştirilir
+            score_text = HudText.render_number(score, 48, (255, 255, 255))  # Beyaz renk
             text_rect = score_text.get_rect()
             
             # Skoru hizala
@@ -1143,8 +1186,7 @@ class WizardOfWor:
             surface.blit(score_text, text_rect)
             
             # Level bilgisini çiz - skor altına
-            level_font = pygame.font.SysFont("Consolas", 28)
-            level_text = level_font.render(f"LEVEL {self.current_stage + 1}", False, color)
+            level_text = HudText.render(f"LEVEL {self.current_stage + 1}", 28, color)
             level_rect = level_text.get_rect()
             
             # Level metnini hizala - skor metninin altında
@@ -1159,7 +1201,7 @@ class WizardOfWor:
             surface.blit(level_text, level_rect)
             
     
-    def extract_game_state_for_ai(self, player):
+    def extract_game_state_for_ai(self, player, enemy_prediction=None, danger_field=None, team_plan=None):
         """Yapay zeka için oyun durumunu hazırla"""
         if not player:
             return {}
@@ -1179,7 +1221,13 @@ class WizardOfWor:
             'is_cooperative': self.is_cooperative,  # İşbirliği/Rekabet mod bilgisi
             'enemies': [],
             'bullets': [],
-            'level': self.current_level
+            'level': self.current_level,
+            # enemies listesiyle aynı sırada
+            'enemy_prediction': enemy_prediction,
+            # Oyuncunun kendi mermisi hariç hücre başına çarpma süreleri
+            'danger_map': danger_field.for_player(player) if danger_field else None,
+            # Takım planlayıcısının bu oyuncuya verdiği görev (TeamIntent)
+            'team_intent': team_plan.get(player.player_number) if team_plan else None
         }
         
         # Diğer oyuncu bilgisini ekle (eğer varsa)
@@ -1193,7 +1241,8 @@ class WizardOfWor:
             enemy_data = {
                 'position': (enemy.pixel_position_x, enemy.pixel_position_y),
                 'direction': (enemy.move_direction.x, enemy.move_direction.y),
-                'visible': enemy.visible
+                'visible': enemy.visible,
+                'can_fire': getattr(enemy, 'can_fire', True)
             }
             game_state['enemies'].append(enemy_data)
         
@@ -1201,8 +1250,10 @@ class WizardOfWor:
         for bullet in self.bullets:
             bullet_data = {
                 'position': (bullet.pixel_position_x, bullet.pixel_position_y),
-                'velocity': (bullet._velocity.x, bullet._velocity.y),
-                'target_type': bullet.target_type.name
+                'velocity': (bullet.velocity.x, bullet.velocity.y),
+                'target_type': bullet.target_type.name,
+                # Ateş eden oyuncu (düşman mermisinde None)
+                'player_number': getattr(bullet.origin, 'player_number', None)
             }
             game_state['bullets'].append(bullet_data)
         
@@ -1210,12 +1261,41 @@ class WizardOfWor:
 
     def update_ai_game_state(self):
         """Yapay zeka için oyun durumunu güncelle"""
-        if SimpleControls.get_player_type(PlayerNumber.PLAYER1) == PlayerType.AI and self.player1:
-            game_state = self.extract_game_state_for_ai(self.player1)
+        p1_ai = SimpleControls.get_player_type(PlayerNumber.PLAYER1) == PlayerType.AI and self.player1
+        p2_ai = SimpleControls.get_player_type(PlayerNumber.PLAYER2) == PlayerType.AI and self.player2
+        if not (p1_ai or p2_ai):
+            return
+        
+        # Tahmin, tehlike haritası ve takım planı iki AI için ortak
+        prediction = None
+        if self.current_level and self.enemies:
+            try:
+                prediction = self.enemy_predictor.predict(self.enemies, self.current_level)
+            except Exception as e:
+                print(f"❌ Düşman tahmini hatası: {e}")
+        
+        danger_field = None
+        if self.current_level:
+            try:
+                danger_field = self.danger_mapper.build(self.bullets, self.current_level)
+            except Exception as e:
+                print(f"❌ Tehlike haritası hatası: {e}")
+        
+        # Takım planı: iki oyuncu için tek dünya modeli
+        team_plan = None
+        if self.is_cooperative and self.player1 and self.player2 and self.current_level:
+            try:
+                team_plan = self.team_planner.plan([self.player1, self.player2], self.enemies,
+                                                   self.current_level, prediction)
+            except Exception as e:
+                print(f"❌ Takım planı hatası: {e}")
+        
+        if p1_ai:
+            game_state = self.extract_game_state_for_ai(self.player1, prediction, danger_field, team_plan)
             self.ai_controller.update_game_state(PlayerNumber.PLAYER1, game_state)
         
-        if SimpleControls.get_player_type(PlayerNumber.PLAYER2) == PlayerType.AI and self.player2:
-            game_state = self.extract_game_state_for_ai(self.player2)
+        if p2_ai:
+            game_state = self.extract_game_state_for_ai(self.player2, prediction, danger_field, team_plan)
             self.ai_controller.update_game_state(PlayerNumber.PLAYER2, game_state)
 
     def draw_player_selection(self):
@@ -1224,9 +1304,9 @@ class WizardOfWor:
         self.render_target.fill((0, 0, 0))
         
         # Font ayarları
-        font_title = pygame.font.SysFont("Consolas", 14, bold=True)
-        font = pygame.font.SysFont("Consolas", 12)
-        button_font = pygame.font.SysFont("Consolas", 16, bold=True)
+        font_title = HudText.get_font(14, bold=True)
+        font = HudText.get_font(12)
+        button_font = HudText.get_font(16, bold=True)
         
         # Başlık 
         title_text = font_title.render("WIZARD OF WOR", False, (255, 255, 255))
@@ -1246,7 +1326,7 @@ class WizardOfWor:
         pygame.draw.rect(self.render_target, (255, 255, 255), exit_button_rect, 1)
         
         # X harfi - Daha küçük font
-        button_font = pygame.font.SysFont("Consolas", 8, bold=True) 
+        button_font = HudText.get_font(8, bold=True) 
         exit_text = button_font.render("X", False, (255, 255, 255))
         exit_text_rect = exit_text.get_rect(center=exit_button_rect.center)
         self.render_target.blit(exit_text, exit_text_rect)
@@ -1291,7 +1371,6 @@ class WizardOfWor:
             self.render_target, 
             (self.SCREEN_WIDTH * self.screen_scale, self.SCREEN_HEIGHT * self.screen_scale))
         self.screen.blit(scaled_target, (0, 0))
-        pygame.display.flip()
 
     
 
@@ -1368,6 +1447,11 @@ class WizardOfWor:
             self.selected_player_mode = 6
             self.start_game_with_mode(6)
         
+        # F4: AI1 vs MC (rollout AI)
+        elif SimpleControls.is_p2_ai_toggle_down():
+            self.selected_player_mode = 8
+            self.start_game_with_mode(8)
+        
         # ESC: Ana menüye dön
         elif SimpleControls.is_escape_down():
             self.ai_selection_mode = False
@@ -1402,9 +1486,9 @@ class WizardOfWor:
         self.render_target.fill((0, 0, 0))
         
         # Font ayarları
-        font_title = pygame.font.SysFont("Consolas", 14, bold=True)
-        font = pygame.font.SysFont("Consolas", 12)
-        button_font = pygame.font.SysFont("Consolas", 16, bold=True)
+        font_title = HudText.get_font(14, bold=True)
+        font = HudText.get_font(12)
+        button_font = HudText.get_font(16, bold=True)
         
         # Başlık 
         title_text = font_title.render("HUMAN & AI MODE", False, (255, 255, 255))
@@ -1424,7 +1508,7 @@ class WizardOfWor:
         pygame.draw.rect(self.render_target, (255, 255, 255), back_button_rect, 1)
         
         # <- işareti
-        button_font = pygame.font.SysFont("Consolas", 10, bold=True)
+        button_font = HudText.get_font(10, bold=True)
         back_text = button_font.render("<", False, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_button_rect.center)
         self.render_target.blit(back_text, back_text_rect)
@@ -1467,7 +1551,6 @@ class WizardOfWor:
             self.render_target, 
             (self.SCREEN_WIDTH * self.screen_scale, self.SCREEN_HEIGHT * self.screen_scale))
         self.screen.blit(scaled_target, (0, 0))
-        pygame.display.flip()
 
     def draw_ai_selection(self):
         """AI tipleri seçim ekranını çiz"""
@@ -1475,9 +1558,9 @@ class WizardOfWor:
         self.render_target.fill((0, 0, 0))
         
         # Font ayarları
-        font_title = pygame.font.SysFont("Consolas", 14, bold=True)
-        font = pygame.font.SysFont("Consolas", 12)
-        button_font = pygame.font.SysFont("Consolas", 16, bold=True)
+        font_title = HudText.get_font(14, bold=True)
+        font = HudText.get_font(12)
+        button_font = HudText.get_font(16, bold=True)
         
         # Başlık 
         title_text = font_title.render("AI & AI MODE", False, (255, 255, 255))
@@ -1497,7 +1580,7 @@ class WizardOfWor:
         pygame.draw.rect(self.render_target, (255, 255, 255), back_button_rect, 1)
         
         # <- işareti - Daha küçük font
-        button_font = pygame.font.SysFont("Consolas", 10, bold=True)  # Font boyutu 16'dan 10'a düşürüldü
+        button_font = HudText.get_font(10, bold=True)  # Font boyutu 16'dan 10'a düşürüldü
         back_text = button_font.render("<", False, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_button_rect.center)
         self.render_target.blit(back_text, back_text_rect)
@@ -1512,13 +1595,14 @@ class WizardOfWor:
         
         # Menü öğeleri
         option_color = (220, 176, 73)  # Sarımsı
-        y_pos = 40
-        y_spacing = 15
+        y_pos = 34
+        y_spacing = 13
         
         options = [
             "F1: AI1 & AI1",
             "F2: AI2 & AI2",
-            "F3: AI1 & AI2"
+            "F3: AI1 & AI2",
+            "F4: AI1 & MC"
         ]
         
         left_margin = 30
@@ -1541,7 +1625,6 @@ class WizardOfWor:
             self.render_target, 
             (self.SCREEN_WIDTH * self.screen_scale, self.SCREEN_HEIGHT * self.screen_scale))
         self.screen.blit(scaled_target, (0, 0))
-        pygame.display.flip()
     
     def start_game_with_mode(self, mode):
         """Belirli bir modda oyunu başlat"""
@@ -1607,6 +1690,13 @@ class WizardOfWor:
             self.start_game(multiplayer=True)
             self.ai_controller.start_ai_player(PlayerNumber.PLAYER2, ai_type="AI2")
         
+        elif mode == 8:  # AI1 vs MC
+            SimpleControls.set_player_type(PlayerNumber.PLAYER1, PlayerType.AI)
+            SimpleControls.set_player_type(PlayerNumber.PLAYER2, PlayerType.AI)
+            self.start_game(multiplayer=True)
+            self.ai_controller.start_ai_player(PlayerNumber.PLAYER1, ai_type="AI1")
+            self.ai_controller.start_ai_player(PlayerNumber.PLAYER2, ai_type="MC")
+        
         # Tüm menü modlarını kapat
         self.player_selection_mode = False
         self.ai_selection_mode = False
@@ -1616,6 +1706,43 @@ class WizardOfWor:
         self.players_can_damage_each_other = True  
 
     def update(self, delta_time):
+        """
+        Frame süresini biriktir ve oyunu sabit adımlarla ilerlet.
+        Frame hızı ne olursa olsun (headless hızlandırma, yük altında yavaşlama)
+        oyun aynı dt dizisini görür.
+        """
+        self.simulation_accumulator += delta_time
+        
+        steps = 0
+        # Kayan nokta hatası yüzünden tam adım kaçmasın
+        while self.simulation_accumulator >= self.fixed_delta_time - 1e-9:
+            if steps >= self.max_simulation_steps:
+                # Spiral of death önlemi - yetişilemeyen süre atılır
+                self.dropped_simulation_time += self.simulation_accumulator
+                self.simulation_accumulator = 0.0
+                break
+            
+            self.simulation_accumulator = max(0.0, self.simulation_accumulator - self.fixed_delta_time)
+            self._store_previous_positions()
+            self.simulate(self.fixed_delta_time)
+            steps += 1
+        
+        # Frame'in ses olayları tek parti olarak ses thread'ine
+        AudioEvents.flush()
+        
+        return steps
+    
+    def _store_previous_positions(self):
+        """Çizim interpolasyonu için adım öncesi konumlar"""
+        for character in (self.player1, self.player2):
+            if character:
+                character.store_previous_position()
+        for enemy in self.enemies:
+            enemy.store_previous_position()
+    
+    def simulate(self, delta_time):
+        """Tek sabit simülasyon adımı"""
+        self.game_time += delta_time
 
          # 🔥 YENİ: Victory ekranı kontrolü
         if self.show_victory_screen:
@@ -1752,7 +1879,6 @@ class WizardOfWor:
                     
                     # AI oyuncuları için oyun durumunu güncelle
                     self.update_ai_game_state()
-                    self.ai_controller.update_key_states
         
                     # Ölüm animasyonlarını güncelle
                     self.update_deaths(delta_time)
@@ -1774,9 +1900,8 @@ class WizardOfWor:
             self.speed_change_notification = f"DÜŞMANLAR HIZLANDI! x{self.current_speed_level:.1f}"
             self.speed_notification_timer = 2.0
             
-            # Ses efekti çal (varsa)
-            if self.level_intro_sound:
-                self.level_intro_sound.play()
+            # Ses efekti çal
+            AudioEvents.emit(SoundEvent.SPEED_UP)
             
             print(f"Düşman hızı artırıldı: x{self.current_speed_level}")
 
@@ -1845,13 +1970,14 @@ class WizardOfWor:
             if player.in_cage:
                 player.time_in_cage += delta_time
                 cage_time = ConfigManager.get_config(Constants.PLAYER_TIME_IN_CAGE, Constants.DEFAULT_PLAYER_TIME_IN_CAGE)
-                if (SimpleControls.is_any_move_key_down(player.player_number) and not self.level_starting) or player.time_in_cage >= cage_time:
+                if (self._wants_to_move(player) and not self.level_starting) or player.time_in_cage >= cage_time:
                     self.leave_cage(player)
             else:
                 if player.visible:
                     # Grid bazlı hareket için son hareket zamanını kontrol et
                     last_move_time = self.player1_last_move_time if player.player_number == PlayerNumber.PLAYER1 else self.player2_last_move_time
-                    current_time = pygame.time.get_ticks() / 1000.0
+                    # Duvar saati yerine oyun saati: hızlandırılmış/senkron koşularda da aynı sonuç
+                    current_time = self.game_time
                     
                     if current_time - last_move_time >= self.movement_cooldown:
                         self.process_player_input(player, delta_time)
@@ -1873,46 +1999,15 @@ class WizardOfWor:
             enemy.set_speed(new_speed)
             enemy.set_animation_speed(new_speed)
             
-            # 🔥 DÜZELTİLMİŞ: Tünel kontrolü
-            tunnel = Level.NO_TUNNEL  # Varsayılan değer
-            
-            if isinstance(enemy, Wizard):
-                # Wizard özel hareket kontrolü
-                enemy.can_change_direction = True
-                
-                if not enemy.is_valid_position(enemy.pixel_position_x, enemy.pixel_position_y):
-                    safe_position = enemy.get_valid_random_position()
-                    enemy.move_to(safe_position)
-                    enemy.look_to(enemy.get_valid_direction())
-                
-                new_move_direction = enemy.move_direction
-            else:
-                # 🔥 YENİ: Tuple return ile tunnel değerini al
-                new_move_direction, tunnel = self.current_level.pick_possible_direction_with_tunnel(enemy)
-                enemy.look_to(new_move_direction)
+            # Alt adımlar: hiçbir adım 1 pikseli geçmez, yön kararları her grid hücresinde verilir
+            substeps = enemy.substep_count(delta_time)
+            step_time = delta_time / substeps
+            for _ in range(substeps):
+                if not self._step_enemy(enemy, step_time):
+                    break
             
-            # 🔥 DÜZELTİLMİŞ: Tünel kontrolü - artık tunnel değeri doğru
-            if not isinstance(enemy, Wizard):
-                print(f"🔍 Enemy at ({enemy.pixel_position_x}, {enemy.pixel_position_y}), direction: {new_move_direction}, tunnel: {tunnel}")
-                
-                if (new_move_direction.x > 0 and tunnel == Level.TUNNEL_RIGHT) or \
-                   (new_move_direction.x < 0 and tunnel == Level.TUNNEL_LEFT):
-                    
-                    print(f"🕳️ {enemy.__class__.__name__} tüneli kullanıyor! Tunnel: {tunnel}")
-                    
-                    if isinstance(enemy, Worluk):
-                        print("🏃 Worluk kaçıyor!")
-                        enemy.die()
-                        self.enemies.remove(enemy)
-                        self.worluk_escape()
-                    else:
-                        print(f"↔️ {enemy.__class__.__name__} teleport ediliyor!")
-                        self.tunnel_teleport(enemy, tunnel)
-                else:
-                    enemy.move(delta_time)
-            else:
-                # Wizard için özel hareket
-                enemy.move(delta_time)
+            if enemy not in self.enemies:
+                continue
             
             enemy.animate(delta_time)
             
@@ -1929,6 +2024,49 @@ class WizardOfWor:
     
     
     
+    def _step_enemy(self, enemy, delta_time):
+        """Tek hareket alt adımı: yön seçimi, tünel ve hareket. Hareket sürmeyecekse False"""
+        # 🔥 DÜZELTİLMİŞ: Tünel kontrolü
+        tunnel = Level.NO_TUNNEL  # Varsayılan değer
+        
+        if isinstance(enemy, Wizard):
+            # Wizard özel hareket kontrolü
+            enemy.can_change_direction = True
+            
+            if not enemy.is_valid_position(enemy.pixel_position_x, enemy.pixel_position_y):
+                safe_position = enemy.get_valid_random_position()
+                enemy.move_to(safe_position)
+                enemy.look_to(enemy.get_valid_direction())
+            
+            new_move_direction = enemy.move_direction
+        else:
+            # 🔥 YENİ: Tuple return ile tunnel değerini al
+            new_move_direction, tunnel = self.current_level.pick_possible_direction_with_tunnel(enemy)
+            enemy.look_to(new_move_direction)
+        
+        # 🔥 DÜZELTİLMİŞ: Tünel kontrolü - artık tunnel değeri doğru
+        if not isinstance(enemy, Wizard):
+            if (new_move_direction.x > 0 and tunnel == Level.TUNNEL_RIGHT) or \
+               (new_move_direction.x < 0 and tunnel == Level.TUNNEL_LEFT):
+                
+                print(f"🕳️ {enemy.__class__.__name__} tüneli kullanıyor! Tunnel: {tunnel}")
+                
+                if isinstance(enemy, Worluk):
+                    print("🏃 Worluk kaçıyor!")
+                    enemy.die()
+                    self.enemies.remove(enemy)
+                    self.worluk_escape()
+                else:
+                    print(f"↔️ {enemy.__class__.__name__} teleport ediliyor!")
+                    self.tunnel_teleport(enemy, tunnel)
+                return False
+            
+            enemy.move(delta_time)
+        else:
+            # Wizard için özel hareket
+            enemy.move(delta_time)
+        return True
+    
     def update_deaths(self, delta_time):
         for death in self.deaths[:]:
             death.update(delta_time)
@@ -2028,61 +2166,45 @@ class WizardOfWor:
         if self.player2 and self.player2.is_firing():
             self.bullets.append(self.player2.bullet)
         
-        # Düşman mermisini ekle
-        if Enemy.is_any_enemy_firing():
-            self.bullets.append(Enemy._common_bullet)
-        
-        # 🔥 DEBUG: Bullet durumu
-        if len(self.bullets) > 0:
-            print(f"🔫 BULLETS: {len(self.bullets)} active bullets detected")
+        # Düşman mermileri havuzda toplu güncellenir
+        enemy_bullets = Enemy.bullet_manager
         
         # Eğer mermi yoksa hiçbir şey yapma
-        if not self.bullets:
+        if not self.bullets and enemy_bullets.active_count == 0:
             return
         
         # Thread kullanımı durumu kontrolü
         use_threaded_physics = (
             self.thread_communication_enabled and 
             self.thread_manager and 
-            len(self.bullets) > 0
+            len(self.bullets) + enemy_bullets.active_count > 0
         )
         
-        # 🔥 DEBUG: Thread kullanım kararı
-        print(f"🔧 THREAD DECISION:")
-        print(f"  thread_communication_enabled: {self.thread_communication_enabled}")
-        print(f"  thread_manager exists: {self.thread_manager is not None}")
-        print(f"  bullets count: {len(self.bullets)}")
-        print(f"  USE THREADED PHYSICS: {use_threaded_physics}")
-        
         if use_threaded_physics:
-            print("🚀 USING THREADED PHYSICS PATH")  # Bu mesajı görmeli!
-            
             # 1. Mermileri güncelle (pozisyon)
             for bullet in self.bullets[:]:
-                bullet.update(delta_time)
+                bullet.update(delta_time, self.current_level)
                 
                 # Sadece temel sınır kontrolü main thread'de
                 if not self.current_level.is_inside_walls(bullet.pixel_position_x, bullet.pixel_position_y):
-                    bullet.origin.kill_bullet()
+                    bullet.kill()
                     print("💥 Bullet hit wall (main thread)")
                     continue
             
+            # Düşman mermileri: tek geçişte ilerlet, duvara çarpanları havuza geri ver
+            enemy_bullets.update(delta_time, self.current_level)
+            self.bullets.extend(enemy_bullets.bullets())
+            
             # 2. Physics thread'e çarpışma hesaplaması gönder
             if self.bullets:
-                print("📤 Sending physics data to thread...")  # Bu mesajı görmeli!
                 self._send_physics_data()
             
             # 3. Physics thread sonuçlarını al ve uygula
-            print("📥 Checking for physics results...")
             with self.thread_manager.physics_lock:
                 if self.thread_manager.physics_results:
-                    print("🎯 Applying physics results from thread...")
                     self._apply_physics_results(self.thread_manager.physics_results)
                     self.thread_manager.physics_results = None
-                else:
-                    print("⏳ No physics results ready yet")
         else:
-            print("🔄 USING CLASSIC PHYSICS PATH (fallback)")
             # Fallback: Klasik yöntem
             self._update_bullets_classic(delta_time)
     
@@ -2137,6 +2259,12 @@ class WizardOfWor:
             
 
             if self.game_started:
+                # Karakterler son iki sabit adım arasında interpole edilerek çizilir
+                if self.render_interpolation:
+                    Character.render_alpha = self.simulation_accumulator / self.fixed_delta_time
+                else:
+                    Character.render_alpha = 1.0
+                
                 # Oyuncuları çiz
                 if self.player1 and self.player1.is_alive:
                     self.player1.draw(self.render_target, self.DISPLAY_OFFSET_X, self.DISPLAY_OFFSET_Y)
@@ -2181,8 +2309,9 @@ class WizardOfWor:
         # Skorları göster
         self.draw_score(self.screen, self.player1, 280)
         self.draw_score(self.screen, self.player2, 89)
-        
-        # Ekranı güncelle
+    
+    def present(self):
+        """Çizilen frame'i ekrana ver (vsync açıksa burada beklenir)"""
         pygame.display.flip()
     
     def _check_thread_health(self):
@@ -2190,12 +2319,17 @@ class WizardOfWor:
         if not self.thread_manager:
             return True
         
+        if self.actor_system:
+            return self.actor_system.is_healthy()
+        
         try:
-            # Thread'lerin yaşayıp yaşamadığını kontrol et
-            threads_status = {
-                'physics': self.thread_manager.physics_thread.is_alive() if self.thread_manager.physics_thread else False,
-                'audio': self.thread_manager.audio_thread.is_alive() if self.thread_manager.audio_thread else False
-            }
+            # Başlatılmış thread'lerin yaşayıp yaşamadığını kontrol et (thread'siz modda atlanır)
+            threads_status = {}
+            if self.thread_manager.physics_thread:
+                threads_status['physics'] = self.thread_manager.physics_thread.is_alive()
+            audio_thread = getattr(self.thread_manager.audio_manager, 'audio_thread', None)
+            if audio_thread:
+                threads_status['audio'] = audio_thread.is_alive()
             
             # Ölü thread varsa uyar
             dead_threads = [name for name, alive in threads_status.items() if not alive]
@@ -2242,23 +2376,37 @@ class WizardOfWor:
         
     def _process_thread_communications(self, delta_time):
         """Thread'lerden gelen verileri işle"""
+        if not self.thread_manager:
+            return
+        
+        self._apply_pending_physics()
+    
+    def _apply_pending_physics(self):
+        """Fizik thread'i / aktöründen gelmiş çarpışma sonuçlarını uygula"""
         try:
-            if not self.thread_manager:
-                return
+            # Aktörlerden gelen ACTION / COLLISION_RESULT mesajları
+            if self.actor_system:
+                self.actor_system.pump()
             
-            # Physics thread sonuçlarını işle
             with self.thread_manager.physics_lock:
                 if self.thread_manager.physics_results:
                     self._apply_physics_results(self.thread_manager.physics_results)
                     # İşlendikten sonra temizle
                     self.thread_manager.physics_results = None
+        
+        except Exception as e:
+            print(f"❌ Physics sonuç işleme hatası: {e}")
+    
+    def _sync_ai_actions(self):
+        """AI thread'leri / aktörlerinden gelen kararları frame komutlarına dönüştür"""
+        try:
+            if self.actor_system:
+                self.actor_system.pump()
             
-            # AI thread'lerden gelen action'ları işle (mevcut kod)
-            if hasattr(self, 'ai_controller'):
-                self.ai_controller.update_key_states()
+            self.ai_controller.poll_commands()
         
         except Exception as e:
-            print(f"❌ Thread iletişim hatası: {e}")
+            print(f"❌ AI eylem senkron hatası: {e}")
     
     def _send_data_to_threads(self):
         """Thread'lere veri gönder"""
@@ -2266,17 +2414,10 @@ class WizardOfWor:
             if not self.thread_manager:
                 return
             
-            # Render verilerini gönder
-            if self.game_started and hasattr(self.thread_manager, 'render_queue'):
-                self._send_render_data()
-            
-            # Physics verilerini gönder
-            if self.game_started and self.bullets and hasattr(self.thread_manager, 'physics_queue'):
-                self._send_physics_data()
+            # Physics işleri update_bullets içinde, her simülasyon adımında gönderilir
             
-            # Audio komutlarını gönder
-            if hasattr(self.thread_manager, 'audio_queue'):
-                self._send_audio_commands()
+            # Audio komutlarını gönder - frame başına tek parti
+            self._send_audio_commands()
         
         except Exception as e:
             print(f"❌ Thread veri gönderme hatası: {e}")
@@ -2297,12 +2438,13 @@ class WizardOfWor:
                 'timestamp': time.time()
             }
             
-            # 🔥 DEBUG: Physics gönderimi logla
-            print(f"🚀 PHYSICS: Sending {len(physics_data['bullets'])} bullets, {len(physics_data['enemies'])} enemies")
+            if self.actor_system:
+                # Eski iş hâlâ bekliyorsa fizik aktörünün gelen kutusunda yenisiyle değişir
+                self.actor_system.submit_physics(physics_data)
+                return
             
             try:
                 self.thread_manager.physics_queue.put(physics_data, block=False)
-                print(f"✅ PHYSICS: Data sent to thread")
             except:
                 print(f"⚠️ PHYSICS: Queue full, trying to clear...")
                 try:
@@ -2318,9 +2460,8 @@ class WizardOfWor:
     
     
     def _send_audio_commands(self):
-        """Audio komutlarını thread'e gönder (isteğe bağlı)"""
-        # Bu method gelecekte ses komutları için kullanılabilir
-        pass
+        """Bu frame'de biriken ses olaylarını tek parti halinde audio thread'e gönder"""
+        AudioEvents.flush()
 
 
     def _apply_physics_results(self, physics_results):
@@ -2342,10 +2483,14 @@ class WizardOfWor:
         try:
             collision_type = collision['type']
             
+            # Bu arada yok edilmiş mermilere ait sonuçları atla
+            if not collision['bullet'].is_alive:
+                return
+            
             if collision_type == 'bullet_wall':
                 bullet = collision['bullet']
                 if bullet and bullet.origin:
-                    bullet.origin.kill_bullet()
+                    bullet.kill()
                     
             elif collision_type == 'bullet_player':
                 bullet = collision['bullet']
@@ -2358,7 +2503,7 @@ class WizardOfWor:
                         bullet.origin.increase_score(1000)
                     
                     self.kill_player(player)
-                    bullet.origin.kill_bullet()
+                    bullet.kill()
                     
             elif collision_type == 'bullet_enemy':
                 bullet = collision['bullet']
@@ -2370,7 +2515,7 @@ class WizardOfWor:
                     bullet.origin.increase_score(score)
                 
                 self.kill_enemy(enemy)
-                bullet.origin.kill_bullet()
+                bullet.kill()
                 
                 # Ölüm animasyonu ekle
                 self.deaths.append(Death(
@@ -2392,12 +2537,12 @@ class WizardOfWor:
         """Klasik yöntemle mermi güncelleme (fallback - thread yok)"""
         # Mevcut update_bullets kodlarını buraya koy
         for bullet in self.bullets[:]:
-            bullet.update(delta_time)
+            bullet.update(delta_time, self.current_level)
             
             # Duvar çarpışma kontrolü
             if (not self.current_level.is_inside_walls(bullet.pixel_position_x, bullet.pixel_position_y) or
                 self.current_level.has_pixel(bullet.pixel_position_x, bullet.pixel_position_y)):
-                bullet.origin.kill_bullet()
+                bullet.kill()
                 continue
             
             # Düşman çarpışma kontrolü
@@ -2406,7 +2551,7 @@ class WizardOfWor:
                     if bullet.test_hit(enemy):
                         if isinstance(bullet.origin, Player):
                             bullet.origin.increase_score(enemy.score_points * self.score_modifier)
-                            bullet.origin.kill_bullet()
+                            bullet.kill()
                         
                         self.kill_enemy(enemy)
                         
@@ -2431,16 +2576,22 @@ class WizardOfWor:
                 if self.test_bullet_kills_player(bullet, self.player2):
                     continue
             
-            # Düşman mermileri (3+ seviyede)
-            if isinstance(bullet.origin, Enemy):
-                self.test_bullet_kills_player(bullet, self.player1)
-                self.test_bullet_kills_player(bullet, self.player2)
+        
+        # Düşman mermileri (3+ seviyede): havuzda toplu güncelleme ve hücre tabanlı çarpışma
+        enemy_bullets = Enemy.bullet_manager
+        enemy_bullets.update(delta_time, self.current_level)
+        for bullet, player in enemy_bullets.collide([self.player1, self.player2]):
+            self.test_bullet_kills_player(bullet, player)
+        self.bullets.extend(enemy_bullets.bullets())
 
     def _update_performance_monitoring(self, current_time, delta_time):
         """Performance monitoring güncelle"""
         self.frame_count += 1
         self.performance_timer += delta_time
         
+        if self.actor_system:
+            self.actor_system.record('frame', delta_time * 1000.0)
+        
         # 5 saniyede bir kontrol et
         if current_time - self.last_performance_check > 5000:
             avg_fps = self.frame_count / self.performance_timer if self.performance_timer > 0 else 0
@@ -2482,12 +2633,18 @@ class WizardOfWor:
         except:
             print("💻 System info not available")
         
+        # Döngü fazları
+        if self.main_loop:
+            print(f"\n⏱️ Loop Phases ({self.main_loop.pacing.value}, {self.main_loop.current_state().name}):")
+            for name, stats in self.main_loop.get_phase_stats().items():
+                print(f"  {name:14}: avg {stats['avg_ms']:6.2f} ms, max {stats['max_ms']:6.2f} ms")
+        
         # Thread durumları
         if self.thread_manager:
             print(f"\n📊 GameThread Status:")
             threads = {
                 'Physics': self.thread_manager.physics_thread,
-                'Audio': self.thread_manager.audio_thread
+                'Audio': getattr(self.thread_manager.audio_manager, 'audio_thread', None)
             }
             
             for name, thread in threads.items():
@@ -2518,12 +2675,96 @@ class WizardOfWor:
             }
             
             for name, ai_thread in ai_threads.items():
-                if ai_thread:
+                if ai_thread and not ai_thread.threaded:
+                    print(f"  {name}: 🔁 SYNC")
+                elif ai_thread:
                     status = "✅ ALIVE" if ai_thread.is_alive() else "💀 DEAD"
                     print(f"  {name}: {status}")
                 else:
                     print(f"  {name}: ❌ NOT_ACTIVE")
             
+            # AI karar gecikmeleri
+            print(f"\n⏱️ AI Decision Latency (budget {self.ai_controller.decision_budget_ms:.1f} ms):")
+            for player_number in (PlayerNumber.PLAYER1, PlayerNumber.PLAYER2):
+                stats = self.ai_controller.get_decision_stats(player_number)
+                if stats['decisions'] == 0:
+                    continue
+                print(f"  P{player_number.value + 1}: {stats['decisions']} decisions, "
+                      f"avg {stats['avg_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, "
+                      f"max {stats['max_ms']:.2f} ms, overruns {stats['overruns']}")
+
+            # Karar motoru terimleri
+            for player_number in (PlayerNumber.PLAYER1, PlayerNumber.PLAYER2):
+                terms = self.ai_controller.get_utility_stats(player_number)
+                if not terms or terms['features']['count'] == 0:
+                    continue
+                print(f"  P{player_number.value + 1} utility: " + ", ".join(
+                    f"{name} {stats['avg_ms']:.3f}/{stats['max_ms']:.3f} ms" for name, stats in terms.items()))
+
+            # Rollout AI (MC): karar başına rollout ve bütçe
+            for player_number in (PlayerNumber.PLAYER1, PlayerNumber.PLAYER2):
+                rollout = self.ai_controller.get_rollout_stats(player_number)
+                if not rollout or rollout['decisions'] == 0:
+                    continue
+                print(f"  P{player_number.value + 1} rollouts: {rollout['decisions']} decisions, "
+                      f"{rollout['rollouts_per_decision']:.0f} rollouts/decision, depth {rollout['avg_depth']:.1f}, "
+                      f"avg {rollout['avg_ms']:.2f} ms, p95 {rollout['p95_ms']:.2f} ms, max {rollout['max_ms']:.2f} ms, "
+                      f"over {rollout['budget_ms']:.1f} ms budget: {rollout['overruns']}")
+            
+            # Artımlı yol planlayıcı (D* Lite)
+            for player_number in (PlayerNumber.PLAYER1, PlayerNumber.PLAYER2):
+                path_stats = self.ai_controller.get_path_stats(player_number)
+                if not path_stats or path_stats['queries'] == 0:
+                    continue
+                print(f"  P{player_number.value + 1} paths: {path_stats['queries']} queries, "
+                      f"{path_stats['avg_expansions']:.1f} expansions/query, {path_stats['resets']} full searches")
+            
+            # Takım planlayıcısı
+            team_stats = self.team_planner.get_stats()
+            if team_stats['plans']:
+                print(f"  Team plan: {team_stats['plans']} plans, avg {team_stats['avg_ms']:.3f} ms, "
+                      f"max {team_stats['max_ms']:.3f} ms")
+
+            # Karar -> etki gecikmesi (komutun oyuncuya uygulandığı frame)
+            for player_number in (PlayerNumber.PLAYER1, PlayerNumber.PLAYER2):
+                stats = self.ai_controller.get_effect_stats(player_number)
+                if stats['count'] == 0:
+                    continue
+                print(f"  P{player_number.value + 1} action->effect: {stats['count']} commands, "
+                      f"avg {stats['avg_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, max {stats['max_ms']:.2f} ms")
+
+            # Ses motoru
+            if self.audio_manager:
+                audio_stats = self.audio_manager.stats
+                print(f"\n🔊 Audio: {len(self.audio_manager.sound_bank)} sounds, {audio_stats['played']} played, "
+                      f"{audio_stats['coalesced']} coalesced, {audio_stats['stolen']} stolen, "
+                      f"{audio_stats['voice_dropped'] + audio_stats['queue_dropped']} dropped")
+                sequencer = self.audio_manager.sequencer
+                print(f"🎵 Sequencer: {'on' if sequencer.active else 'off'} @ {sequencer.tempo_bpm:.0f} BPM, "
+                      f"{sequencer.stats['beats']} beats, {sequencer.stats['tempo_changes']} tempo changes, "
+                      f"{sequencer.stats['underruns']} underruns")
+            
+            # Aktör sistemi
+            if self.actor_system:
+                actor_stats = self.actor_system.get_stats()
+                print(f"\n🎭 Actors: {actor_stats['routed_messages']} routed, {actor_stats['dropped_messages']} unroutable, "
+                      f"{actor_stats['restarts']} restarts, abandoned {actor_stats['abandoned'] or '-'}")
+                for actor_id, stats in actor_stats['actors'].items():
+                    print(f"  {actor_id}: {stats['processed']} msgs, {stats['pending']} pending, {stats['dropped']} dropped, "
+                          f"latency avg {stats['avg_latency_ms']:.2f} ms / max {stats['max_latency_ms']:.2f} ms")
+                for kind, metric in actor_stats['telemetry'].items():
+                    print(f"  📈 {kind}: {metric['count']} samples, avg {metric['avg_ms']:.2f} ms, max {metric['max_ms']:.2f} ms")
+            
+            event_stats = AudioEvents.get_stats()
+            print(f"🔈 Audio Events: {event_stats['events']} events, {event_stats['flushes']} batches, "
+                  f"max batch {event_stats['max_batch']}, queue depth {event_stats.get('queue_depth', 0)} "
+                  f"(max {event_stats.get('max_queue_depth', 0)})")
+            
+            # HUD metin önbelleği
+            hud_stats = HudText.get_stats()
+            print(f"\n🔤 HUD Text: {hud_stats['fonts']} fonts, {hud_stats['cached_surfaces']} cached, "
+                  f"{hud_stats['renders']} renders, {hud_stats['hits']} hits")
+            
             # AI Queue durumları
             print(f"\n🎮 AI Queue Status:")
             ai_queues = {
@@ -2554,6 +2795,12 @@ class WizardOfWor:
                 self.thread_manager.stop_threads()
                 print("  ✅ GameThreadManager thread'leri kapatıldı")
             
+            # Aktörleri kapat - ses çalma bitince ses yöneticisi durdurulur
+            if self.actor_system:
+                AudioEvents.set_batch_sink(None)
+                self.actor_system.shutdown()
+                print("  ✅ Aktör sistemi kapatıldı")
+            
             # Message Bus kapat (varsa)
             if self.message_bus:
                 self.message_bus.shutdown_all()
@@ -2567,13 +2814,12 @@ class WizardOfWor:
 
             ############
     
-    def run(self):
-        """Ana oyun döngüsü - Thread entegrasyonu ile"""
-        
+    def prepare_run(self):
+        """Döngü öncesi hazırlık - run() ve AsyncGameLoop ortak kullanır"""
         self.load_assets()
         
-         # MainGameLoop'u başlat
-        self.main_loop = MainGameLoop(self)
+        # Tek yetkili döngü - run() ve eğitim ortamı frame'leri bununla çalıştırır
+        self.main_loop = MainGameLoop(self, self.pacing)
         
         pygame.key.set_repeat(0)
         
@@ -2590,73 +2836,48 @@ class WizardOfWor:
         self.frame_count = 0
         self.performance_timer = 0.0
         self.last_performance_check = pygame.time.get_ticks()
+    
+    def process_events(self):
+        """
+        Pygame olaylarını işle
         
+        Returns:
+            bool: Oyun kapatılmak isteniyorsa False
+        """
         running = True
         
-        try:
-            print("🎮 Oyun döngüsü başlatıldı")
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:
+                    self.handle_mouse_event(event.pos, event.button)
             
-            while running:
-                # Delta time hesapla
-                current_time = pygame.time.get_ticks()
-                delta_time = (current_time - self.last_time) / 1000.0
-                self.last_time = current_time
-                
-                # 🔥 YENİ: Thread durumunu kontrol et
-                if self.thread_communication_enabled:
-                    if not self._check_thread_health():
-                        print("⚠️ Thread sağlık kontrolü başarısız!")
-                        # Critical thread failure - işaretlenebilir
-                
-                # Olayları işle
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-
-                    elif event.type == pygame.KEYUP:
-                        if event.key in SimpleControls._key_down_processed:
-                            SimpleControls._key_down_processed[event.key] = False
-
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        if event.button == 1:
-                            self.handle_mouse_event(event.pos, event.button)
-                    
-                    # 🔥 YENİ: Debug tuşları
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_F10:
-                            self.debug_thread_performance()
-                        elif event.key == pygame.K_F11:
-                            self.toggle_performance_logging()
-                        
-                        # Game Over ekranından çıkış
-                        if self.game_over:
-                            self.game_over = False
-                            self.player_selection_mode = True
-                            self.player_selection_timer = 0
-                
-                # Kontrolleri güncelle
-                SimpleControls.get_states()
-                
-                # 🔥 YENİ: Thread verilerini işle
-                if self.thread_communication_enabled:
-                    self._process_thread_communications(delta_time)
-                
-                # Oyun güncelleme
-                self.update(delta_time)
-                
-                # 🔥 YENİ: Thread'lere veri gönder
-                if self.thread_communication_enabled:
-                    self._send_data_to_threads()
-                
-                # Çizim işlemleri
-                self.draw()
-                
-                # 🔥 YENİ: Performance monitoring
-                self._update_performance_monitoring(current_time, delta_time)
-                
-                # FPS sınırlaması
-                self.clock.tick(60)
+            # 🔥 YENİ: Debug tuşları
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F10:
+                    self.debug_thread_performance()
+                elif event.key == pygame.K_F11:
+                    self.toggle_performance_logging()
                 
+                # Game Over ekranından çıkış
+                if self.game_over:
+                    self.game_over = False
+                    self.player_selection_mode = True
+                    self.player_selection_timer = 0
+        
+        return running
+
+    def run(self):
+        """Ana oyun döngüsü - fazlar ve frame hızı MainGameLoop'ta"""
+        
+        self.prepare_run()
+        
+        try:
+            print("🎮 Oyun döngüsü başlatıldı")
+            self.main_loop.run()
+        
         except KeyboardInterrupt:
             print("🛑 Kullanıcı tarafından durduruldu")
         except Exception as e:
@@ -2676,7 +2897,12 @@ if __name__ == "__main__":
     
     try:
         game = WizardOfWor()
-        game.run()
+        if "--async" in sys.argv:
+            # asyncio tabanlı tek döngü (AI/ses/fizik thread'siz)
+            from src.async_game_loop import AsyncGameLoop
+            AsyncGameLoop.from_argv(game, sys.argv).run()
+        else:
+            game.run()
     except Exception as e:
         print(f"❌ Kritik hata: {e}")
         import traceback
@@ -0,0 +1,83 @@
+# src/ai_command.py
+import threading
+import time
+from typing import NamedTuple
+from src.ai_player import AIAction
+
+# Hareket eylemi -> (dx, dy) niyeti
+MOVE_INTENTS = {
+    AIAction.MOVE_UP: (0, -1),
+    AIAction.MOVE_DOWN: (0, 1),
+    AIAction.MOVE_LEFT: (-1, 0),
+    AIAction.MOVE_RIGHT: (1, 0)
+}
+
+class AICommand(NamedTuple):
+    """Bir frame'de AI oyuncusuna uygulanacak komut"""
+    move: tuple         # (dx, dy) hareket niyeti, (0, 0) = dur
+    fire: bool
+    issued_at: float    # Bu frame'e kadar bekleyen en eski kararın zamanı (perf_counter)
+    fresh: bool         # Bu frame yeni karar geldi mi
+
+IDLE_COMMAND = AICommand((0, 0), False, 0.0, False)
+
+class CommandChannel:
+    """
+    Tek oyuncunun AI komut kanalı.
+    Üreticiler (AI thread'i, aktör, ortam) put() ile zaman damgalı karar bırakır;
+    ana döngü frame başına poll() ile kararları tek komuta indirger. Hareket en
+    son karardan gelir, aradaki ateş kararları kaybolmaz.
+    """
+    # Yeni karar gelmezse hareket niyeti bu kadar frame geçerli kalır
+    INTENT_HOLD_FRAMES = 6
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = []
+        self._command = IDLE_COMMAND
+        self._idle_frames = 0
+
+    def put(self, action, issued_at=None):
+        """Kararı kanala bırak (thread güvenli)"""
+        if issued_at is None:
+            issued_at = time.perf_counter()
+        with self._lock:
+            self._pending.append((action, issued_at))
+
+    def poll(self):
+        """
+        Bekleyen kararları bu frame'in komutuna dönüştür
+
+        Returns:
+            AICommand: Frame komutu
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+
+        if not pending:
+            self._idle_frames += 1
+            move = self._command.move if self._idle_frames <= self.INTENT_HOLD_FRAMES else (0, 0)
+            self._command = AICommand(move, False, self._command.issued_at, False)
+            return self._command
+
+        fire = False
+        for action, _ in pending:
+            if action == AIAction.SHOOT:
+                fire = True
+
+        # Son karar hareket değilse (ateş/bekle) oyuncu durur
+        move = MOVE_INTENTS.get(pending[-1][0], (0, 0))
+
+        self._idle_frames = 0
+        self._command = AICommand(move, fire, pending[0][1], True)
+        return self._command
+
+    def clear(self):
+        with self._lock:
+            self._pending = []
+        self._command = IDLE_COMMAND
+        self._idle_frames = 0
+
+    def qsize(self):
+        return len(self._pending)
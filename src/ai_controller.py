@@ -1,63 +1,102 @@
 # src/ai_controller.py
-import pygame
+import time
+from collections import deque
 from queue import Queue
 from src.simple_controls import PlayerNumber
-from src.ai_player import AIPlayer1, AIPlayer2, AIAction
+from src.ai_player import AIPlayer1, AIPlayer2
+from src.rollout_ai import AIPlayerRollout
+from src.ai_command import CommandChannel, IDLE_COMMAND
 
 class AIController:
     """
-    Yapay zeka oyuncusunu yöneten ve kontrol tuşlarını simüle eden sınıf.
+    Yapay zeka oyuncusunu yöneten ve kararlarını oyuncu komutlarına dönüştüren sınıf.
     Oyun ana döngüsü ile yapay zeka arasındaki arayüz görevi görür.
     """
     
-    def __init__(self):
-        """Yapay zeka kontrolcüsünü başlat"""
+    # Son kaç kararın gecikmesi saklanır (yüzdelik hesabı için)
+    LATENCY_HISTORY = 240
+    
+    def __init__(self, sync_mode=False, decision_budget_ms=2.0, seed=None):
+        """
+        Yapay zeka kontrolcüsünü başlat
+        
+        Args:
+            sync_mode: True ise AI'lar thread başlatmaz, her frame içinde senkron karar verir
+            decision_budget_ms: Karar başına süre bütçesi (aşımlar sayılır)
+            seed: AI rastgelelik tohumu (None = rastgele)
+        """
         # AI oyuncular için kuyruklar
         self.p1_game_state_queue = Queue()
-        self.p1_action_queue = Queue()
+        self.p1_action_queue = CommandChannel()
         self.p2_game_state_queue = Queue()
-        self.p2_action_queue = Queue()
+        self.p2_action_queue = CommandChannel()
         
         # AI oyuncu thread'leri
         self.ai_player1 = None
         self.ai_player2 = None
         
-        # Simüle edilmiş tuş durumları
-        self.key_states = {
-            # Player 1 tuşları
-            pygame.K_LEFT: False,
-            pygame.K_RIGHT: False,
-            pygame.K_UP: False,
-            pygame.K_DOWN: False,
-            pygame.K_SPACE: False,
-            
-            # Player 2 tuşları
-            pygame.K_a: False,
-            pygame.K_d: False,
-            pygame.K_w: False,
-            pygame.K_s: False,
-            pygame.K_f: False,
+        # False ise AI'lar thread başlatmaz, tick_ai_players() ile adımlanır
+        self.sync_mode = sync_mode
+        self.threaded = not sync_mode
+        self.decision_budget_ms = decision_budget_ms
+        self.seed = seed
+        
+        # Eylemleri dışarıdan (ör. eğitim ortamı) gönderilen oyuncular
+        self.external_players = set()
+        
+        # Verilirse AI'lar GameActorSystem'de aktör olarak çalışır
+        self.actor_system = None
+        
+        # Karar gecikmesi istatistikleri
+        self.decision_stats = {
+            PlayerNumber.PLAYER1: self._new_decision_stats(),
+            PlayerNumber.PLAYER2: self._new_decision_stats()
+        }
+        
+        # Oyuncu başına bu frame'in komutu - process_player_input doğrudan okur
+        self.commands = [IDLE_COMMAND, IDLE_COMMAND]
+        # Komutun etkisi henüz ölçülmedi mi
+        self._effect_pending = [False, False]
+        # Oyuncu girdisi işlenene kadar ateş kararı saklanır
+        self._fire_pending = [False, False]
+        
+        # Karardan etkiye (oyuncuya uygulanma) gecikme istatistikleri
+        self.effect_stats = {
+            PlayerNumber.PLAYER1: self._new_effect_stats(),
+            PlayerNumber.PLAYER2: self._new_effect_stats()
         }
     
    
     # src/ai_controller.py
-    def start_ai_player(self, player_number, ai_type="AI1"):
-        """Belirtilen oyuncu numarası için yapay zeka başlat"""
+    def start_ai_player(self, player_number, ai_type="AI1", threaded=None):
+        """Belirtilen oyuncu numarası için yapay zeka başlat ("AI1", "AI2" veya rollout tabanlı "MC")"""
+        if threaded is None:
+            threaded = self.threaded
+        
         if player_number == PlayerNumber.PLAYER1:
             if self.ai_player1 is None:
                 if ai_type == "AI1":
                     self.ai_player1 = AIPlayer1(
                         PlayerNumber.PLAYER1, 
                         self.p1_game_state_queue, 
-                        self.p1_action_queue
+                        self.p1_action_queue,
+                        self._player_seed(PlayerNumber.PLAYER1)
+                    )
+                elif ai_type == "MC":
+                    self.ai_player1 = AIPlayerRollout(
+                        PlayerNumber.PLAYER1, 
+                        self.p1_game_state_queue, 
+                        self.p1_action_queue,
+                        self._player_seed(PlayerNumber.PLAYER1)
                     )
                 else:  # ai_type == "AI2"
                     self.ai_player1 = AIPlayer2(
                         PlayerNumber.PLAYER1, 
                         self.p1_game_state_queue, 
-                        self.p1_action_queue
+                        self.p1_action_queue,
+                        self._player_seed(PlayerNumber.PLAYER1)
                     )
-                self.ai_player1.start()
+                self._launch(self.ai_player1, threaded)
                 
         elif player_number == PlayerNumber.PLAYER2:
             if self.ai_player2 is None:
@@ -65,36 +104,180 @@ class AIController:
                     self.ai_player2 = AIPlayer1(
                         PlayerNumber.PLAYER2, 
                         self.p2_game_state_queue, 
-                        self.p2_action_queue
+                        self.p2_action_queue,
+                        self._player_seed(PlayerNumber.PLAYER2)
+                    )
+                elif ai_type == "MC":
+                    self.ai_player2 = AIPlayerRollout(
+                        PlayerNumber.PLAYER2, 
+                        self.p2_game_state_queue, 
+                        self.p2_action_queue,
+                        self._player_seed(PlayerNumber.PLAYER2)
                     )
                 else:  # ai_type == "AI2"
                     self.ai_player2 = AIPlayer2(
                         PlayerNumber.PLAYER2, 
                         self.p2_game_state_queue, 
-                        self.p2_action_queue
+                        self.p2_action_queue,
+                        self._player_seed(PlayerNumber.PLAYER2)
                     )
-                self.ai_player2.start()
+                self._launch(self.ai_player2, threaded)
+        
+    def _launch(self, ai_player, threaded):
+        """AI'ı thread olarak başlat ya da dış adımlama için hazırla"""
+        if self.actor_system is not None:
+            # Kararlar kendi aktör thread'inde verilir, AI thread'i başlatılmaz
+            ai_player.threaded = True
+            self.actor_system.add_ai_player(ai_player)
+            return
         
+        ai_player.threaded = threaded
+        if threaded:
+            ai_player.start()
+    
+    def stepped_ai_players(self):
+        """Thread'siz çalışan (dışarıdan adımlanan) AI oyuncuları"""
+        return [ai for ai in (self.ai_player1, self.ai_player2)
+                if ai is not None and not ai.threaded and ai.running]
+    
+    def tick_ai_players(self, now=None):
+        """Thread'siz AI'ların her birini bir karar adımı ilerlet"""
+        for ai_player in self.stepped_ai_players():
+            self.tick_ai_player(ai_player, now)
+    
+    def tick_ai_player(self, ai_player, now=None):
+        """Tek AI kararını süre ölçerek çalıştır"""
+        start = time.perf_counter()
+        action = ai_player.tick(now)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        
+        stats = self.decision_stats[ai_player.player_number]
+        stats['decisions'] += 1
+        stats['total_ms'] += elapsed_ms
+        stats['recent_ms'].append(elapsed_ms)
+        if elapsed_ms > stats['max_ms']:
+            stats['max_ms'] = elapsed_ms
+        if elapsed_ms > self.decision_budget_ms:
+            stats['overruns'] += 1
+        
+        return action
+    
+    def get_decision_stats(self, player_number):
+        """
+        Karar gecikmesi özeti
+        
+        Returns:
+            dict: decisions, avg_ms, p95_ms, max_ms, overruns, budget_ms
+        """
+        stats = self.decision_stats[player_number]
+        recent = sorted(stats['recent_ms'])
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        
+        return {
+            'decisions': stats['decisions'],
+            'avg_ms': stats['total_ms'] / stats['decisions'] if stats['decisions'] else 0.0,
+            'p95_ms': p95,
+            'max_ms': stats['max_ms'],
+            'overruns': stats['overruns'],
+            'budget_ms': self.decision_budget_ms
+        }
+    
+    def get_utility_stats(self, player_number):
+        """
+        Karar motorunun terim başına süreleri
+        
+        Returns:
+            dict: terim -> count, avg_ms, max_ms (AI yoksa boş)
+        """
+        ai_player = self.ai_player1 if player_number == PlayerNumber.PLAYER1 else self.ai_player2
+        utility = getattr(ai_player, 'utility', None)
+        return utility.get_stats() if utility else {}
+    
+    def get_rollout_stats(self, player_number):
+        """
+        Rollout AI (MC) özeti
+        
+        Returns:
+            dict: RolloutPlanner.get_stats() (MC değilse boş)
+        """
+        ai_player = self.ai_player1 if player_number == PlayerNumber.PLAYER1 else self.ai_player2
+        planner = getattr(ai_player, 'planner', None)
+        return planner.get_stats() if planner else {}
+    
+    def get_path_stats(self, player_number):
+        """
+        Artımlı yol planlayıcısının sorgu ve genişletme sayıları
+        
+        Returns:
+            dict: DStarLite.get_stats() (planlayıcı kurulmadıysa boş)
+        """
+        ai_player = self.ai_player1 if player_number == PlayerNumber.PLAYER1 else self.ai_player2
+        planner = getattr(ai_player, 'path_planner', None)
+        return planner.get_stats() if planner else {}
+    
+    def reset_decision_stats(self):
+        for player_number in self.decision_stats:
+            self.decision_stats[player_number] = self._new_decision_stats()
+            self.effect_stats[player_number] = self._new_effect_stats()
+    
+    def _new_decision_stats(self):
+        return {
+            'decisions': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'overruns': 0,
+            'recent_ms': deque(maxlen=self.LATENCY_HISTORY)
+        }
+    
+    def _player_seed(self, player_number):
+        """Her oyuncu için ayrı ama tekrarlanabilir tohum"""
+        if self.seed is None:
+            return None
+        return self.seed * 2 + player_number.value
+    
+    def attach_external_player(self, player_number):
+        """Oyuncuyu dış eylem kaynağına bağla (AI thread'i olmadan submit_action ile sürülür)"""
+        self.external_players.add(player_number)
+    
+    def detach_external_player(self, player_number):
+        self.external_players.discard(player_number)
+    
+    def submit_action(self, player_number, action):
+        """Dış kaynaktan gelen eylemi bir sonraki poll_commands için kanala bırak"""
+        if player_number == PlayerNumber.PLAYER1:
+            self.p1_action_queue.put(action)
+        elif player_number == PlayerNumber.PLAYER2:
+            self.p2_action_queue.put(action)
+    
     # Diğer metodlar aynı kalır
     def stop_ai_player(self, player_number):
         """Belirtilen oyuncu numarası için yapay zekayı durdur"""
         if player_number == PlayerNumber.PLAYER1 and self.ai_player1:
-            self.ai_player1.stop()
+            self._stop(self.ai_player1)
             self.ai_player1 = None
         elif player_number == PlayerNumber.PLAYER2 and self.ai_player2:
-            self.ai_player2.stop()
+            self._stop(self.ai_player2)
             self.ai_player2 = None
     
     def stop_all(self):
         """Tüm yapay zeka oyuncularını durdur"""
         if self.ai_player1:
-            self.ai_player1.stop()
+            self._stop(self.ai_player1)
             self.ai_player1 = None
         
         if self.ai_player2:
-            self.ai_player2.stop()
+            self._stop(self.ai_player2)
             self.ai_player2 = None
     
+    def _stop(self, ai_player):
+        ai_player.stop()
+        # Durdurulan AI'ın bekleyen kararları yeni oyuncuya sızmasın
+        channel = self.p1_action_queue if ai_player.player_number == PlayerNumber.PLAYER1 else self.p2_action_queue
+        channel.clear()
+        self._fire_pending[ai_player.player_number.value] = False
+        if self.actor_system is not None:
+            self.actor_system.remove_ai_player(ai_player.player_number)
+    
     def update_game_state(self, player_number, game_state):
         """
         Oyun durumunu yapay zekaya ilet
@@ -103,80 +286,83 @@ class AIController:
             player_number: PlayerNumber enum değeri
             game_state: Oyun durumu sözlüğü
         """
+        if self.actor_system is not None:
+            ai_player = self.ai_player1 if player_number == PlayerNumber.PLAYER1 else self.ai_player2
+            if ai_player:
+                self.actor_system.publish_state(player_number, game_state)
+            return
+        
         if player_number == PlayerNumber.PLAYER1 and self.ai_player1:
             self.p1_game_state_queue.put(game_state)
         elif player_number == PlayerNumber.PLAYER2 and self.ai_player2:
             self.p2_game_state_queue.put(game_state)
     
-    def update_key_states(self):
+    def poll_commands(self):
         """
-        Yapay zeka eylemlerini simüle edilmiş tuş basışlarına dönüştür.
-        Bu fonksiyon her frame'de çağrılmalıdır.
+        Kanallardaki kararları frame komutlarına dönüştür.
+        Bu fonksiyon her frame'de, oyuncu girdileri işlenmeden önce çağrılmalıdır.
         """
-        # Tüm tuşları sıfırla
-        for key in self.key_states:
-            self.key_states[key] = False
-        
-        # Player 1 eylemlerini al ve uygula
-        if self.ai_player1:
-            try:
-                while not self.p1_action_queue.empty():
-                    action = self.p1_action_queue.get(block=False)
-                    self._apply_action(action, PlayerNumber.PLAYER1)
-            except:
-                pass
-        
-        # Player 2 eylemlerini al ve uygula
-        if self.ai_player2:
-            try:
-                while not self.p2_action_queue.empty():
-                    action = self.p2_action_queue.get(block=False)
-                    self._apply_action(action, PlayerNumber.PLAYER2)
-            except:
-                pass
+        for player_number, ai_player, channel in (
+                (PlayerNumber.PLAYER1, self.ai_player1, self.p1_action_queue),
+                (PlayerNumber.PLAYER2, self.ai_player2, self.p2_action_queue)):
+            index = player_number.value
+            if ai_player or player_number in self.external_players:
+                command = channel.poll()
+            else:
+                command = IDLE_COMMAND
+            self.commands[index] = command
+            if command.fresh:
+                self._effect_pending[index] = True
+            if command.fire:
+                self._fire_pending[index] = True
     
-    def _apply_action(self, action, player_number):
-        """
-        AI eylemini tuş basışlarına dönüştür
+    def command_for(self, player_number):
+        return self.commands[player_number.value]
+    
+    def take_fire(self, player_number):
+        """Bekleyen ateş kararını tüket"""
+        index = player_number.value
+        fire = self._fire_pending[index]
+        self._fire_pending[index] = False
+        return fire
+    
+    def record_effect(self, player_number):
+        """Komut oyuncuya uygulandı - karardan etkiye geçen süreyi kaydet"""
+        index = player_number.value
+        if not self._effect_pending[index]:
+            return
+        self._effect_pending[index] = False
         
-        Args:
-            action: AIAction enum değeri
-            player_number: PlayerNumber enum değeri
+        latency_ms = (time.perf_counter() - self.commands[index].issued_at) * 1000.0
+        stats = self.effect_stats[player_number]
+        stats['count'] += 1
+        stats['total_ms'] += latency_ms
+        stats['recent_ms'].append(latency_ms)
+        if latency_ms > stats['max_ms']:
+            stats['max_ms'] = latency_ms
+    
+    def get_effect_stats(self, player_number):
         """
-        if player_number == PlayerNumber.PLAYER1:
-            # Player 1 tuşlarını ayarla
-            if action == AIAction.MOVE_UP:
-                self.key_states[pygame.K_UP] = True
-            elif action == AIAction.MOVE_DOWN:
-                self.key_states[pygame.K_DOWN] = True
-            elif action == AIAction.MOVE_LEFT:
-                self.key_states[pygame.K_LEFT] = True
-            elif action == AIAction.MOVE_RIGHT:
-                self.key_states[pygame.K_RIGHT] = True
-            elif action == AIAction.SHOOT:
-                self.key_states[pygame.K_SPACE] = True
+        Karar -> etki gecikmesi özeti
         
-        elif player_number == PlayerNumber.PLAYER2:
-            # Player 2 tuşlarını ayarla
-            if action == AIAction.MOVE_UP:
-                self.key_states[pygame.K_w] = True
-            elif action == AIAction.MOVE_DOWN:
-                self.key_states[pygame.K_s] = True
-            elif action == AIAction.MOVE_LEFT:
-                self.key_states[pygame.K_a] = True
-            elif action == AIAction.MOVE_RIGHT:
-                self.key_states[pygame.K_d] = True
-            elif action == AIAction.SHOOT:
-                self.key_states[pygame.K_f] = True
-    
-    def get_key_state(self, key):
-        """
-        Belirli bir tuşun durumunu döndür
-        
-        Args:
-            key: pygame.K_* sabitlerinden biri
-            
         Returns:
-            bool: Tuş basılı mı?
+            dict: count, avg_ms, p95_ms, max_ms
         """
-        return self.key_states.get(key, False)
\ No newline at end of file
+        stats = self.effect_stats[player_number]
+        recent = sorted(stats['recent_ms'])
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        
+        return {
+            'count': stats['count'],
+            'avg_ms': stats['total_ms'] / stats['count'] if stats['count'] else 0.0,
+            'p95_ms': p95,
+            'max_ms': stats['max_ms']
+        }
+    
+    def _new_effect_stats(self):
+        return {
+            'count': 0,
+            'total_ms': 0.0,
+            'max_ms': 0.0,
+            'recent_ms': deque(maxlen=self.LATENCY_HISTORY)
+        }
@@ -0,0 +1,103 @@
+# src/ai_memory.py
+import math
+from array import array
+from collections import deque
+
+class AIMemory:
+    """
+    AI oyuncusunun sabit boyutlu uzamsal hafızası.
+    - Son hareketler sabit uzunlukta halka tamponda
+    - Düşman görüşleri zamanla sönen hücre başına ısı haritasında
+    - Ziyaret edilen ve duvar sanılan hücreler bit maskesinde (seviye değişince sıfırlanır)
+    Tüm sorgular O(1); oturum ne kadar uzun sürerse sürsün bellek sabit kalır.
+    """
+    GRID_WIDTH = 13
+    GRID_HEIGHT = 8
+    HISTORY_SIZE = 10
+    # Isı bu sürede yarıya iner (saniye)
+    HEAT_HALF_LIFE = 3.0
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.history = deque(maxlen=self.HISTORY_SIZE)
+
+        # Isı, son güncelleme anındaki değeriyle saklanır; okurken söndürülür
+        self._heat = array('d', [0.0]) * (width * height)
+        self._heat_time = array('d', [0.0]) * (width * height)
+        self._decay_rate = math.log(2) / self.HEAT_HALF_LIFE
+
+        self._visited = 0
+        self._walls = 0
+        self.level_name = None
+
+    def set_level(self, level_name):
+        """Seviye değiştiyse seviyeye özgü hafızayı sıfırla"""
+        if level_name == self.level_name:
+            return
+        self.level_name = level_name
+        self.reset_level()
+
+    def reset_level(self):
+        self._visited = 0
+        self._walls = 0
+        self.history.clear()
+        for index in range(len(self._heat)):
+            self._heat[index] = 0.0
+
+    def visit(self, grid_x, grid_y):
+        bit = self._bit(grid_x, grid_y)
+        if bit:
+            self._visited |= bit
+        self.history.append((grid_x, grid_y))
+
+    def visited(self, grid_x, grid_y):
+        return bool(self._visited & self._bit(grid_x, grid_y))
+
+    @property
+    def visited_bits(self):
+        """Ziyaret bit maskesi (bit y * width + x)"""
+        return self._visited
+
+    def visited_count(self):
+        return bin(self._visited).count('1')
+
+    def mark_wall(self, grid_x, grid_y):
+        self._walls |= self._bit(grid_x, grid_y)
+
+    def is_wall(self, grid_x, grid_y):
+        return bool(self._walls & self._bit(grid_x, grid_y))
+
+    def see_enemy(self, grid_x, grid_y, now):
+        """Düşman görüşünü ısı haritasına ekle"""
+        index = self._index(grid_x, grid_y)
+        if index is None:
+            return
+        self._heat[index] = self._decayed(index, now) + 1.0
+        self._heat_time[index] = now
+
+    def heat(self, grid_x, grid_y, now):
+        """Hücrenin şu anki (sönmüş) düşman ısısı"""
+        index = self._index(grid_x, grid_y)
+        if index is None:
+            return 0.0
+        return self._decayed(index, now)
+
+    def previous_cell(self):
+        """Bir önceki kayıtlı hücre (yoksa None)"""
+        return self.history[-2] if len(self.history) > 1 else None
+
+    def _decayed(self, index, now):
+        value = self._heat[index]
+        if value == 0.0:
+            return 0.0
+        return value * math.exp(-self._decay_rate * max(0.0, now - self._heat_time[index]))
+
+    def _index(self, grid_x, grid_y):
+        if 0 <= grid_x < self.width and 0 <= grid_y < self.height:
+            return grid_y * self.width + grid_x
+        return None
+
+    def _bit(self, grid_x, grid_y):
+        index = self._index(grid_x, grid_y)
+        return 0 if index is None else 1 << index
@@ -0,0 +1,233 @@
+# src/async_game_loop.py
+import asyncio
+from src.main_game_loop import LoopPhase, PacingPolicy
+
+class AsyncGameLoop:
+    """
+    asyncio tabanlı oyun döngüsü.
+    Frame adımı, AI karar coroutine'leri ve ses komut dağıtımı tek event loop
+    üzerinde görev olarak çalışır; thread geçişi ve GIL çekişmesi olmaz.
+    AI'lar frame sayacından türetilen simülasyon zamanıyla adımlandığı için
+    headless koşularda zamanlama deterministiktir.
+    """
+
+    # Deadline'a bu kadar kala sleep yerine event loop'a kısa teslimlerle beklenir
+    SPIN_THRESHOLD = 0.002
+    # Bu kadar frame geride kalınırsa deadline sıfırlanır (spiral of death önlemi)
+    MAX_LAG_FRAMES = 5
+
+    def __init__(self, game, fps=60, headless=False, max_frames=None, start_mode=None):
+        """
+        Args:
+            game: WizardOfWor örneği
+            fps: Hedef frame hızı
+            headless: True ise çizim ve bekleme yapılmaz, dt sabit 1/fps olur
+            max_frames: Bu kadar frame sonra döngü biter (None = sınırsız)
+            start_mode: Verilirse menü atlanıp start_game_with_mode(start_mode) çağrılır
+        """
+        self.game = game
+        self.fps = fps
+        self.frame_time = 1.0 / fps
+        self.headless = headless
+        self.max_frames = max_frames
+        self.start_mode = start_mode
+        self.running = False
+
+        # Simülasyon zamanı - AI kararları bu saatle verilir
+        self.frame_index = 0
+        self.sim_time = 0.0
+
+        # Görev senkronizasyonu
+        self._ai_inboxes = {}
+        self._ai_done = None
+        self._audio_wakeup = None
+
+        self.stats = {
+            'frames': 0,
+            'late_frames': 0,
+            'deadline_resets': 0,
+            'max_frame_ms': 0.0,
+            'ai_ticks': 0,
+            'audio_commands': 0,
+            'unthreaded_jobs': 0
+        }
+
+        # AI, ses ve fizik bu döngü tarafından adımlanır
+        self.game.use_async_loop = True
+        self.game.ai_controller.threaded = False
+
+    @classmethod
+    def from_argv(cls, game, argv):
+        """--headless, --fps=N, --frames=N, --mode=N argümanlarından döngü oluştur"""
+        options = {}
+        for arg in argv:
+            if arg.startswith("--") and "=" in arg:
+                key, value = arg[2:].split("=", 1)
+                options[key] = value
+
+        return cls(
+            game,
+            fps=int(options.get("fps", 60)),
+            headless="--headless" in argv,
+            max_frames=int(options["frames"]) if "frames" in options else None,
+            start_mode=int(options["mode"]) if "mode" in options else None
+        )
+
+    def run(self):
+        """Döngüyü çalıştır ve bitince thread'leri kapat"""
+        self.game.prepare_run()
+
+        if self.start_mode is not None:
+            self.game.start_game_with_mode(self.start_mode)
+
+        try:
+            print("🎮 Async oyun döngüsü başlatıldı")
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            print("🛑 Kullanıcı tarafından durduruldu")
+        finally:
+            self.game._shutdown_threads()
+
+        return self.stats
+
+    def stop(self):
+        self.running = False
+
+    async def _main(self):
+        self.running = True
+        self._ai_done = asyncio.Queue()
+        self._audio_wakeup = asyncio.Event()
+
+        audio_task = asyncio.create_task(self._audio_task())
+        ai_tasks = {}
+
+        try:
+            await self._frame_task(ai_tasks)
+        finally:
+            self.running = False
+            self._audio_wakeup.set()
+            for task in list(ai_tasks.values()) + [audio_task]:
+                task.cancel()
+            await asyncio.gather(audio_task, *ai_tasks.values(), return_exceptions=True)
+
+    async def _frame_task(self, ai_tasks):
+        """Frame adımı: MainGameLoop.frame_phases (AI kararları SIMULATE'te beklenir) -> bekleme"""
+        loop = asyncio.get_running_loop()
+        main_loop = self.game.main_loop
+        if self.headless:
+            # Çizim/sunum fazları atlanır; bekleme bu döngüde
+            main_loop.pacing = PacingPolicy.HEADLESS
+        next_deadline = loop.time()
+        last_time = next_deadline
+
+        while self.running:
+            frame_start = loop.time()
+
+            if self.headless:
+                delta_time = self.frame_time
+            else:
+                delta_time = frame_start - last_time
+            last_time = frame_start
+
+            # Fazlar MainGameLoop ile aynı sırada; adımlı AI kararları SIMULATE içinde beklenir
+            phases = main_loop.frame_phases(delta_time)
+            try:
+                while True:
+                    if next(phases) == LoopPhase.SIMULATE:
+                        await self._step_ai(ai_tasks)
+            except StopIteration as done:
+                running = done.value
+
+            # Fazlardan sonra kalan ses komutlarını dağıt
+            self._audio_wakeup.set()
+            main_loop.monitor(delta_time)
+            self.stats['unthreaded_jobs'] = main_loop.unthreaded_jobs
+
+            if not running:
+                break
+
+            self.frame_index += 1
+            self.sim_time = self.frame_index * self.frame_time
+            self.stats['frames'] = self.frame_index
+
+            frame_ms = (loop.time() - frame_start) * 1000.0
+            if frame_ms > self.stats['max_frame_ms']:
+                self.stats['max_frame_ms'] = frame_ms
+
+            if self.max_frames is not None and self.frame_index >= self.max_frames:
+                break
+
+            if self.headless:
+                # Diğer görevlerin (ses) çalışabilmesi için kontrolü bırak
+                await asyncio.sleep(0)
+                continue
+
+            # Deadline tabanlı frame hızı
+            next_deadline += self.frame_time
+            lag = loop.time() - next_deadline
+            if lag > 0:
+                self.stats['late_frames'] += 1
+                if lag > self.frame_time * self.MAX_LAG_FRAMES:
+                    next_deadline = loop.time()
+                    self.stats['deadline_resets'] += 1
+                await asyncio.sleep(0)
+            else:
+                await self._wait_until(loop, next_deadline)
+
+    async def _wait_until(self, loop, deadline):
+        """Deadline'a kadar bekle - son milisaniyelerde sleep hassasiyetine güvenme"""
+        remaining = deadline - loop.time()
+        if remaining > self.SPIN_THRESHOLD:
+            await asyncio.sleep(remaining - self.SPIN_THRESHOLD)
+
+        while loop.time() < deadline:
+            await asyncio.sleep(0)
+
+    async def _step_ai(self, ai_tasks):
+        """Thread'siz AI'ların her birine bir karar adımı yaptır"""
+        players = self.game.ai_controller.stepped_ai_players()
+
+        # Yeni başlatılan AI'lar için görev oluştur, durdurulanları kapat
+        active_ids = set()
+        for ai_player in players:
+            key = id(ai_player)
+            active_ids.add(key)
+            if key not in ai_tasks:
+                self._ai_inboxes[key] = asyncio.Queue()
+                ai_tasks[key] = asyncio.create_task(self._ai_task(ai_player, self._ai_inboxes[key]))
+
+        for key in list(ai_tasks):
+            if key not in active_ids:
+                ai_tasks.pop(key).cancel()
+                self._ai_inboxes.pop(key, None)
+
+        if not players:
+            return
+
+        for ai_player in players:
+            self._ai_inboxes[id(ai_player)].put_nowait(self.sim_time)
+
+        for _ in players:
+            await self._ai_done.get()
+
+    async def _ai_task(self, ai_player, inbox):
+        """Tek AI oyuncusunun karar coroutine'i"""
+        while True:
+            now = await inbox.get()
+            try:
+                self.game.ai_controller.tick_ai_player(ai_player, now)
+                self.stats['ai_ticks'] += 1
+            except Exception as e:
+                print(f"❌ AI tick hatası ({ai_player.player_number}): {e}")
+            finally:
+                self._ai_done.put_nowait(ai_player)
+
+    async def _audio_task(self):
+        """Frame başına bir kez bekleyen ses komutlarını dağıt"""
+        while self.running:
+            await self._audio_wakeup.wait()
+            self._audio_wakeup.clear()
+
+            thread_manager = self.game.thread_manager
+            if thread_manager:
+                self.stats['audio_commands'] += thread_manager.dispatch_pending_audio()
@@ -0,0 +1,162 @@
+# src/audio_events.py
+from enum import Enum
+from src.audio_manager import AudioCommand, SoundCategory
+
+class SoundEvent(Enum):
+    """Oyun içi ses olayları"""
+    SHOOT = 0
+    PLAYER_DEATH = 1
+    LEVEL_INTRO = 2
+    SPEED_UP = 3
+    WIZARD_DEATH = 4
+    WORLUK_DEATH = 5
+    WORLUK_ESCAPE = 6
+    VICTORY = 7
+    GAME_OVER = 8
+
+class AudioEvents:
+    """
+    Tüm oyun içi seslerin geçtiği tek giriş noktası.
+    Olaylar frame boyunca biriktirilir ve flush() ile tek parti halinde
+    AudioManager'a gönderilir; mixer çağrıları ana thread'de yapılmaz.
+    """
+    # Olay -> (dosya, ses seviyesi, öncelik)
+    SOUND_TABLE = {
+        SoundEvent.SHOOT: ("assets/sounds/piou.wav", 0.6, 1),
+        SoundEvent.PLAYER_DEATH: ("assets/sounds/death.wav", 0.8, 5),
+        SoundEvent.LEVEL_INTRO: ("assets/sounds/intro.wav", 1.0, 3),
+        SoundEvent.SPEED_UP: ("assets/sounds/intro.wav", 1.0, 2),
+        SoundEvent.WIZARD_DEATH: ("assets/sounds/wizard-kill.wav", 1.0, 4),
+        SoundEvent.WORLUK_DEATH: ("assets/sounds/worluk-kill.wav", 1.0, 4),
+        SoundEvent.WORLUK_ESCAPE: ("assets/sounds/worluk-escape.wav", 1.0, 4),
+        # victory.wav yok - intro sesi kullanılır
+        SoundEvent.VICTORY: ("assets/sounds/intro.wav", 1.0, 5),
+        SoundEvent.GAME_OVER: ("assets/sounds/death.wav", 0.8, 5)
+    }
+    # Müzik notaları her zaman kendi kanallarını alsın
+    MUSIC_PRIORITY = 10
+
+    _audio_manager = None
+    # Verilirse partiler ses yöneticisi yerine buraya gönderilir (ör. ses aktörü)
+    _batch_sink = None
+    _pending = []
+    _stats = {'events': 0, 'flushes': 0, 'max_batch': 0, 'discarded': 0}
+
+    @staticmethod
+    def set_audio_manager(audio_manager):
+        AudioEvents._audio_manager = audio_manager
+
+    @staticmethod
+    def set_batch_sink(sink):
+        """Partileri sink(batch) ile gönder - None ile ses yöneticisine geri dön"""
+        AudioEvents._batch_sink = sink
+
+    @staticmethod
+    def emit(event, volume=None, priority=None):
+        """Tanımlı bir ses olayını bu frame'in partisine ekle"""
+        path, default_volume, default_priority = AudioEvents.SOUND_TABLE[event]
+        AudioEvents.play(
+            path,
+            default_volume if volume is None else volume,
+            default_priority if priority is None else priority
+        )
+
+    @staticmethod
+    def play(path, volume=1.0, priority=0, category=None, loops=0):
+        AudioEvents._add({
+            'command': AudioCommand.PLAY_SOUND,
+            'data': {
+                'path': path,
+                'volume': volume,
+                'priority': priority,
+                'category': category,
+                'loops': loops
+            }
+        })
+
+    @staticmethod
+    def play_music_note(path, loops=0):
+        AudioEvents.play(path, 1.0, AudioEvents.MUSIC_PRIORITY, SoundCategory.MUSIC, loops)
+
+    @staticmethod
+    def stop(path=None, category=None):
+        """Verilen sesi veya kategorideki tüm sesleri durdur"""
+        AudioEvents._add({
+            'command': AudioCommand.STOP_SOUND,
+            'data': {'path': path, 'category': category}
+        })
+
+    @staticmethod
+    def start_heartbeat(notes, tempo_bpm):
+        """Müzik sıralayıcısında kalp atışını başlat"""
+        AudioEvents._sequencer('heartbeat', notes=list(notes), tempo=tempo_bpm)
+
+    @staticmethod
+    def start_intro_loop(intro, loop):
+        AudioEvents._sequencer('intro_loop', intro=intro, loop=loop)
+
+    @staticmethod
+    def set_tempo(tempo_bpm):
+        """Tempo bir sonraki vuruş sınırında değişir"""
+        AudioEvents._sequencer('tempo', tempo=tempo_bpm)
+
+    @staticmethod
+    def stop_sequencer():
+        AudioEvents._sequencer('stop')
+
+    @staticmethod
+    def flush():
+        """Frame'in olaylarını tek parti olarak ses thread'ine gönder"""
+        if not AudioEvents._pending:
+            return 0
+
+        batch = AudioEvents._pending
+        AudioEvents._pending = []
+
+        stats = AudioEvents._stats
+        stats['flushes'] += 1
+        if len(batch) > stats['max_batch']:
+            stats['max_batch'] = len(batch)
+
+        if AudioEvents._batch_sink is not None:
+            AudioEvents._batch_sink(batch)
+            return len(batch)
+
+        if AudioEvents._audio_manager is None:
+            # Ses yöneticisi yoksa (thread başlatılamadı) olaylar sessizce atılır
+            stats['discarded'] += len(batch)
+            return 0
+
+        AudioEvents._audio_manager.submit_batch(batch)
+        return len(batch)
+
+    @staticmethod
+    def clear():
+        AudioEvents._pending = []
+
+    @staticmethod
+    def sound_length(path):
+        """Ses bankasındaki sesin süresi (saniye, bilinmiyorsa 0)"""
+        if AudioEvents._audio_manager is None:
+            return 0.0
+        sound = AudioEvents._audio_manager.sound_bank.get(path)
+        return sound.get_length() if sound is not None else 0.0
+
+    @staticmethod
+    def get_stats():
+        stats = dict(AudioEvents._stats)
+        stats['pending'] = len(AudioEvents._pending)
+        if AudioEvents._audio_manager is not None:
+            stats['queue_depth'] = AudioEvents._audio_manager.audio_queue.qsize()
+            stats['max_queue_depth'] = AudioEvents._audio_manager.stats['max_queue_depth']
+        return stats
+
+    @staticmethod
+    def _sequencer(action, **data):
+        data['action'] = action
+        AudioEvents._add({'command': AudioCommand.SEQUENCER, 'data': data})
+
+    @staticmethod
+    def _add(command):
+        AudioEvents._pending.append(command)
+        AudioEvents._stats['events'] += 1
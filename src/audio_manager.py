@@ -1,9 +1,12 @@
 # src/audio_manager.py
+import os
 import pygame
 import threading
 import queue
 import time
 from enum import Enum
+from src.config_manager import ConfigManager
+from src.constants import Constants
 
 class AudioCommand(Enum):
     PLAY_SOUND = 1
@@ -14,17 +17,363 @@ class AudioCommand(Enum):
     FADE_OUT = 6
     LOAD_SOUND = 7
     PRELOAD_SOUNDS = 8
+    STOP_SOUND = 9
+    BATCH = 10
+    SEQUENCER = 11
+
+class SoundCategory(Enum):
+    """Her kategori kendi ayrılmış mixer kanallarında çalar"""
+    SHOT = 0
+    DEATH = 1
+    MUSIC = 2
+    EFFECT = 3
+
+class NullSound:
+    """Headless koşular için sessiz ses nesnesi"""
+    
+    def __init__(self, path=None):
+        self.path = path
+    
+    def play(self, loops=0, maxtime=0, fade_ms=0):
+        return None
+    
+    def stop(self):
+        pass
+    
+    def set_volume(self, volume):
+        pass
+    
+    def get_length(self):
+        return 0.0
+
+class NullChannel:
+    def play(self, sound, loops=0, maxtime=0, fade_ms=0):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def set_volume(self, volume):
+        pass
+    
+    def get_busy(self):
+        return False
+
+class NullMusic:
+    def load(self, path):
+        pass
+    
+    def play(self, loops=0):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def fadeout(self, time_ms):
+        pass
+    
+    def set_volume(self, volume):
+        pass
+    
+    def get_busy(self):
+        return False
+
+class MixerAudioBackend:
+    """pygame.mixer üzerinden gerçek ses çıkışı"""
+    # Ayrılmış kanallar dışında doğrudan Sound.play() çağrılarına kalan kanal sayısı
+    FREE_CHANNELS = 8
+    supports_queue = True
+    
+    def __init__(self):
+        self.music = pygame.mixer.music
+    
+    def setup_channels(self, reserved_count):
+        total = reserved_count + self.FREE_CHANNELS
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Ayrılmış kanallar otomatik kanal seçiminde kullanılmaz
+        pygame.mixer.set_reserved(reserved_count)
+    
+    def load_sound(self, path):
+        return pygame.mixer.Sound(path)
+    
+    def channel(self, index):
+        return pygame.mixer.Channel(index)
+    
+    def make_segment(self, sound, seconds):
+        """
+        Sesi tam olarak verilen süreye kes veya sessizlikle doldur.
+        Süre mixer örnek sayısına yuvarlanır; kuyruğa art arda konan
+        segmentler örnek hassasiyetinde birbirini izler.
+        """
+        frequency, size, channels = pygame.mixer.get_init()
+        frame_bytes = abs(size) // 8 * channels
+        length = int(round(frequency * seconds)) * frame_bytes
+        silence = b'\x00' if size < 0 else b'\x80'
+        
+        raw = sound.get_raw()[:length]
+        return pygame.mixer.Sound(buffer=raw + silence * (length - len(raw)))
+
+class NullAudioBackend:
+    """Headless backend - dosya okumaz, ses çıkarmaz"""
+    # Kanal kuyruğu yok - müzik sıralayıcısı çalışmaz
+    supports_queue = False
+    
+    def __init__(self):
+        self.music = NullMusic()
+        self._channels = []
+    
+    def setup_channels(self, reserved_count):
+        self._channels = [NullChannel() for _ in range(reserved_count)]
+    
+    def load_sound(self, path):
+        return NullSound(path)
+    
+    def channel(self, index):
+        return self._channels[index]
+
+class SoundBank:
+    """Başlangıçta yüklenen ses deposu - oyun sırasında diskten okuma yapılmaz"""
+    
+    CATEGORY_BY_NAME = {
+        'piou.wav': SoundCategory.SHOT,
+        'death.wav': SoundCategory.DEATH,
+        'C-long.wav': SoundCategory.MUSIC,
+        'G#-long.wav': SoundCategory.MUSIC,
+        'worluk-intro.wav': SoundCategory.MUSIC,
+        'worluk-loop.wav': SoundCategory.MUSIC
+    }
+    SOUND_EXTENSIONS = ('.wav', '.ogg')
+    
+    def __init__(self, backend):
+        self._backend = backend
+        self._sounds = {}
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._sounds)
+    
+    def load_directory(self, directory):
+        """Dizindeki tüm ses dosyalarını yükle"""
+        if not os.path.isdir(directory):
+            print(f"⚠️ Ses dizini bulunamadı: {directory}")
+            return 0
+        
+        loaded = 0
+        for name in sorted(os.listdir(directory)):
+            if name.lower().endswith(self.SOUND_EXTENSIONS):
+                if self.load(os.path.join(directory, name)) is not None:
+                    loaded += 1
+        return loaded
+    
+    def load(self, path):
+        key = os.path.normpath(path)
+        if key in self._sounds:
+            return self._sounds[key]
+        try:
+            sound = self._backend.load_sound(path)
+        except Exception as e:
+            print(f"❌ Ses yükleme hatası ({path}): {e}")
+            return None
+        self._sounds[key] = sound
+        return sound
+    
+    def get(self, path):
+        """Yüklü sesi döndür; bankada yoksa (önceden yüklenmemişse) yükle"""
+        sound = self._sounds.get(os.path.normpath(path))
+        if sound is None:
+            self.misses += 1
+            sound = self.load(path)
+        return sound
+    
+    def category_of(self, path):
+        return self.CATEGORY_BY_NAME.get(os.path.basename(path), SoundCategory.EFFECT)
+
+class MusicSequencer:
+    """
+    Ses tarafında çalışan müzik sıralayıcısı.
+    Kalp atışı notaları vuruş uzunluğuna kesilmiş segmentler olarak ayrılmış
+    bir kanalın kuyruğuna önceden konur; segmentler mixer tarafından boşluksuz
+    art arda çalındığı için zamanlama ana döngünün frame hızına bağlı değildir.
+    Tempo değişiklikleri bir sonraki vuruş sınırında uygulanır.
+    """
+    
+    def __init__(self, backend, sound_bank, channel_index):
+        self._backend = backend
+        self._sound_bank = sound_bank
+        self._channel_index = channel_index
+        
+        self.active = False
+        self._mode = None
+        self._notes = []
+        self._note_index = 0
+        self._tempo_bpm = 0.0
+        self._tempo_pending = False
+        self._intro = None
+        self._loop = None
+        self._intro_played = False
+        self._playing = False
+        
+        # (yol, tempo) -> vuruş uzunluğunda segment
+        self._segments = {}
+        
+        self.stats = {'beats': 0, 'tempo_changes': 0, 'underruns': 0}
+    
+    @property
+    def tempo_bpm(self):
+        return self._tempo_bpm
+    
+    def start_heartbeat(self, notes, tempo_bpm):
+        """İki notalı kalp atışını verilen tempoda başlat"""
+        self.stop()
+        if not self._backend.supports_queue or not notes:
+            return
+        self._mode = 'heartbeat'
+        self._notes = list(notes)
+        self._note_index = 0
+        self._tempo_bpm = tempo_bpm
+        self.active = True
+        self.service()
+    
+    def start_intro_loop(self, intro, loop):
+        """Girişi bir kez, ardından döngüyü kesintisiz çal (boss müziği)"""
+        self.stop()
+        if not self._backend.supports_queue:
+            return
+        self._mode = 'intro_loop'
+        self._intro = intro
+        self._loop = loop
+        self._intro_played = intro is None
+        self.active = True
+        self.service()
+    
+    def set_tempo(self, tempo_bpm):
+        """Yeni tempo bir sonraki vuruştan itibaren geçerli"""
+        if tempo_bpm == self._tempo_bpm:
+            return
+        self._tempo_bpm = tempo_bpm
+        self.stats['tempo_changes'] += 1
+        
+        # Kuyruktaki segment service() içinde yenilenir - kanal ve indeks yalnız ses tarafında
+        self._tempo_pending = self.active and self._mode == 'heartbeat'
+    
+    def stop(self):
+        if self.active:
+            self._backend.channel(self._channel_index).stop()
+        self.active = False
+        self._playing = False
+        self._tempo_pending = False
+        self._mode = None
+    
+    def service(self):
+        """Kuyruğu dolu tut - ses thread'inde düzenli çağrılır"""
+        if not self.active:
+            return
+        
+        channel = self._backend.channel(self._channel_index)
+        if self._tempo_pending:
+            self._tempo_pending = False
+            # Kuyruktaki segment eski tempoda - aynı notayı yeni tempoyla değiştir
+            if self._mode == 'heartbeat' and channel.get_queue() is not None:
+                self._note_index = (self._note_index - 1) % len(self._notes)
+                channel.queue(self._next_segment())
+        
+        if not channel.get_busy():
+            # İlk vuruş değilse kuyruk zamanında doldurulamamış demektir
+            if self._playing:
+                self.stats['underruns'] += 1
+            self._playing = True
+            segment = self._next_segment()
+            if segment is None:
+                self.active = False
+                return
+            channel.play(segment)
+            self.stats['beats'] += 1
+        
+        if channel.get_queue() is None:
+            segment = self._next_segment()
+            if segment is not None:
+                channel.queue(segment)
+                self.stats['beats'] += 1
+    
+    def _next_segment(self):
+        if self._mode == 'heartbeat':
+            path = self._notes[self._note_index]
+            self._note_index = (self._note_index + 1) % len(self._notes)
+            return self._segment(path, self._tempo_bpm)
+        
+        if self._mode == 'intro_loop':
+            if not self._intro_played:
+                self._intro_played = True
+                return self._sound_bank.get(self._intro)
+            return self._sound_bank.get(self._loop) if self._loop else None
+        
+        return None
+    
+    def _segment(self, path, tempo_bpm):
+        key = (path, tempo_bpm)
+        segment = self._segments.get(key)
+        if segment is None:
+            sound = self._sound_bank.get(path)
+            if sound is None:
+                return None
+            segment = self._backend.make_segment(sound, 60.0 / tempo_bpm)
+            self._segments[key] = segment
+        return segment
 
 class AudioManager:
     """Thread-safe audio yöneticisi"""
     
-    def __init__(self):
-        self.audio_queue = queue.Queue()
+    # Müzik sıralayıcısı aktifken ses thread'inin uyanma aralığı (saniye)
+    SEQUENCER_POLL_INTERVAL = 0.01
+    
+    def __init__(self, backend=None):
+        # Sınırlı kuyruk - dolarsa yeni ses efektleri atlanır
+        queue_size = ConfigManager.get_config(Constants.AUDIO_QUEUE_SIZE, Constants.DEFAULT_AUDIO_QUEUE_SIZE)
+        self.audio_queue = queue.Queue(maxsize=queue_size)
         self.audio_thread = None
         self.running = False
         
-        # Ses cache'i
-        self.sound_cache = {}
+        # Ses backend'i ve önceden yüklenen ses bankası
+        self.backend = backend if backend is not None else MixerAudioBackend()
+        self.sound_bank = SoundBank(self.backend)
+        
+        # Kategori -> ayrılmış kanal indeksleri
+        self._category_channels = {}
+        channel_counts = {
+            SoundCategory.SHOT: ConfigManager.get_config(Constants.AUDIO_SHOT_CHANNELS, Constants.DEFAULT_AUDIO_SHOT_CHANNELS),
+            SoundCategory.DEATH: ConfigManager.get_config(Constants.AUDIO_DEATH_CHANNELS, Constants.DEFAULT_AUDIO_DEATH_CHANNELS),
+            SoundCategory.MUSIC: ConfigManager.get_config(Constants.AUDIO_MUSIC_CHANNELS, Constants.DEFAULT_AUDIO_MUSIC_CHANNELS),
+            SoundCategory.EFFECT: ConfigManager.get_config(Constants.AUDIO_EFFECT_CHANNELS, Constants.DEFAULT_AUDIO_EFFECT_CHANNELS)
+        }
+        next_index = 0
+        for category in SoundCategory:
+            count = max(1, channel_counts[category])
+            self._category_channels[category] = list(range(next_index, next_index + count))
+            next_index += count
+        self.backend.setup_channels(next_index)
+        
+        # Müzik kanallarının ilki sıralayıcıya ayrılır
+        music_channels = self._category_channels[SoundCategory.MUSIC]
+        self.sequencer = MusicSequencer(self.backend, self.sound_bank, music_channels[0])
+        if len(music_channels) > 1:
+            self._category_channels[SoundCategory.MUSIC] = music_channels[1:]
+        
+        # Kanal -> (öncelik, başlama sırası) - ses çalma için en düşük öncelikli ses seçilir
+        self._voices = {}
+        self._voice_paths = {}
+        self._voice_sequence = 0
+        
+        self.stats = {
+            'played': 0,
+            'coalesced': 0,
+            'stolen': 0,
+            'voice_dropped': 0,
+            'queue_dropped': 0,
+            'batches': 0,
+            'max_queue_depth': 0
+        }
+        
         self.music_cache = {}
         
         # Volume kontrolü
@@ -62,21 +411,37 @@ class AudioManager:
             self.audio_thread.join(timeout=1.0)
         print("🔇 Audio thread durduruldu")
     
-    def play_sound(self, sound_path, volume=1.0, priority=0):
-        """Ses efekti çal"""
+    @property
+    def sound_cache(self):
+        # Eski arayüz - ses bankasının içeriği
+        return self.sound_bank._sounds
+    
+    def load_sound_bank(self, directory="assets/sounds"):
+        """Tüm sesleri başlangıçta yükle - oyun sırasında disk erişimi olmaz"""
+        loaded = self.sound_bank.load_directory(directory)
+        print(f"📦 {loaded} ses dosyası ses bankasına yüklendi")
+        return loaded
+    
+    def play_sound(self, sound_path, volume=1.0, priority=0, category=None):
+        """
+        Ses efekti çal
+        
+        Args:
+            priority: Kanallar doluyken daha düşük öncelikli sesin yerini alır
+            category: SoundCategory (None = dosya adından)
+        """
         command = {
             'command': AudioCommand.PLAY_SOUND,
             'data': {
                 'path': sound_path,
-                'volume': volume * self.sfx_volume * self.master_volume,
-                'priority': priority
+                'volume': volume,
+                'priority': priority,
+                'category': category
             }
         }
         
-        try:
-            self.audio_queue.put(command, block=False)
-        except queue.Full:
-            print("⚠️ Audio queue dolu, ses efekti atlandı")
+        if not self._enqueue(command):
+            self.stats['queue_dropped'] += 1
     
     def play_music(self, music_path, loop=True, volume=1.0):
         """Background müzik çal"""
@@ -89,9 +454,7 @@ class AudioManager:
             }
         }
         
-        try:
-            self.audio_queue.put(command, block=False)
-        except queue.Full:
+        if not self._enqueue(command):
             print("⚠️ Audio queue dolu, müzik komutu atlandı")
     
     def stop_music(self, fade_out_time=0):
@@ -101,7 +464,7 @@ class AudioManager:
             'data': {'fade_time': fade_out_time}
         }
         
-        self.audio_queue.put(command, block=False)
+        self._enqueue(command)
     
     def set_volume(self, volume_type, volume):
         """Volume ayarla"""
@@ -113,7 +476,7 @@ class AudioManager:
             }
         }
         
-        self.audio_queue.put(command, block=False)
+        self._enqueue(command)
     
     def preload_sounds(self, sound_paths):
         """Ses dosyalarını önceden yükle"""
@@ -122,7 +485,87 @@ class AudioManager:
             'data': {'paths': sound_paths}
         }
         
-        self.audio_queue.put(command, block=False)
+        self._enqueue(command)
+    
+    def submit_batch(self, commands):
+        """Bir frame'de biriken ses komutlarını tek kuyruk öğesi olarak gönder"""
+        command = {
+            'command': AudioCommand.BATCH,
+            'data': {'commands': commands}
+        }
+        
+        if self._enqueue(command):
+            self.stats['batches'] += 1
+        else:
+            self.stats['queue_dropped'] += len(commands)
+    
+    def _enqueue(self, command):
+        try:
+            self.audio_queue.put(command, block=False)
+        except queue.Full:
+            return False
+        
+        depth = self.audio_queue.qsize()
+        if depth > self.stats['max_queue_depth']:
+            self.stats['max_queue_depth'] = depth
+        return True
+    
+    def _drain(self, first=None):
+        """Kuyrukta biriken komutları toplu al"""
+        batch = [first] if first is not None else []
+        while True:
+            try:
+                batch.append(self.audio_queue.get(block=False))
+            except queue.Empty:
+                return batch
+    
+    def _coalesce(self, batch):
+        """
+        Aynı partide aynı sesi çalan komutları birleştir (ör. aynı frame'de iki piou.wav).
+        En yüksek ses seviyesi ve öncelik korunur, ilk komutun sırası kullanılır.
+        """
+        result = []
+        play_index = {}
+        for command_data in self._flatten(batch):
+            command = command_data.get('command')
+            if command == AudioCommand.STOP_SOUND:
+                # Durdurmadan sonra gelen aynı ses yeni bir tetikleme sayılır
+                play_index.clear()
+            if command != AudioCommand.PLAY_SOUND:
+                result.append(command_data)
+                continue
+            
+            data = command_data['data']
+            existing = play_index.get(data['path'])
+            if existing is None:
+                play_index[data['path']] = command_data
+                result.append(command_data)
+            else:
+                merged = existing['data']
+                merged['volume'] = max(merged['volume'], data['volume'])
+                merged['priority'] = max(merged['priority'], data['priority'])
+                self.stats['coalesced'] += 1
+        return result
+    
+    def _flatten(self, batch):
+        for command_data in batch:
+            if command_data.get('command') == AudioCommand.BATCH:
+                yield from command_data['data']['commands']
+            else:
+                yield command_data
+    
+    def _process_batch(self, batch):
+        """Partiyi işle; SHUTDOWN görülürse False"""
+        keep_running = True
+        for command_data in self._coalesce(batch):
+            if command_data.get('command') == 'SHUTDOWN':
+                keep_running = False
+                continue
+            self._process_audio_command(command_data)
+        
+        for _ in batch:
+            self.audio_queue.task_done()
+        return keep_running
     
     def _audio_loop(self):
         """Audio thread ana döngüsü"""
@@ -130,21 +573,21 @@ class AudioManager:
         
         while self.running:
             try:
-                # Komut al
-                command_data = self.audio_queue.get(timeout=0.1)
+                # Sıralayıcı çalışırken kuyruğu sık kontrol et
+                timeout = self.SEQUENCER_POLL_INTERVAL if self.sequencer.active else 0.1
                 
-                # Shutdown kontrolü
-                if command_data.get('command') == 'SHUTDOWN':
-                    break
+                # İlk komutu bekle, sonra birikenleri topla
+                command_data = self.audio_queue.get(timeout=timeout)
                 
-                # Komutu işle
-                self._process_audio_command(command_data)
+                # Aynı anda gelen tetiklemeler birleştirilip işlenir
+                if not self._process_batch(self._drain(command_data)):
+                    break
                 
-                # İşlem tamamlandı
-                self.audio_queue.task_done()
+                self.sequencer.service()
                 
             except queue.Empty:
                 # Timeout - normal durum
+                self.sequencer.service()
                 self._check_music_status()  # Müzik durumunu kontrol et
                 continue
             except Exception as e:
@@ -153,6 +596,30 @@ class AudioManager:
         
         print("🔇 Audio thread döngüsü sonlandı")
     
+    def dispatch_pending(self, max_commands=None):
+        """
+        Kuyrukta bekleyen komutları çağıran thread'de işle (thread'siz mod)
+        
+        Args:
+            max_commands: Bu çağrıda işlenecek en fazla komut (None = hepsi)
+            
+        Returns:
+            int: İşlenen komut sayısı
+        """
+        batch = []
+        while max_commands is None or len(batch) < max_commands:
+            try:
+                batch.append(self.audio_queue.get(block=False))
+            except queue.Empty:
+                break
+        
+        # Frame boyunca biriken aynı tetiklemeler tek sese indirgenir
+        self._process_batch(batch)
+        self.sequencer.service()
+        
+        self._check_music_status()
+        return len(batch)
+    
     def _process_audio_command(self, command_data):
         """Audio komutunu işle"""
         try:
@@ -161,6 +628,10 @@ class AudioManager:
             
             if command == AudioCommand.PLAY_SOUND:
                 self._play_sound_effect(data)
+            elif command == AudioCommand.STOP_SOUND:
+                self._stop_sound_effect(data)
+            elif command == AudioCommand.SEQUENCER:
+                self._sequencer_command(data)
             elif command == AudioCommand.PLAY_MUSIC:
                 self._play_background_music(data)
             elif command == AudioCommand.STOP_MUSIC:
@@ -176,26 +647,78 @@ class AudioManager:
             print(f"❌ Audio komut işleme hatası: {e}")
     
     def _play_sound_effect(self, data):
-        """Ses efekti çal"""
+        """Ses efektini kategorisinin kanal havuzunda çal"""
         sound_path = data.get('path')
-        volume = data.get('volume', 1.0)
+        volume = data.get('volume', 1.0) * self.sfx_volume * self.master_volume
+        priority = data.get('priority', 0)
         
         try:
-            # Cache'den kontrol et
-            if sound_path in self.sound_cache:
-                sound = self.sound_cache[sound_path]
-            else:
-                # Yükle ve cache'e ekle
-                sound = pygame.mixer.Sound(sound_path)
-                self.sound_cache[sound_path] = sound
+            sound = self.sound_bank.get(sound_path)
+            if sound is None:
+                return
             
-            # Volume ayarla ve çal
-            sound.set_volume(volume)
-            sound.play()
+            category = data.get('category') or self.sound_bank.category_of(sound_path)
+            channel_index = self._acquire_channel(category, priority)
+            if channel_index is None:
+                self.stats['voice_dropped'] += 1
+                return
+            
+            channel = self.backend.channel(channel_index)
+            channel.set_volume(volume)
+            channel.play(sound, loops=data.get('loops', 0))
+            
+            self._voice_sequence += 1
+            self._voices[channel_index] = (priority, self._voice_sequence)
+            self._voice_paths[channel_index] = sound_path
+            self.stats['played'] += 1
             
         except Exception as e:
             print(f"❌ Ses efekti çalma hatası ({sound_path}): {e}")
     
+    def _sequencer_command(self, data):
+        action = data.get('action')
+        if action == 'heartbeat':
+            self.sequencer.start_heartbeat(data['notes'], data['tempo'])
+        elif action == 'intro_loop':
+            self.sequencer.start_intro_loop(data.get('intro'), data.get('loop'))
+        elif action == 'tempo':
+            self.sequencer.set_tempo(data['tempo'])
+        elif action == 'stop':
+            self.sequencer.stop()
+    
+    def _stop_sound_effect(self, data):
+        """Belirli bir sesi veya bir kategorinin tüm kanallarını durdur"""
+        path = data.get('path')
+        category = data.get('category')
+        
+        if category is not None:
+            channels = self._category_channels[category]
+        else:
+            channels = [index for index, voice_path in self._voice_paths.items() if voice_path == path]
+        
+        for index in channels:
+            self.backend.channel(index).stop()
+            self._voices.pop(index, None)
+            self._voice_paths.pop(index, None)
+    
+    def _acquire_channel(self, category, priority):
+        """
+        Kategorinin boş kanalını döndür. Hepsi doluysa en düşük öncelikli
+        (eşitlikte en eski) sesi çalan kanal, yeni ses en az onun kadar
+        öncelikliyse çalınır; değilse None.
+        """
+        channels = self._category_channels[category]
+        for index in channels:
+            if not self.backend.channel(index).get_busy():
+                return index
+        
+        victim = min(channels, key=lambda index: self._voices.get(index, (0, 0)))
+        if self._voices.get(victim, (0, 0))[0] <= priority:
+            self.backend.channel(victim).stop()
+            self.stats['stolen'] += 1
+            return victim
+        return None
+    
     def _play_background_music(self, data):
         """Background müzik çal"""
         music_path = data.get('path')
@@ -204,16 +727,18 @@ class AudioManager:
         
         try:
             with self.audio_lock:
+                music = self.backend.music
+                
                 # Mevcut müziği durdur
-                pygame.mixer.music.stop()
+                music.stop()
                 
                 # Yeni müziği yükle
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(volume)
+                music.load(music_path)
+                music.set_volume(volume)
                 
                 # Çal
                 loops = -1 if loop else 0
-                pygame.mixer.music.play(loops)
+                music.play(loops)
                 
                 # Durumu kaydet
                 self.current_music = music_path
@@ -231,9 +756,9 @@ class AudioManager:
         try:
             with self.audio_lock:
                 if fade_time > 0:
-                    pygame.mixer.music.fadeout(int(fade_time * 1000))
+                    self.backend.music.fadeout(int(fade_time * 1000))
                 else:
-                    pygame.mixer.music.stop()
+                    self.backend.music.stop()
                 
                 self.current_music = None
                 print("🔇 Müzik durduruldu")
@@ -254,8 +779,8 @@ class AudioManager:
             elif volume_type == 'music':
                 self.music_volume = volume
                 # Şu anki müziğin volume'ünü güncelle
-                if pygame.mixer.music.get_busy():
-                    pygame.mixer.music.set_volume(volume * self.master_volume)
+                if self.backend.music.get_busy():
+                    self.backend.music.set_volume(volume * self.master_volume)
             
             print(f"🔊 {volume_type} volume: {volume:.2f}")
             
@@ -268,20 +793,15 @@ class AudioManager:
         
         loaded_count = 0
         for path in paths:
-            try:
-                if path not in self.sound_cache:
-                    sound = pygame.mixer.Sound(path)
-                    self.sound_cache[path] = sound
-                    loaded_count += 1
-            except Exception as e:
-                print(f"❌ Ses yükleme hatası ({path}): {e}")
+            if self.sound_bank.load(path) is not None:
+                loaded_count += 1
         
         print(f"📦 {loaded_count} ses dosyası cache'e yüklendi")
     
     def _check_music_status(self):
         """Müzik durumunu kontrol et (döngüde)"""
         try:
-            if self.current_music and not pygame.mixer.music.get_busy():
+            if self.current_music and not self.backend.music.get_busy():
                 # Müzik bitti, bilgiyi temizle
                 self.current_music = None
                 
@@ -0,0 +1,705 @@
+# src/batch_simulator.py
+import os
+import re
+import numpy as np
+from src.config_manager import ConfigManager
+from src.constants import Constants
+
+# Yön kodları - AIAction ile aynı sıra (MOVE_UP=0 ... MOVE_RIGHT=3)
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+SHOOT = 4
+NO_ACTION = 5
+
+DIR_X = np.array([0, 0, -1, 1], dtype=np.int64)
+DIR_Y = np.array([-1, 1, 0, 0], dtype=np.int64)
+REVERSE = np.array([DOWN, UP, RIGHT, LEFT], dtype=np.int64)
+
+CELL_WIDTH = 12
+CELL_HEIGHT = 10
+SPRITE_PIVOT = 4
+
+# Bir hücreden komşusuna yön başına piksel mesafesi
+SEGMENT_LENGTH = np.array([CELL_HEIGHT, CELL_HEIGHT, CELL_WIDTH, CELL_WIDTH], dtype=np.float64)
+
+# Level ile aynı sabitler
+CANT_MOVE_RIGHT = 1
+CANT_MOVE_DOWN = 2
+TUNNEL_Y = 3
+TUNNEL_LEFT_X = 1
+TUNNEL_RIGHT_X = 11
+TUNNEL_COOLDOWN = 2.0
+TIME_BETWEEN_ACCELERATIONS = 10
+MAX_THRESHOLDS = 4
+
+# Kafes konumları: P1 ve P2
+CAGE_CELLS = ((11, 7), (1, 7))
+
+# Gözlem kanalları
+OBS_WALL_RIGHT = 0
+OBS_WALL_DOWN = 1
+OBS_PLAYER1 = 2
+OBS_PLAYER2 = 3
+OBS_ENEMIES = 4
+OBS_PLAYER_BULLETS = 5
+OBS_ENEMY_BULLETS = 6
+OBS_CHANNELS = 7
+
+
+class LevelTables:
+    """
+    Level ızgara kurallarının vektörel hali.
+    can_move, tünel ve has_pixel kuralları Level sınıfıyla birebir aynıdır;
+    tablolar bir kez hesaplanır, sonra dizi indekslemesiyle okunur.
+    """
+
+    def __init__(self, grid, name=None):
+        self.name = name
+        self.grid = np.asarray(grid, dtype=np.int64)
+        self.height, self.width = self.grid.shape
+
+        self.wall_right = (self.grid & CANT_MOVE_RIGHT) != 0
+        self.wall_down = (self.grid & CANT_MOVE_DOWN) != 0
+
+        # (H, W, 4) - UP, DOWN, LEFT, RIGHT
+        can_move = np.zeros((self.height, self.width, 4), dtype=bool)
+        can_move[:, :, RIGHT] = ~self.wall_right
+        can_move[:, self.width - 1, RIGHT] = False
+        can_move[:, :, DOWN] = ~self.wall_down
+        can_move[self.height - 1, :, DOWN] = False
+        can_move[:, 1:, LEFT] = ~self.wall_right[:, :-1]
+        can_move[1:, :, UP] = ~self.wall_down[:-1, :]
+
+        # Level.can_move: ilk satır/sütundaki hücrelerde hareket yok
+        can_move[0, :, :] = False
+        can_move[:, 0, :] = False
+        self.can_move = can_move
+
+    @classmethod
+    def from_level(cls, level):
+        """Yüklü bir Level örneğinden tablo oluştur"""
+        return cls(level._grid, level.name)
+
+    @classmethod
+    def from_file(cls, path):
+        """Level dosyasını pygame olmadan oku (Level._load_level_data ile aynı format)"""
+        grid = []
+        with open(path, 'r') as file:
+            for line in file:
+                line = line.strip()
+                if not line or line.startswith('--'):
+                    continue
+                grid.append([int(char) if char.isdigit() else 0 for char in line])
+
+        return cls(grid, os.path.splitext(os.path.basename(path))[0])
+
+    @property
+    def pixel_width(self):
+        return self.width * CELL_WIDTH
+
+    @property
+    def pixel_height(self):
+        # Level.pixel_height radar alanını da içerir
+        return self.height * CELL_HEIGHT + (self.height + 1) * 2
+
+
+def load_level_tables(directory='.'):
+    """Dizindeki Level*.txt dosyalarını doğal sırayla yükle"""
+    files = [f for f in os.listdir(directory) if f.startswith('Level') and f.endswith('.txt')]
+
+    def natural_sort_key(filename):
+        numbers = re.findall(r'\d+', filename)
+        return int(numbers[0]) if numbers else 0
+
+    files.sort(key=natural_sort_key)
+    return [LevelTables.from_file(os.path.join(directory, f)) for f in files]
+
+
+class BatchSimulator:
+    """
+    N bağımsız Wizard of Wor oyununu aynı anda adımlayan vektörel simülatör.
+
+    Oyuncu, düşman ve mermi durumları (oyun, varlık) boyutlu NumPy dizilerinde
+    tutulur; step(actions) tüm oyunları tek çağrıda bir frame ilerletir.
+    Oyun kuralları ana oyunla aynıdır: oyuncular ızgarada hücre hücre atlar,
+    düşmanlar hücreler arasında piksel piksel yürür ve kavşaklarda rastgele
+    yön seçer, tüneller TUNNEL_COOLDOWN'da bir açılıp kapanır.
+    Burwor/Garwor/Thorwor ayrımı yapılmaz; her düşman enemy_score puan verir.
+    """
+
+    # Oyun başına durumun tamamı - get_state/set_state yalnızca bu dizileri kopyalar
+    STATE_FIELDS = (
+        'level_index', 'frame', 'time', 'tunnel_timer', 'tunnels_open', 'start_threshold', 'done', 'won',
+        'p_cell', 'p_dir', 'p_visible', 'p_in_cage', 'p_cage_time', 'p_respawn', 'p_lives',
+        'p_cooldown', 'p_prev_fire', 'p_score', 'pb_pos', 'pb_vel', 'pb_alive',
+        'e_cell', 'e_dir', 'e_progress', 'e_alive', 'eb_pos', 'eb_vel', 'eb_alive', 'eb_owner',
+    )
+
+    def __init__(self, num_games, levels=None, num_players=1, num_enemies=6,
+                 max_enemy_bullets=None, enemies_can_fire=True, frame_time=1.0 / 60,
+                 max_frames=None, auto_reset=True, seed=None):
+        """
+        Args:
+            num_games: Paralel oyun sayısı (N)
+            levels: LevelTables listesi (None = çalışma dizinindeki Level*.txt)
+            num_players: Oyun başına oyuncu (1 veya 2)
+            num_enemies: Oyun başına düşman
+            max_enemy_bullets: Oyun başına aynı anda düşman mermisi (None = config)
+            enemies_can_fire: Düşmanlar ateş edebilir mi (oyunda ilk seviyelerde kapalı)
+            frame_time: Bir adımın süresi (saniye)
+            max_frames: Bu kadar frame sonra oyun biter (None = sınırsız)
+            auto_reset: Biten oyunlar step sonunda otomatik sıfırlanır
+            seed: Rastgelelik tohumu
+        """
+        if levels is None:
+            levels = load_level_tables()
+        if not levels:
+            raise ValueError("BatchSimulator en az bir level gerektirir")
+
+        self.num_games = num_games
+        self.num_players = num_players
+        self.num_enemies = num_enemies
+        self.frame_time = frame_time
+        self.max_frames = max_frames
+        self.auto_reset = auto_reset
+        self.enemies_can_fire = enemies_can_fire
+        self._rng = np.random.default_rng(seed)
+
+        self.levels = levels
+        self._can_move = np.stack([level.can_move for level in levels])
+        self._wall_right = np.stack([level.wall_right for level in levels])
+        self._wall_down = np.stack([level.wall_down for level in levels])
+        self.grid_height, self.grid_width = levels[0].height, levels[0].width
+        self._pixel_width = levels[0].pixel_width
+        self._pixel_height = levels[0].pixel_height
+
+        self._load_config(max_enemy_bullets)
+        self._build_spawn_cells()
+        self._allocate()
+        self.reset()
+
+    def _load_config(self, max_enemy_bullets):
+        get = ConfigManager.get_config
+        speeds = [
+            get(Constants.ENEMY_SPEED_1, Constants.DEFAULT_ENEMY_SPEED_1),
+            get(Constants.ENEMY_SPEED_2, Constants.DEFAULT_ENEMY_SPEED_2),
+            get(Constants.ENEMY_SPEED_3, Constants.DEFAULT_ENEMY_SPEED_3),
+            get(Constants.ENEMY_SPEED_4, Constants.DEFAULT_ENEMY_SPEED_4),
+            get(Constants.ENEMY_SPEED_5, Constants.DEFAULT_ENEMY_SPEED_5),
+        ]
+        # Enemy.move ile aynı adım formülü (60 FPS frame başına piksel)
+        steps = np.clip(0.4 * np.asarray(speeds, dtype=np.float64) / 40.0, 0.25, 0.8)
+        self._enemy_steps = steps * (self.frame_time * 60.0)
+
+        self.player_bullet_speed = get(Constants.PLAYER_BULLET_SPEED, Constants.DEFAULT_PLAYER_BULLET_SPEED)
+        self.enemy_bullet_speed = get(Constants.ENEMY_BULLET_SPEED, Constants.DEFAULT_ENEMY_BULLET_SPEED)
+        self.max_lives = get(Constants.PLAYER_MAX_LIVES, Constants.DEFAULT_PLAYER_MAX_LIVES)
+        self.time_in_cage = get(Constants.PLAYER_TIME_IN_CAGE, Constants.DEFAULT_PLAYER_TIME_IN_CAGE)
+        self.enemy_score = get(Constants.BURWOR_SCORE, Constants.DEFAULT_BURWOR_SCORE)
+        self.other_player_score = get(Constants.OTHER_PLAYER_SCORE, Constants.DEFAULT_OTHER_PLAYER_SCORE)
+
+        if max_enemy_bullets is None:
+            max_enemy_bullets = get(Constants.ENEMY_MAX_BULLETS, Constants.DEFAULT_ENEMY_MAX_BULLETS)
+        self.max_enemy_bullets = max(1, max_enemy_bullets)
+
+        # Oyundaki 0.08 sn hareket bekleme süresinin frame karşılığı
+        self._cooldown_frames = max(1, int(np.ceil(0.08 / self.frame_time - 1e-9)))
+
+        self._cage = np.array(CAGE_CELLS[:self.num_players], dtype=np.int64)
+        # to_cage: kafesten seviyenin ortasına bak
+        self._cage_dir = np.where(5 - self._cage[:, 0] >= 0, RIGHT, LEFT)
+
+    def _build_spawn_cells(self):
+        # Level.get_random_position(avoid_player_exits=True) ile aynı bölge
+        cells = []
+        for y in range(1, 7):
+            for x in range(1, 12):
+                near_p1_exit = abs(x - 11) <= 1 and abs(y - 6) <= 1
+                near_p2_exit = abs(x - 1) <= 1 and abs(y - 6) <= 1
+                if not near_p1_exit and not near_p2_exit:
+                    cells.append((x, y))
+        self._spawn_cells = np.array(cells, dtype=np.int64)
+
+    def _allocate(self):
+        n, p, e, b = self.num_games, self.num_players, self.num_enemies, self.max_enemy_bullets
+
+        self.level_index = np.zeros(n, dtype=np.int64)
+        self.frame = np.zeros(n, dtype=np.int64)
+        self.time = np.zeros(n, dtype=np.float64)
+        self.tunnel_timer = np.zeros(n, dtype=np.float64)
+        self.tunnels_open = np.ones(n, dtype=bool)
+        self.start_threshold = np.zeros(n, dtype=np.int64)
+        self.done = np.zeros(n, dtype=bool)
+        self.won = np.zeros(n, dtype=bool)
+
+        # Oyuncular
+        self.p_cell = np.zeros((n, p, 2), dtype=np.int64)
+        self.p_dir = np.zeros((n, p), dtype=np.int64)
+        self.p_visible = np.zeros((n, p), dtype=bool)
+        self.p_in_cage = np.zeros((n, p), dtype=bool)
+        self.p_cage_time = np.zeros((n, p), dtype=np.float64)
+        self.p_respawn = np.zeros((n, p), dtype=np.float64)
+        self.p_lives = np.zeros((n, p), dtype=np.int64)
+        self.p_cooldown = np.zeros((n, p), dtype=np.int64)
+        self.p_prev_fire = np.zeros((n, p), dtype=bool)
+        self.p_score = np.zeros((n, p), dtype=np.int64)
+
+        # Oyuncu mermileri - oyuncu başına bir
+        self.pb_pos = np.zeros((n, p, 2), dtype=np.float64)
+        self.pb_vel = np.zeros((n, p, 2), dtype=np.float64)
+        self.pb_alive = np.zeros((n, p), dtype=bool)
+
+        # Düşmanlar - hücre + yön + hücreler arası ilerleme (piksel)
+        self.e_cell = np.zeros((n, e, 2), dtype=np.int64)
+        self.e_dir = np.zeros((n, e), dtype=np.int64)
+        self.e_progress = np.zeros((n, e), dtype=np.float64)
+        self.e_alive = np.zeros((n, e), dtype=bool)
+
+        # Düşman mermileri
+        self.eb_pos = np.zeros((n, b, 2), dtype=np.float64)
+        self.eb_vel = np.zeros((n, b, 2), dtype=np.float64)
+        self.eb_alive = np.zeros((n, b), dtype=bool)
+        self.eb_owner = np.zeros((n, b), dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Sıfırlama
+    # ------------------------------------------------------------------
+
+    def reset(self, game_ids=None, level_index=None, stage=0):
+        """
+        Seçilen oyunları baştan başlat
+
+        Args:
+            game_ids: Sıfırlanacak oyun indeksleri (None = hepsi)
+            level_index: Level indeksi - tek değer veya oyun başına dizi (None = rastgele)
+            stage: Başlangıç aşaması (düşman hız eşiğini belirler)
+        """
+        if game_ids is None:
+            game_ids = np.arange(self.num_games)
+        game_ids = np.asarray(game_ids, dtype=np.int64)
+        count = len(game_ids)
+        if count == 0:
+            return
+
+        if level_index is None:
+            self.level_index[game_ids] = self._rng.integers(0, len(self.levels), count)
+        else:
+            self.level_index[game_ids] = level_index
+
+        self.frame[game_ids] = 0
+        self.time[game_ids] = 0.0
+        self.tunnel_timer[game_ids] = 0.0
+        self.tunnels_open[game_ids] = True
+        self.start_threshold[game_ids] = min(MAX_THRESHOLDS, stage // 2)
+        self.done[game_ids] = False
+        self.won[game_ids] = False
+
+        # Oyuncular kafeste başlar
+        self.p_cell[game_ids] = self._cage
+        self.p_dir[game_ids] = self._cage_dir
+        self.p_visible[game_ids] = True
+        self.p_in_cage[game_ids] = True
+        self.p_cage_time[game_ids] = 0.0
+        self.p_respawn[game_ids] = 0.0
+        self.p_lives[game_ids] = self.max_lives
+        self.p_cooldown[game_ids] = 0
+        self.p_prev_fire[game_ids] = False
+        self.p_score[game_ids] = 0
+        self.pb_alive[game_ids] = False
+
+        # Düşmanlar rastgele hücrelerde, rastgele geçerli yönle
+        picks = self._rng.integers(0, len(self._spawn_cells), (count, self.num_enemies))
+        self.e_cell[game_ids] = self._spawn_cells[picks]
+        self.e_dir[game_ids] = self._rng.integers(0, 4, (count, self.num_enemies))
+        self.e_progress[game_ids] = 0.0
+        self.e_alive[game_ids] = True
+        self.eb_alive[game_ids] = False
+
+        mask = np.zeros((self.num_games, self.num_enemies), dtype=bool)
+        mask[game_ids] = True
+        self._pick_enemy_directions(mask, allow_reverse=True)
+
+    # ------------------------------------------------------------------
+    # Durum kopyalama
+    # ------------------------------------------------------------------
+
+    def empty_state(self, count=1):
+        """Sıfırlarla dolu, count oyunluk durum sözlüğü (dışarıdan doldurmak için)"""
+        return {name: np.zeros((count,) + getattr(self, name).shape[1:], dtype=getattr(self, name).dtype)
+                for name in self.STATE_FIELDS}
+
+    def get_state(self, game_ids=None):
+        """
+        Seçilen oyunların durumunun kopyası
+
+        Returns:
+            dict: alan adı -> dizi (ilk boyut oyun); set_state ile geri yüklenir
+        """
+        if game_ids is None:
+            game_ids = slice(None)
+        return {name: getattr(self, name)[game_ids].copy() for name in self.STATE_FIELDS}
+
+    def set_state(self, state, game_ids=None):
+        """
+        get_state/empty_state çıktısını seçilen oyunlara yaz.
+        Tek oyunluk durum tüm game_ids'e yayılır (rollout klonlama).
+        """
+        if game_ids is None:
+            game_ids = slice(None)
+        for name in self.STATE_FIELDS:
+            getattr(self, name)[game_ids] = state[name]
+
+    # ------------------------------------------------------------------
+    # Adım
+    # ------------------------------------------------------------------
+
+    def step(self, actions):
+        """
+        Tüm oyunları bir frame ilerlet
+
+        Args:
+            actions: (N, P) int dizisi - AIAction değerleri (0-5)
+
+        Returns:
+            tuple: (rewards (N, P) skor artışı, dones (N,) bool)
+        """
+        actions = np.asarray(actions, dtype=np.int64).reshape(self.num_games, self.num_players)
+        running = ~self.done
+        score_before = self.p_score.copy()
+        dt = self.frame_time
+
+        self.frame += running
+        self.time += np.where(running, dt, 0.0)
+
+        # Tüneller
+        self.tunnel_timer += np.where(running, dt, 0.0)
+        toggle = self.tunnel_timer > TUNNEL_COOLDOWN
+        self.tunnels_open ^= toggle
+        self.tunnel_timer -= np.where(toggle, TUNNEL_COOLDOWN, 0.0)
+
+        self._update_players(actions, running)
+        self._update_enemies(running)
+        self._enemy_fire(running)
+        self._update_bullets(running)
+        self._resolve_collisions(running)
+
+        # Bitiş koşulları
+        no_enemies = ~self.e_alive.any(axis=1)
+        players_out = ~(self.p_visible | (self.p_respawn > 0)).any(axis=1)
+        timed_out = (self.frame >= self.max_frames) if self.max_frames is not None else np.zeros_like(self.done)
+
+        finished = running & (no_enemies | players_out | timed_out)
+        self.won |= finished & no_enemies
+        self.done |= finished
+
+        rewards = (self.p_score - score_before).astype(np.float64)
+        dones = self.done.copy()
+
+        if self.auto_reset and finished.any():
+            self.reset(np.nonzero(finished)[0])
+
+        return rewards, dones
+
+    def _update_players(self, actions, running):
+        dt = self.frame_time
+        fire_down = actions == SHOOT
+        newly_fired = fire_down & ~self.p_prev_fire
+        self.p_prev_fire = fire_down
+
+        # Ölen oyuncular 1 sn sonra kafese döner (canı kaldıysa)
+        waiting = running[:, None] & ~self.p_visible & (self.p_respawn > 0)
+        self.p_respawn -= np.where(waiting, dt, 0.0)
+        back = waiting & (self.p_respawn <= 0)
+        self.p_respawn[back] = 0.0
+        to_cage = back & (self.p_lives >= 0)
+        if to_cage.any():
+            cage = np.broadcast_to(self._cage, self.p_cell.shape)
+            self.p_cell[to_cage] = cage[to_cage]
+            self.p_dir[to_cage] = np.broadcast_to(self._cage_dir, self.p_dir.shape)[to_cage]
+            self.p_visible[to_cage] = True
+            self.p_in_cage[to_cage] = True
+            self.p_cage_time[to_cage] = 0.0
+
+        # Kafesten çıkış: hareket tuşu veya süre dolumu
+        in_cage = running[:, None] & self.p_visible & self.p_in_cage
+        self.p_cage_time += np.where(in_cage, dt, 0.0)
+        leave = in_cage & ((actions < SHOOT) | (self.p_cage_time >= self.time_in_cage))
+        if leave.any():
+            self.p_in_cage[leave] = False
+            self.p_cell[leave, 1] -= 1
+
+        # Girdi 0.08 sn'de bir işlenir (oyundaki movement_cooldown)
+        active = running[:, None] & self.p_visible & ~self.p_in_cage & ~leave
+        self.p_cooldown = np.maximum(self.p_cooldown - 1, 0)
+        process = active & (self.p_cooldown == 0)
+        self.p_cooldown[process] = self._cooldown_frames
+
+        # Ateş - hareketten önce, mermi yoksa
+        fire = process & newly_fired & ~self.pb_alive
+        if fire.any():
+            pivot = self.p_cell * np.array([CELL_WIDTH, CELL_HEIGHT]) + SPRITE_PIVOT
+            direction = np.stack([DIR_X[self.p_dir], DIR_Y[self.p_dir]], axis=-1)
+            self.pb_pos[fire] = pivot[fire]
+            self.pb_vel[fire] = direction[fire] * self.player_bullet_speed
+            self.pb_alive[fire] = True
+
+        # Hareket - farklı yöne basış önce sadece döndürür
+        move = process & (actions < SHOOT)
+        if move.any():
+            direction = np.clip(actions, 0, 3)
+            level = np.broadcast_to(self.level_index[:, None], direction.shape)
+            allowed = self._can_move[level, self.p_cell[..., 1], self.p_cell[..., 0], direction]
+            go = move & allowed
+            step = go & (self.p_dir == direction)
+            self.p_dir = np.where(go, direction, self.p_dir)
+            self.p_cell[..., 0] += np.where(step, DIR_X[direction], 0)
+            self.p_cell[..., 1] += np.where(step, DIR_Y[direction], 0)
+
+    def _update_enemies(self, running):
+        threshold = np.minimum(self.start_threshold + (self.time // TIME_BETWEEN_ACCELERATIONS).astype(np.int64), MAX_THRESHOLDS)
+        step = self._enemy_steps[threshold]
+
+        moving = self.e_alive & running[:, None]
+        self.e_progress += np.where(moving, step[:, None], 0.0)
+
+        segment = SEGMENT_LENGTH[self.e_dir]
+        arrived = moving & (self.e_progress >= segment)
+        if not arrived.any():
+            return
+
+        self.e_progress = np.where(arrived, self.e_progress - segment, self.e_progress)
+        self.e_cell[..., 0] += np.where(arrived, DIR_X[self.e_dir], 0)
+        self.e_cell[..., 1] += np.where(arrived, DIR_Y[self.e_dir], 0)
+        self._pick_enemy_directions(arrived)
+
+    def _pick_enemy_directions(self, mask, allow_reverse=False):
+        """Hücreye varan düşmanlar için yeni yön seç (Level.pick_possible_direction'ın vektörel hali)"""
+        games, enemies = np.nonzero(mask)
+        if len(games) == 0:
+            return
+
+        cell_x = self.e_cell[games, enemies, 0]
+        cell_y = self.e_cell[games, enemies, 1]
+        current = self.e_dir[games, enemies]
+
+        allowed = self._can_move[self.level_index[games], cell_y, cell_x].copy()
+
+        # Açık tünel, yatay çıkışı mümkün kılar
+        at_tunnel_row = self.tunnels_open[games] & (cell_y == TUNNEL_Y)
+        tunnel_left = at_tunnel_row & (cell_x == TUNNEL_LEFT_X)
+        tunnel_right = at_tunnel_row & (cell_x == TUNNEL_RIGHT_X)
+        allowed[:, LEFT] |= tunnel_left
+        allowed[:, RIGHT] |= tunnel_right
+
+        candidates = allowed.copy()
+        if not allow_reverse:
+            candidates[np.arange(len(games)), REVERSE[current]] = False
+
+        choice, has_choice = self._choose(candidates)
+        new_dir = np.where(has_choice, choice, REVERSE[current])
+
+        # Tünelden geçen düşman karşı tünele ışınlanır, yönünü korur
+        through = (tunnel_left & (new_dir == LEFT)) | (tunnel_right & (new_dir == RIGHT))
+        self.e_cell[games, enemies, 0] = np.where(
+            through, np.where(new_dir == LEFT, TUNNEL_RIGHT_X, TUNNEL_LEFT_X), cell_x
+        )
+        self.e_progress[games, enemies] = np.where(through, 0.0, self.e_progress[games, enemies])
+        self.e_dir[games, enemies] = new_dir
+
+    def _choose(self, mask):
+        """Her satırda True olan yönlerden eşit olasılıkla birini seç"""
+        count = mask.sum(axis=-1)
+        pick = np.floor(self._rng.random(count.shape) * count).astype(np.int64)
+        cumulative = np.cumsum(mask, axis=-1)
+        choice = np.argmax(cumulative > pick[..., None], axis=-1)
+        return choice, count > 0
+
+    def _enemy_fire(self, running):
+        if not self.enemies_can_fire:
+            return
+
+        free_slot = ~self.eb_alive
+        targetable = self.p_visible & ~self.p_in_cage
+        can_spawn = running & free_slot.any(axis=1) & targetable.any(axis=1)
+        if not can_spawn.any():
+            return
+
+        enemy_x, enemy_y = self.enemy_pixel_positions()
+        player_x, player_y = self.player_pixel_positions()
+
+        dx = DIR_X[self.e_dir][:, :, None]
+        dy = DIR_Y[self.e_dir][:, :, None]
+        diff_x = player_x[:, None, :] - enemy_x[:, :, None]
+        diff_y = player_y[:, None, :] - enemy_y[:, :, None]
+
+        # Enemy.can_fire_at_player: aynı hizada ve oyuncuya dönük
+        horizontal = (dx != 0) & (diff_y == 0) & (np.where(diff_x >= 0, 1, -1) == dx)
+        vertical = (dy != 0) & (diff_x == 0) & (np.where(diff_y >= 0, 1, -1) == dy)
+        aligned = (horizontal | vertical) & targetable[:, None, :]
+
+        # Sahip başına bir mermi
+        owns_bullet = np.zeros_like(self.e_alive)
+        games, slots = np.nonzero(self.eb_alive)
+        owns_bullet[games, self.eb_owner[games, slots]] = True
+
+        shooters = aligned.any(axis=2) & self.e_alive & ~owns_bullet & can_spawn[:, None]
+        firing = shooters.any(axis=1)
+        if not firing.any():
+            return
+
+        games = np.nonzero(firing)[0]
+        shooter = np.argmax(shooters[games], axis=1)
+        slot = np.argmax(free_slot[games], axis=1)
+        direction = self.e_dir[games, shooter]
+
+        self.eb_pos[games, slot, 0] = enemy_x[games, shooter] + SPRITE_PIVOT
+        self.eb_pos[games, slot, 1] = enemy_y[games, shooter] + SPRITE_PIVOT
+        self.eb_vel[games, slot, 0] = DIR_X[direction] * self.enemy_bullet_speed
+        self.eb_vel[games, slot, 1] = DIR_Y[direction] * self.enemy_bullet_speed
+        self.eb_alive[games, slot] = True
+        self.eb_owner[games, slot] = shooter
+
+    def _update_bullets(self, running):
+        dt = self.frame_time
+        for position, velocity, alive in ((self.pb_pos, self.pb_vel, self.pb_alive),
+                                          (self.eb_pos, self.eb_vel, self.eb_alive)):
+            moving = alive & running[:, None]
+            if not moving.any():
+                continue
+            position += np.where(moving[..., None], velocity * dt, 0.0)
+
+            pixel_x = np.floor(position[..., 0]).astype(np.int64)
+            pixel_y = np.floor(position[..., 1]).astype(np.int64)
+            level = np.broadcast_to(self.level_index[:, None], pixel_x.shape)
+            blocked = ~self.is_inside_walls(pixel_x, pixel_y) | self.has_pixel(level, pixel_x, pixel_y)
+            alive &= ~(moving & blocked)
+
+    def _resolve_collisions(self, running):
+        enemy_x, enemy_y = self.enemy_pixel_positions()
+        player_x, player_y = self.player_pixel_positions()
+        killed_players = np.zeros_like(self.p_visible)
+
+        # Oyuncu mermileri -> düşmanlar ve diğer oyuncu
+        bullet_x = np.floor(self.pb_pos[..., 0]).astype(np.int64)
+        bullet_y = np.floor(self.pb_pos[..., 1]).astype(np.int64)
+        games = np.arange(self.num_games)
+
+        for player in range(self.num_players):
+            alive = self.pb_alive[:, player] & running
+            if not alive.any():
+                continue
+
+            hits = (alive[:, None] & self.e_alive &
+                    self._test_hit(bullet_x[:, player, None], bullet_y[:, player, None], enemy_x, enemy_y))
+            hit_any = hits.any(axis=1)
+            if hit_any.any():
+                target = np.argmax(hits, axis=1)
+                self.e_alive[games[hit_any], target[hit_any]] = False
+                self.p_score[hit_any, player] += self.enemy_score
+                self.pb_alive[hit_any, player] = False
+
+            for other in range(self.num_players):
+                if other == player:
+                    continue
+                friendly = (self.pb_alive[:, player] & running & self.p_visible[:, other] &
+                            self._test_hit(bullet_x[:, player], bullet_y[:, player], player_x[:, other], player_y[:, other]))
+                self.p_score[friendly, player] += self.other_player_score
+                self.pb_alive[friendly, player] = False
+                killed_players[friendly, other] = True
+
+        # Düşman mermileri -> oyuncular
+        if self.eb_alive.any():
+            bullet_x = np.floor(self.eb_pos[..., 0]).astype(np.int64)
+            bullet_y = np.floor(self.eb_pos[..., 1]).astype(np.int64)
+            hits = (self.eb_alive[:, :, None] & self.p_visible[:, None, :] & running[:, None, None] &
+                    self._test_hit(bullet_x[:, :, None], bullet_y[:, :, None], player_x[:, None, :], player_y[:, None, :]))
+            killed_players |= hits.any(axis=1)
+            self.eb_alive &= ~hits.any(axis=2)
+
+        # Düşmana temas
+        contact = (self.e_alive[:, :, None] & self.p_visible[:, None, :] & running[:, None, None] &
+                   (np.abs(enemy_x[:, :, None] - player_x[:, None, :]) <= 2) &
+                   (np.abs(enemy_y[:, :, None] - player_y[:, None, :]) <= 2))
+        killed_players |= contact.any(axis=1)
+
+        if killed_players.any():
+            self.p_lives[killed_players] -= 1
+            self.p_visible[killed_players] = False
+            self.p_in_cage[killed_players] = False
+            self.p_respawn[killed_players] = 1.0
+            self.pb_alive[killed_players] = False
+
+    @staticmethod
+    def _test_hit(bullet_x, bullet_y, target_x, target_y):
+        # Bullet.test_hit ile aynı: hedef sprite'ının pivot kutusu
+        return ((np.abs(target_x - bullet_x + SPRITE_PIVOT) <= SPRITE_PIVOT) &
+                (np.abs(target_y - bullet_y + SPRITE_PIVOT) <= SPRITE_PIVOT))
+
+    # ------------------------------------------------------------------
+    # Vektörel Level kuralları
+    # ------------------------------------------------------------------
+
+    def has_pixel(self, level, x, y):
+        """Level.has_pixel'in vektörel hali"""
+        on_screen = (x >= 0) & (y >= 0) & (x < self._pixel_width) & (y < self._pixel_height)
+        cell_x = np.clip(x // CELL_WIDTH, 0, self.grid_width - 1)
+        cell_y = y // CELL_HEIGHT
+        valid_cell = cell_y < self.grid_height
+        cell_y = np.clip(cell_y, 0, self.grid_height - 1)
+
+        pixel_x = x % CELL_WIDTH
+        pixel_y = y % CELL_HEIGHT
+        right_wall = self._wall_right[level, cell_y, cell_x] & (pixel_x >= 10) & (pixel_x <= 12)
+        down_wall = self._wall_down[level, cell_y, cell_x] & (pixel_y >= 8) & (pixel_y <= 9)
+
+        return on_screen & (~valid_cell | right_wall | down_wall)
+
+    def is_inside_walls(self, x, y):
+        """Level.is_inside_walls'un vektörel hali"""
+        return ((x > CELL_WIDTH) & (y > CELL_HEIGHT) &
+                (x < (self.grid_width - 1) * CELL_WIDTH - 4) &
+                (y < (self.grid_height - 1) * CELL_HEIGHT))
+
+    # ------------------------------------------------------------------
+    # Okuma
+    # ------------------------------------------------------------------
+
+    def enemy_pixel_positions(self):
+        """(N, E) tamsayı piksel konumları"""
+        x = self.e_cell[..., 0] * CELL_WIDTH + DIR_X[self.e_dir] * self.e_progress
+        y = self.e_cell[..., 1] * CELL_HEIGHT + DIR_Y[self.e_dir] * self.e_progress
+        return np.floor(x).astype(np.int64), np.floor(y).astype(np.int64)
+
+    def player_pixel_positions(self):
+        """(N, P) tamsayı piksel konumları"""
+        return self.p_cell[..., 0] * CELL_WIDTH, self.p_cell[..., 1] * CELL_HEIGHT
+
+    def observation(self):
+        """
+        Izgara gözlem tensörü
+
+        Returns:
+            np.ndarray: (N, OBS_CHANNELS, H, W) uint8 - duvarlar, oyuncular, düşmanlar, mermiler
+        """
+        n, h, w = self.num_games, self.grid_height, self.grid_width
+        obs = np.zeros((n, OBS_CHANNELS, h, w), dtype=np.uint8)
+        obs[:, OBS_WALL_RIGHT] = self._wall_right[self.level_index]
+        obs[:, OBS_WALL_DOWN] = self._wall_down[self.level_index]
+
+        for player in range(self.num_players):
+            games = np.nonzero(self.p_visible[:, player])[0]
+            obs[games, OBS_PLAYER1 + player,
+                self.p_cell[games, player, 1], self.p_cell[games, player, 0]] = 1
+
+        enemy_x, enemy_y = self.enemy_pixel_positions()
+        self._scatter(obs, OBS_ENEMIES, self.e_alive, enemy_x + SPRITE_PIVOT, enemy_y + SPRITE_PIVOT)
+        self._scatter(obs, OBS_PLAYER_BULLETS, self.pb_alive, self.pb_pos[..., 0], self.pb_pos[..., 1])
+        self._scatter(obs, OBS_ENEMY_BULLETS, self.eb_alive, self.eb_pos[..., 0], self.eb_pos[..., 1])
+        return obs
+
+    def _scatter(self, obs, channel, alive, x, y):
+        games, index = np.nonzero(alive)
+        if len(games) == 0:
+            return
+        cell_x = np.clip((np.asarray(x)[games, index] // CELL_WIDTH).astype(np.int64), 0, self.grid_width - 1)
+        cell_y = np.clip((np.asarray(y)[games, index] // CELL_HEIGHT).astype(np.int64), 0, self.grid_height - 1)
+        np.add.at(obs, (games, channel, cell_y, cell_x), 1)
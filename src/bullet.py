@@ -2,6 +2,7 @@
 import math
 import pygame
 from enum import Enum
+from src.constants import Constants
 
 class BulletTargetTypes(Enum):
     PLAYER = 0
@@ -31,8 +32,34 @@ class Bullet:
     def target_type(self):
         return self._target_type
     
-    def update(self, delta_time):
-        self._position += self._velocity * delta_time
+    @property
+    def is_alive(self):
+        return self._origin.bullet is self
+    
+    @property
+    def velocity(self):
+        return self._velocity
+    
+    def update(self, delta_time, level=None):
+        """
+        Mermiyi ilerlet. level verilirse yol MAX_STEP_PIXELS'lık alt adımlara
+        bölünür ve duvara ilk değilen noktada durulur (duvar atlanmaz).
+        """
+        if level is None:
+            self._position += self._velocity * delta_time
+            return
+        
+        translation = self._velocity * delta_time
+        steps = max(1, math.ceil(max(abs(translation.x), abs(translation.y)) / Constants.MAX_STEP_PIXELS))
+        translation /= steps
+        for _ in range(steps):
+            self._position += translation
+            if (not level.is_inside_walls(self.pixel_position_x, self.pixel_position_y) or
+                level.has_pixel(self.pixel_position_x, self.pixel_position_y)):
+                break
+    
+    def kill(self):
+        self._origin.kill_bullet()
     
     def test_hit(self, character):
         distance_x = abs(character.pixel_position_x - self.pixel_position_x + character.sprite_sheet.sprite_pivot.x)
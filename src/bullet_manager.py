@@ -0,0 +1,318 @@
+# src/bullet_manager.py
+import math
+import pygame
+from src.bullet import BulletTargetTypes
+from src.constants import Constants
+
+class PooledBullet:
+    """Havuzdaki bir mermi slotuna bakan hafif tutamaç - Bullet ile aynı arayüz"""
+
+    __slots__ = ('_manager', '_slot', '_generation')
+
+    def __init__(self, manager, slot, generation):
+        self._manager = manager
+        self._slot = slot
+        self._generation = generation
+
+    @property
+    def is_alive(self):
+        # Slot yeniden kullanıldıysa eski tutamaç ölü sayılır
+        return self._manager._is_live(self._slot, self._generation)
+
+    @property
+    def origin(self):
+        return self._manager._owner[self._slot]
+
+    @property
+    def pixel_position_x(self):
+        return math.floor(self._manager._x[self._slot])
+
+    @property
+    def pixel_position_y(self):
+        return math.floor(self._manager._y[self._slot])
+
+    @property
+    def velocity(self):
+        return pygame.Vector2(self._manager._vx[self._slot], self._manager._vy[self._slot])
+
+    @property
+    def target_type(self):
+        return self._manager._target_type[self._slot]
+
+    def update(self, delta_time):
+        """Tek mermiyi ilerlet (toplu güncelleme için BulletManager.update kullanın)"""
+        if self.is_alive:
+            self._manager._x[self._slot] += self._manager._vx[self._slot] * delta_time
+            self._manager._y[self._slot] += self._manager._vy[self._slot] * delta_time
+
+    def test_hit(self, character):
+        return self.is_alive and self._manager._test_hit(self._slot, character)
+
+    def kill(self):
+        self._manager.release(self._slot, self._generation)
+
+    def draw(self, surface, display_offset_x=0, display_offset_y=0):
+        if not self.is_alive:
+            return
+        y_offset = 1
+        x_offset = 1
+        pygame.draw.rect(
+            surface,
+            self._manager._color[self._slot],
+            (self.pixel_position_x + display_offset_x + x_offset,
+             self.pixel_position_y + display_offset_y + y_offset,
+             1, 1)
+        )
+
+
+class BulletManager:
+    """
+    Havuzlu mermi deposu.
+    Mermi verileri paralel dizilerde (struct-of-arrays) tutulur, slotlar
+    önceden ayrılır ve tekrar kullanılır. Sahip başına ve global mermi
+    limitleri uygulanır; güncelleme ve çarpışma tek geçişte toplu yapılır.
+    """
+
+    DEFAULT_CAPACITY = 256
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, max_bullets=1, max_per_owner=1, cell_width=12, cell_height=10):
+        self._capacity = capacity
+        self._max_bullets = min(max_bullets, capacity)
+        self._max_per_owner = max_per_owner
+        self._cell_width = cell_width
+        self._cell_height = cell_height
+
+        # Paralel diziler - her indeks bir mermi slotu
+        self._x = [0.0] * capacity
+        self._y = [0.0] * capacity
+        self._vx = [0.0] * capacity
+        self._vy = [0.0] * capacity
+        self._alive = [False] * capacity
+        self._generation = [0] * capacity
+        self._owner = [None] * capacity
+        self._target_type = [BulletTargetTypes.PLAYER] * capacity
+        self._color = [(255, 255, 255)] * capacity
+        self._handles = [None] * capacity
+
+        # Boş slot yığını ve aktif slot listesi
+        self._free = list(range(capacity - 1, -1, -1))
+        self._active = []
+        # Slot -> _active içindeki sıra (O(1) takas-çıkar için)
+        self._active_index = [-1] * capacity
+
+        # Sahip -> aktif mermi sayısı
+        self._owner_counts = {}
+
+        self.stats = {
+            'spawned': 0,
+            'rejected': 0,
+            'released': 0,
+            'peak_active': 0
+        }
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def max_bullets(self):
+        return self._max_bullets
+
+    @property
+    def max_per_owner(self):
+        return self._max_per_owner
+
+    @property
+    def active_count(self):
+        return len(self._active)
+
+    def configure(self, max_bullets=None, max_per_owner=None):
+        """Global ve sahip başına limitleri ayarla (kapasiteyi aşamaz)"""
+        if max_bullets is not None:
+            self._max_bullets = max(0, min(max_bullets, self._capacity))
+        if max_per_owner is not None:
+            self._max_per_owner = max(0, max_per_owner)
+
+    def owner_count(self, owner):
+        return self._owner_counts.get(owner, 0)
+
+    def can_fire(self, owner):
+        """Global limit ve sahip limiti yeni bir mermiye izin veriyor mu?"""
+        return (len(self._active) < self._max_bullets and
+                self._owner_counts.get(owner, 0) < self._max_per_owner)
+
+    def spawn(self, owner, target_type, speed):
+        """Sahibin konumundan ve yönünden yeni mermi oluştur; limit doluysa None"""
+        if not self.can_fire(owner):
+            self.stats['rejected'] += 1
+            return None
+
+        slot = self._free.pop()
+        position = owner.position + owner.sprite_sheet.sprite_pivot
+
+        self._x[slot] = position.x
+        self._y[slot] = position.y
+        self._vx[slot] = owner.move_direction.x * speed
+        self._vy[slot] = owner.move_direction.y * speed
+        self._alive[slot] = True
+        self._generation[slot] += 1
+        self._owner[slot] = owner
+        self._target_type[slot] = target_type
+        self._color[slot] = owner.color
+
+        handle = PooledBullet(self, slot, self._generation[slot])
+        self._handles[slot] = handle
+        self._active_index[slot] = len(self._active)
+        self._active.append(slot)
+        self._owner_counts[owner] = self._owner_counts.get(owner, 0) + 1
+
+        self.stats['spawned'] += 1
+        if len(self._active) > self.stats['peak_active']:
+            self.stats['peak_active'] = len(self._active)
+
+        return handle
+
+    def owns(self, bullet):
+        return isinstance(bullet, PooledBullet) and bullet._manager is self and bullet.is_alive
+
+    def release(self, slot, generation=None):
+        """Slotu havuza geri ver; eski nesilden gelen istekleri yok say"""
+        if not self._alive[slot]:
+            return False
+        if generation is not None and generation != self._generation[slot]:
+            return False
+
+        owner = self._owner[slot]
+        count = self._owner_counts.get(owner, 0) - 1
+        if count > 0:
+            self._owner_counts[owner] = count
+        else:
+            self._owner_counts.pop(owner, None)
+
+        self._alive[slot] = False
+        self._owner[slot] = None
+        self._handles[slot] = None
+        self._free.append(slot)
+
+        # Son aktif slot boşalan yere taşınır - toplu temizlik O(n) kalır
+        index = self._active_index[slot]
+        last = self._active.pop()
+        if last != slot:
+            self._active[index] = last
+            self._active_index[last] = index
+        self._active_index[slot] = -1
+        self.stats['released'] += 1
+        return True
+
+    def release_owner(self, owner):
+        """Bir sahibin tüm mermilerini havuza geri ver"""
+        if owner not in self._owner_counts:
+            return 0
+
+        released = 0
+        for slot in [s for s in self._active if self._owner[s] is owner]:
+            if self.release(slot):
+                released += 1
+        return released
+
+    def clear(self):
+        for slot in self._active[:]:
+            self.release(slot)
+
+    def bullets(self):
+        """Aktif mermilerin tutamaçları"""
+        return [self._handles[slot] for slot in self._active]
+
+    def update(self, delta_time, level=None):
+        """
+        Tüm aktif mermileri tek geçişte ilerlet.
+        level verilirse oyun alanı dışına çıkan veya duvara çarpan mermiler havuza döner.
+
+        Returns:
+            int: Duvar nedeniyle serbest bırakılan mermi sayısı
+        """
+        xs, ys, vxs, vys = self._x, self._y, self._vx, self._vy
+        dead = []
+
+        for slot in self._active:
+            step_x = vxs[slot] * delta_time
+            step_y = vys[slot] * delta_time
+
+            if level is None:
+                xs[slot] += step_x
+                ys[slot] += step_y
+                continue
+
+            # Uzun adımlar alt adımlara bölünür - ince duvarlar atlanmaz
+            steps = max(1, math.ceil(max(abs(step_x), abs(step_y)) / Constants.MAX_STEP_PIXELS))
+            step_x /= steps
+            step_y /= steps
+            x, y = xs[slot], ys[slot]
+            for _ in range(steps):
+                x += step_x
+                y += step_y
+                pixel_x = math.floor(x)
+                pixel_y = math.floor(y)
+                if not level.is_inside_walls(pixel_x, pixel_y) or level.has_pixel(pixel_x, pixel_y):
+                    dead.append(slot)
+                    break
+            xs[slot] = x
+            ys[slot] = y
+
+        for slot in dead:
+            self.release(slot)
+
+        return len(dead)
+
+    def collide(self, targets):
+        """
+        Aktif mermileri hedeflere karşı test et.
+        Hedefler hücre kovalarına dağıtılır; her mermi sadece kendi hücresi ve
+        komşu hücrelerdeki hedeflere bakar, böylece maliyet mermi sayısıyla doğrusal kalır.
+
+        Returns:
+            list: (mermi tutamacı, hedef) çiftleri - her mermi en fazla bir kez
+        """
+        buckets = {}
+        for target in targets:
+            if target is None or not target.visible:
+                continue
+            key = (target.pixel_position_x // self._cell_width, target.pixel_position_y // self._cell_height)
+            buckets.setdefault(key, []).append(target)
+
+        if not buckets:
+            return []
+
+        hits = []
+        for slot in self._active:
+            cell_x = math.floor(self._x[slot]) // self._cell_width
+            cell_y = math.floor(self._y[slot]) // self._cell_height
+            owner = self._owner[slot]
+            hit_target = None
+
+            for offset_y in (-1, 0, 1):
+                for offset_x in (-1, 0, 1):
+                    for target in buckets.get((cell_x + offset_x, cell_y + offset_y), ()):
+                        if target is not owner and self._test_hit(slot, target):
+                            hit_target = target
+                            break
+                    if hit_target:
+                        break
+                if hit_target:
+                    break
+
+            if hit_target:
+                hits.append((self._handles[slot], hit_target))
+
+        return hits
+
+    def _is_live(self, slot, generation):
+        return self._alive[slot] and self._generation[slot] == generation
+
+    def _test_hit(self, slot, character):
+        # Bullet.test_hit ile aynı formül
+        pivot = character.sprite_sheet.sprite_pivot
+        distance_x = abs(character.pixel_position_x - math.floor(self._x[slot]) + pivot.x)
+        distance_y = abs(character.pixel_position_y - math.floor(self._y[slot]) + pivot.y)
+
+        return distance_x <= pivot.x and distance_y <= pivot.y
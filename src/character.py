@@ -3,11 +3,17 @@ import math
 import pygame
 
 class Character:
+    # Çizimde önceki ve mevcut sabit adım arasındaki oran (0-1)
+    render_alpha = 1.0
+    # Bundan büyük sıçramalar (grid adımı, tünel, teleport) interpole edilmez
+    MAX_INTERPOLATION_DISTANCE = 2.0
+    
     def __init__(self, sprite_sheet):
         self._enabled = True
         self._visible = True
         self._sprite_sheet = sprite_sheet
         self._position = pygame.Vector2(0, 0)
+        self._previous_position = pygame.Vector2(0, 0)
         self._current_frame = 0
         self._color = (255, 255, 255)  # Beyaz
         
@@ -85,6 +91,17 @@ class Character:
     def move_by(self, translation):
         self._position += translation
     
+    def store_previous_position(self):
+        """Sabit adım başında konumu sakla - çizim iki adım arasında interpole edilir"""
+        self._previous_position.update(self._position)
+    
+    def render_position(self):
+        """render_alpha'ya göre interpole edilmiş çizim konumu"""
+        alpha = Character.render_alpha
+        if alpha >= 1.0 or self._previous_position.distance_to(self._position) > self.MAX_INTERPOLATION_DISTANCE:
+            return self._position
+        return self._previous_position.lerp(self._position, alpha)
+    
     def look_to(self, direction):
         self._move_direction = direction
         
@@ -137,8 +154,9 @@ class Character:
             FRAME_WIDTH = -10   # Sprite genişliği (örnek)
             FRAME_HEIGHT = -10  # Sprite yüksekliği (örnek)
 
-            draw_x = self.pixel_position_x - FRAME_WIDTH // 2 + display_offset_x
-            draw_y = self.pixel_position_y - FRAME_HEIGHT // 2 + display_offset_y
+            position = self.render_position()
+            draw_x = math.floor(position.x) - FRAME_WIDTH // 2 + display_offset_x
+            draw_y = math.floor(position.y) - FRAME_HEIGHT // 2 + display_offset_y
 
             self._sprite_sheet.draw_frame(
                 int(math.floor(self._current_frame)),
@@ -22,12 +22,13 @@ class ConfigManager:
     def get_config(key, default_value):
         if key in ConfigManager._config:
             try:
-                if isinstance(default_value, int):
+                # bool, int'in alt sınıfı olduğu için önce kontrol edilmeli
+                if isinstance(default_value, bool):
+                    return ConfigManager._config[key].lower() == 'true'
+                elif isinstance(default_value, int):
                     return int(ConfigManager._config[key])
                 elif isinstance(default_value, float):
                     return float(ConfigManager._config[key])
-                elif isinstance(default_value, bool):
-                    return ConfigManager._config[key].lower() == 'true'
                 else:
                     return ConfigManager._config[key]
             except:
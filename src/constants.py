@@ -49,6 +49,10 @@ class Constants:
     DEFAULT_WIZARD_TELEPORT_COOLDOWN = 1.0
     ENEMY_BULLET_SPEED = "ENEMY_BULLET_SPEED"
     DEFAULT_ENEMY_BULLET_SPEED = 50
+    ENEMY_MAX_BULLETS = "ENEMY_MAX_BULLETS"
+    DEFAULT_ENEMY_MAX_BULLETS = 1
+    ENEMY_BULLETS_PER_ENEMY = "ENEMY_BULLETS_PER_ENEMY"
+    DEFAULT_ENEMY_BULLETS_PER_ENEMY = 1
 
     # Skor ayarları
     BURWOR_SCORE = "BURWOR_SCORE"
@@ -66,6 +70,60 @@ class Constants:
     EXTRA_LIFE_SCORE = "EXTRA_LIFE_SCORE"
     DEFAULT_EXTRA_LIFE_SCORE = 10000
     
+    # Yapay zeka ayarları
+    AI_SYNC_MODE = "AI_SYNC_MODE"
+    DEFAULT_AI_SYNC_MODE = False
+    AI_DECISION_BUDGET_MS = "AI_DECISION_BUDGET_MS"
+    DEFAULT_AI_DECISION_BUDGET_MS = 2.0
+    AI_SEED = "AI_SEED"
+    DEFAULT_AI_SEED = -1
+    # Düşman tahmini kaç hücre adımı ileri bakar
+    ENEMY_PREDICTION_HORIZON = "ENEMY_PREDICTION_HORIZON"
+    DEFAULT_ENEMY_PREDICTION_HORIZON = 8
+    # Rollout AI (MC): karar başına süre bütçesi, ileri simülasyon ufku (frame),
+    # aday eylem başına paralel rollout ve işçi thread sayısı
+    ROLLOUT_BUDGET_MS = "ROLLOUT_BUDGET_MS"
+    DEFAULT_ROLLOUT_BUDGET_MS = 12.0
+    ROLLOUT_HORIZON = "ROLLOUT_HORIZON"
+    DEFAULT_ROLLOUT_HORIZON = 18
+    ROLLOUTS_PER_ACTION = "ROLLOUTS_PER_ACTION"
+    DEFAULT_ROLLOUTS_PER_ACTION = 16
+    ROLLOUT_WORKERS = "ROLLOUT_WORKERS"
+    DEFAULT_ROLLOUT_WORKERS = 2
+    
+    # Ses motoru
+    AUDIO_QUEUE_SIZE = "AUDIO_QUEUE_SIZE"
+    DEFAULT_AUDIO_QUEUE_SIZE = 64
+    AUDIO_SHOT_CHANNELS = "AUDIO_SHOT_CHANNELS"
+    DEFAULT_AUDIO_SHOT_CHANNELS = 2
+    AUDIO_DEATH_CHANNELS = "AUDIO_DEATH_CHANNELS"
+    DEFAULT_AUDIO_DEATH_CHANNELS = 2
+    AUDIO_MUSIC_CHANNELS = "AUDIO_MUSIC_CHANNELS"
+    DEFAULT_AUDIO_MUSIC_CHANNELS = 2
+    AUDIO_EFFECT_CHANNELS = "AUDIO_EFFECT_CHANNELS"
+    DEFAULT_AUDIO_EFFECT_CHANNELS = 2
+    
+    # Aktör tabanlı alt sistemler
+    ACTOR_SUBSYSTEMS = "ACTOR_SUBSYSTEMS"
+    DEFAULT_ACTOR_SUBSYSTEMS = False
+    ACTOR_MAX_RESTARTS = "ACTOR_MAX_RESTARTS"
+    DEFAULT_ACTOR_MAX_RESTARTS = 3
+    
+    # Oyun döngüsü: vsync, fixed60, uncapped, headless
+    LOOP_PACING = "LOOP_PACING"
+    DEFAULT_LOOP_PACING = "fixed60"
+    
+    # Sabit adımlı simülasyon
+    SIMULATION_RATE = "SIMULATION_RATE"
+    DEFAULT_SIMULATION_RATE = 60
+    MAX_SIMULATION_STEPS = "MAX_SIMULATION_STEPS"
+    DEFAULT_MAX_SIMULATION_STEPS = 5
+    RENDER_INTERPOLATION = "RENDER_INTERPOLATION"
+    DEFAULT_RENDER_INTERPOLATION = True
+    # Hareket adımlarının ayarlandığı frame hızı ve alt adım başına en fazla piksel
+    REFERENCE_FRAME_RATE = 60
+    MAX_STEP_PIXELS = 1.0
+    
     # Oyun düzeyi sabitleri
     LEVEL_KILL_ENEMIES = 0
     LEVEL_WORLUK = 1
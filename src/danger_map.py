@@ -0,0 +1,142 @@
+# src/danger_map.py
+import math
+import numpy as np
+from src.batch_simulator import LevelTables, UP, DOWN, LEFT, RIGHT, DIR_X, DIR_Y, CELL_WIDTH, CELL_HEIGHT
+from src.guard_solver import GuardSolver
+
+# Oyuncu isabet kutusu (SpriteSheet 8x8, pivot 4,4): mermi hücre köşesinden bu kadar px içeride vurur
+HIT_WIDTH = 8
+HIT_HEIGHT = 8
+
+class DangerMap:
+    """
+    Tek oyuncu için mermi tehlike haritası (değişmez).
+    times[y, x] = en yakın merminin hücredeki oyuncuya çarpmasına kalan süre (saniye),
+    hiçbir mermi yolu hücreden geçmiyorsa inf.
+    """
+
+    def __init__(self, times):
+        self.times = times
+
+    def time_to_impact(self, grid_x, grid_y):
+        if 0 <= grid_y < self.times.shape[0] and 0 <= grid_x < self.times.shape[1]:
+            return float(self.times[grid_y, grid_x])
+        return math.inf
+
+    def is_safe(self, grid_x, grid_y, horizon):
+        return self.time_to_impact(grid_x, grid_y) > horizon
+
+    def dangerous_cells(self, horizon):
+        """Çarpma süresi horizon'u geçmeyen hücreler [(x, y)]"""
+        grid_y, grid_x = np.nonzero(self.times <= horizon)
+        return list(zip(grid_x.tolist(), grid_y.tolist()))
+
+class DangerField:
+    """
+    Frame'in tüm mermi yolları, ateş eden karaktere göre katmanlı.
+    Oyuncu kendi mermisinden etkilenmez; for_player() o oyuncunun
+    katmanını dışarıda bırakıp diğerlerinin hücre bazında en küçüğünü alır.
+    """
+
+    def __init__(self, shape, layers):
+        self.shape = shape
+        # id(origin) -> (H, W) çarpma süreleri
+        self.layers = layers
+        self._views = {}
+
+    def for_player(self, player):
+        key = id(player)
+        view = self._views.get(key)
+        if view is None:
+            others = [times for origin, times in self.layers.items() if origin != key]
+            if others:
+                times = np.minimum.reduce(others) if len(others) > 1 else others[0]
+            else:
+                times = np.full(self.shape, np.inf)
+            view = DangerMap(times)
+            self._views[key] = view
+        return view
+
+class DangerMapper:
+    """
+    Mermi hız vektörlerinden hücre başına çarpma süresi ızgarası üretir.
+    Her mermi hücre hücre duvara kadar ilerletilir (LevelTables.can_move);
+    süre = hücrenin isabet kutusuna kalan mesafe / mermi hızı.
+    Ana döngüde frame başına bir kez çalışır, sonuç tüm AI'lara paylaşılır.
+    """
+
+    def __init__(self):
+        self._level_key = None
+        self._tables = None
+
+    def build(self, bullets, level):
+        """
+        Args:
+            bullets: Bullet nesneleri (oyuncu ve düşman mermileri)
+            level: Geçerli Level
+
+        Returns:
+            DangerField
+        """
+        self._prepare(level)
+        tables = self._tables
+        shape = (tables.height, tables.width)
+        layers = {}
+
+        for bullet in bullets:
+            if not bullet or not bullet.is_alive:
+                continue
+            heading, speed = self._heading(bullet.velocity.x, bullet.velocity.y)
+            if heading is None:
+                continue
+
+            key = id(bullet.origin)
+            times = layers.get(key)
+            if times is None:
+                times = np.full(shape, np.inf)
+                layers[key] = times
+            self._march(times, bullet.pixel_position_x, bullet.pixel_position_y, heading, speed)
+
+        return DangerField(shape, layers)
+
+    def _prepare(self, level):
+        key = GuardSolver.level_key(level)
+        if key != self._level_key:
+            self._level_key = key
+            self._tables = LevelTables.from_level(level)
+
+    def _march(self, times, x, y, heading, speed):
+        """Mermi yolunu duvara kadar hücre hücre işaretle"""
+        tables = self._tables
+        cell_x = int(x // CELL_WIDTH)
+        cell_y = int(y // CELL_HEIGHT)
+
+        while 0 <= cell_x < tables.width and 0 <= cell_y < tables.height:
+            if heading == RIGHT:
+                distance = cell_x * CELL_WIDTH - x
+            elif heading == LEFT:
+                distance = x - (cell_x * CELL_WIDTH + HIT_WIDTH)
+            elif heading == DOWN:
+                distance = cell_y * CELL_HEIGHT - y
+            else:
+                distance = y - (cell_y * CELL_HEIGHT + HIT_HEIGHT)
+
+            impact = max(0.0, distance) / speed
+            if impact < times[cell_y, cell_x]:
+                times[cell_y, cell_x] = impact
+
+            if not tables.can_move[cell_y, cell_x, heading]:
+                break
+            cell_x += int(DIR_X[heading])
+            cell_y += int(DIR_Y[heading])
+
+    @staticmethod
+    def _heading(dx, dy):
+        """Mermiler eksen boyunca gider: (yön, hız)"""
+        if abs(dx) >= abs(dy):
+            if dx > 0:
+                return RIGHT, dx
+            if dx < 0:
+                return LEFT, -dx
+            return None, 0.0
+        return (DOWN, dy) if dy > 0 else (UP, -dy)
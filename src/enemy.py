@@ -2,12 +2,14 @@
 import math
 from src.shooting_character import ShootingCharacter
 from src.bullet import BulletTargetTypes
+from src.bullet_manager import BulletManager
 from src.config_manager import ConfigManager
 from src.constants import Constants
 from src.simple_controls import PlayerNumber
 
 class Enemy(ShootingCharacter):
-    _common_bullet = None
+    # Tüm düşmanların paylaştığı mermi havuzu (eski tek _common_bullet yerine)
+    bullet_manager = BulletManager()
     
     def __init__(self, sprite_sheet, color, can_become_invisible, score_points):
         super().__init__(sprite_sheet)
@@ -62,7 +64,7 @@ class Enemy(ShootingCharacter):
             return False
         
         # Ana kontroller
-        if player is None or player.in_cage or not player.visible or Enemy.is_any_enemy_firing():
+        if player is None or player.in_cage or not player.visible or not Enemy.bullet_manager.can_fire(self):
             return False
         
         # İlk iki seviyede 3. seviyede Burworlar ateş edemez kontrolü
@@ -81,27 +83,45 @@ class Enemy(ShootingCharacter):
         return False
     
     def fire(self):
-        Enemy._common_bullet = super().fire(
+        # Havuz limiti doluysa None döner
+        bullet = Enemy.bullet_manager.spawn(
+            self,
             BulletTargetTypes.PLAYER, 
             ConfigManager.get_config(Constants.ENEMY_BULLET_SPEED, Constants.DEFAULT_ENEMY_BULLET_SPEED)
         )
-        return Enemy._common_bullet
+        if bullet is not None:
+            self._bullet = bullet
+        return bullet
+    
+    @staticmethod
+    def configure_bullet_pool():
+        """Mermi limitlerini config'den oku"""
+        Enemy.bullet_manager.configure(
+            ConfigManager.get_config(Constants.ENEMY_MAX_BULLETS, Constants.DEFAULT_ENEMY_MAX_BULLETS),
+            ConfigManager.get_config(Constants.ENEMY_BULLETS_PER_ENEMY, Constants.DEFAULT_ENEMY_BULLETS_PER_ENEMY)
+        )
     
     @staticmethod
     def is_enemy_bullet(bullet):
-        return bullet is not None and bullet is Enemy._common_bullet
+        return bullet is not None and Enemy.bullet_manager.owns(bullet)
     
     @staticmethod
     def kill_enemy_bullet():
-        Enemy._common_bullet = None
+        Enemy.bullet_manager.clear()
     
     def kill_bullet(self):
         super().kill_bullet()
-        Enemy.kill_enemy_bullet()
+        Enemy.bullet_manager.release_owner(self)
+    
+    def is_owned_bullet(self, bullet):
+        return Enemy.bullet_manager.owns(bullet) and bullet.origin is self
+    
+    def is_firing(self):
+        return Enemy.bullet_manager.owner_count(self) > 0
     
     @staticmethod
     def is_any_enemy_firing():
-        return Enemy._common_bullet is not None
+        return Enemy.bullet_manager.active_count > 0
     
     def set_threshold_speed(self, threshold, modificator):
         new_speed = self._threshold_speeds[threshold] * modificator
@@ -114,9 +134,8 @@ class Enemy(ShootingCharacter):
                 self.visible = True
     
 
-    # enemy.py'deki move metodunu güncelle:
-
-    def move(self, delta_time):
+    def movement_distance(self, delta_time):
+        """Bu süre içinde alınacak piksel yolu"""
         # 🔥 YUMUŞAK HAREKET: Daha büyük adımlar at - süzülmeyi azalt
         if hasattr(self, '_speed') and self._speed > 0:
             # Hareket adımını büyüt - daha az süzülme efekti
@@ -129,5 +148,13 @@ class Enemy(ShootingCharacter):
         else:
             movement_step = 0.4  # Varsayılan büyük adım
         
+        # Adım değerleri 60 FPS frame'i için ayarlı - süreye çevir
+        return movement_step * (Constants.REFERENCE_FRAME_RATE * delta_time)
+    
+    def substep_count(self, delta_time):
+        """Hiçbir alt adım MAX_STEP_PIXELS'ı geçmesin - grid hücreleri atlanmaz"""
+        return max(1, math.ceil(self.movement_distance(delta_time) / Constants.MAX_STEP_PIXELS))
+    
+    def move(self, delta_time):
         # Hareket et
-        self._position += self._move_direction * movement_step
\ No newline at end of file
+        self._position += self._move_direction * self.movement_distance(delta_time)
\ No newline at end of file
@@ -0,0 +1,269 @@
+# src/enemy_predictor.py
+import math
+import numpy as np
+from src.batch_simulator import (
+    LevelTables, UP, DOWN, LEFT, RIGHT, DIR_X, DIR_Y, REVERSE,
+    CELL_WIDTH, CELL_HEIGHT, TUNNEL_Y, TUNNEL_LEFT_X, TUNNEL_RIGHT_X
+)
+from src.guard_solver import GuardSolver
+
+# preferred_horizontal_direction (-1, 0, 1) -> geçiş tablosu indeksi
+PREFERENCES = (-1, 0, 1)
+
+class EnemyPrediction:
+    """
+    Tek frame'in düşman tahmini (değişmez, AI thread'leri arasında paylaşılır).
+    cells[k, e] = e. düşmanın k hücre adımı sonra bulunduğu hücrenin olasılık ızgarası (H, W).
+    İndeksler oyun durumundaki 'enemies' listesiyle aynı sıradadır.
+    """
+
+    def __init__(self, cells, first_step_seconds, step_seconds):
+        self.cells = cells
+        self.horizon = cells.shape[0] - 1
+        self.first_step_seconds = first_step_seconds
+        self.step_seconds = step_seconds
+
+    @property
+    def enemy_count(self):
+        return self.cells.shape[1]
+
+    def distribution(self, enemy_index, step):
+        return self.cells[min(step, self.horizon), enemy_index]
+
+    def probability(self, enemy_index, step, grid_x, grid_y):
+        grid = self.distribution(enemy_index, step)
+        if 0 <= grid_y < grid.shape[0] and 0 <= grid_x < grid.shape[1]:
+            return float(grid[grid_y, grid_x])
+        return 0.0
+
+    def occupancy(self, step):
+        """Tüm düşmanların beklenen hücre doluluğu (H, W)"""
+        return self.cells[min(step, self.horizon)].sum(axis=0)
+
+    def most_likely_cell(self, enemy_index, step):
+        grid = self.distribution(enemy_index, step)
+        grid_y, grid_x = np.unravel_index(int(np.argmax(grid)), grid.shape)
+        return int(grid_x), int(grid_y)
+
+    def step_at(self, enemy_index, seconds):
+        """Verilen süre sonra düşmanın bulunacağı adım"""
+        if seconds <= self.first_step_seconds[enemy_index]:
+            return 0
+        step_seconds = self.step_seconds[enemy_index]
+        if step_seconds <= 0:
+            return 0
+        return min(self.horizon, 1 + int((seconds - self.first_step_seconds[enemy_index]) / step_seconds))
+
+class EnemyPredictor:
+    """
+    Düşmanların sonraki N hücre adımı için ulaşabilecekleri hücre dağılımları.
+    Durum uzayı (hücre, yön) - Level.pick_possible_direction kuralları (tercih edilen
+    yatay yön, yanlış taraf, tüneller) her seviye için bir geçiş matrisine çevrilir.
+    Her frame tüm düşmanlar tek matris çarpımı zinciriyle ilerletilir; sonuç her iki
+    AI oyuncusuna aynı nesne olarak verilir.
+    """
+    # Ortalama hücre uzunluğu (px) - yatay 12, dikey 10
+    MEAN_SEGMENT = (CELL_WIDTH + CELL_HEIGHT) / 2.0
+
+    def __init__(self, horizon=8):
+        self.horizon = horizon
+        self._level_key = None
+        self._tables = None
+        # (tercih, tüneller açık) -> (S, S) geçiş matrisi
+        self._transitions = {}
+
+    def predict(self, enemies, level):
+        """
+        Args:
+            enemies: Enemy nesneleri (oyun durumundaki sırayla)
+            level: Geçerli Level
+
+        Returns:
+            EnemyPrediction
+        """
+        self._prepare(level)
+        tables = self._tables
+        height, width = tables.height, tables.width
+        states = height * width * 4
+        count = len(enemies)
+
+        start = np.zeros((count, states), dtype=np.float32)
+        preference = np.zeros(count, dtype=np.int64)
+        first_step_seconds = np.zeros(count, dtype=np.float64)
+        step_seconds = np.zeros(count, dtype=np.float64)
+
+        for index, enemy in enumerate(enemies):
+            cell_x, cell_y, heading, remaining = self._arrival(enemy)
+            cell_x = min(max(cell_x, 0), width - 1)
+            cell_y = min(max(cell_y, 0), height - 1)
+
+            speed = enemy.movement_distance(1.0)
+            if heading is None:
+                # Duran düşman: her yön eşit olası
+                start[index, self._state(cell_x, cell_y, 0, width):self._state(cell_x, cell_y, 0, width) + 4] = 0.25
+            else:
+                start[index, self._state(cell_x, cell_y, heading, width)] = 1.0
+            preference[index] = PREFERENCES.index(int(getattr(enemy, 'preferred_horizontal_direction', 0)))
+            first_step_seconds[index] = remaining / speed if speed > 0 else 0.0
+            step_seconds[index] = self.MEAN_SEGMENT / speed if speed > 0 else 0.0
+
+        distributions = np.zeros((self.horizon + 1, count, states), dtype=np.float32)
+        distributions[0] = start
+
+        tunnels_open = bool(getattr(level, 'tunnels_open', True))
+        for pref_index in np.unique(preference):
+            rows = preference == pref_index
+            transition = self._transition(int(pref_index), tunnels_open)
+            current = start[rows]
+            for step in range(1, self.horizon + 1):
+                current = current @ transition
+                distributions[step, rows] = current
+
+        cells = distributions.reshape(self.horizon + 1, count, height, width, 4).sum(axis=-1)
+        return EnemyPrediction(cells, first_step_seconds, step_seconds)
+
+    def _prepare(self, level):
+        key = GuardSolver.level_key(level)
+        if key != self._level_key:
+            self._level_key = key
+            self._tables = LevelTables.from_level(level)
+            self._transitions = {}
+
+    def _arrival(self, enemy):
+        """Düşmanın karar vereceği ilk hücre, yönü ve oraya kalan piksel yolu"""
+        x = enemy.pixel_position_x
+        y = enemy.pixel_position_y
+        direction = enemy.move_direction
+        heading = self._heading(direction.x, direction.y)
+
+        on_grid = x % CELL_WIDTH == 0 and y % CELL_HEIGHT == 0
+        if on_grid and (enemy.can_change_direction or heading is None):
+            return int(x // CELL_WIDTH), int(y // CELL_HEIGHT), heading, 0.0
+
+        if on_grid:
+            # Yön bu hücrede zaten seçildi - bir sonraki hücrede karar verilecek
+            return (int(x // CELL_WIDTH) + int(DIR_X[heading]), int(y // CELL_HEIGHT) + int(DIR_Y[heading]),
+                    heading, self.MEAN_SEGMENT)
+
+        if heading in (LEFT, RIGHT):
+            cell_x = math.floor(x / CELL_WIDTH) if heading == LEFT else math.ceil(x / CELL_WIDTH)
+            cell_y = int(round(y / CELL_HEIGHT))
+            return cell_x, cell_y, heading, abs(cell_x * CELL_WIDTH - x)
+
+        if heading in (UP, DOWN):
+            cell_y = math.floor(y / CELL_HEIGHT) if heading == UP else math.ceil(y / CELL_HEIGHT)
+            cell_x = int(round(x / CELL_WIDTH))
+            return cell_x, cell_y, heading, abs(cell_y * CELL_HEIGHT - y)
+
+        return int(round(x / CELL_WIDTH)), int(round(y / CELL_HEIGHT)), None, 0.0
+
+    @staticmethod
+    def _heading(dx, dy):
+        if dx < 0:
+            return LEFT
+        if dx > 0:
+            return RIGHT
+        if dy < 0:
+            return UP
+        if dy > 0:
+            return DOWN
+        return None
+
+    @staticmethod
+    def _state(cell_x, cell_y, heading, width):
+        return (cell_y * width + cell_x) * 4 + heading
+
+    def _transition(self, pref_index, tunnels_open):
+        key = (pref_index, tunnels_open)
+        transition = self._transitions.get(key)
+        if transition is None:
+            transition = self._build_transition(PREFERENCES[pref_index], tunnels_open)
+            self._transitions[key] = transition
+        return transition
+
+    def _build_transition(self, preferred, tunnels_open):
+        tables = self._tables
+        height, width = tables.height, tables.width
+        transition = np.zeros((height * width * 4, height * width * 4), dtype=np.float32)
+        half_width = width * CELL_WIDTH / 2
+
+        for cell_y in range(height):
+            for cell_x in range(width):
+                can = tables.can_move[cell_y, cell_x]
+                tunnel = None
+                if tunnels_open and cell_y == TUNNEL_Y:
+                    if cell_x == TUNNEL_LEFT_X:
+                        tunnel = LEFT
+                    elif cell_x == TUNNEL_RIGHT_X:
+                        tunnel = RIGHT
+                side = math.copysign(1, half_width - cell_x * CELL_WIDTH)
+                wrong_side = preferred != 0 and side == preferred
+
+                for heading in (UP, DOWN, LEFT, RIGHT):
+                    state = self._state(cell_x, cell_y, heading, width)
+                    options = self._options(can, tunnel, heading, preferred, wrong_side)
+                    weight = 1.0 / len(options)
+                    for choice in options:
+                        next_x, next_y = self._next_cell(cell_x, cell_y, choice, tunnel, width, height)
+                        transition[state, self._state(next_x, next_y, choice, width)] += weight
+
+        return transition
+
+    @staticmethod
+    def _options(can, tunnel, heading, preferred, wrong_side):
+        """Level.pick_possible_direction ile aynı aday yönler"""
+        # Tercihli düşman açık tünelde tünele girer
+        if preferred != 0 and tunnel is not None:
+            return [tunnel]
+
+        options = []
+        if heading in (LEFT, RIGHT):
+            forward = 1 if heading == RIGHT else -1
+            if can[heading] or tunnel == heading:
+                if wrong_side:
+                    if preferred == forward:
+                        return [heading]
+                    elif not can[DOWN] and not can[UP]:
+                        options.append(heading)
+                else:
+                    options.append(heading)
+            if can[UP]:
+                options.append(UP)
+            if can[DOWN]:
+                options.append(DOWN)
+        else:
+            if can[heading]:
+                options.append(heading)
+            if can[RIGHT] or tunnel == RIGHT:
+                if wrong_side and preferred > 0:
+                    return [RIGHT]
+                options.append(RIGHT)
+            if can[LEFT] or tunnel == LEFT:
+                if wrong_side and preferred < 0:
+                    return [LEFT]
+                options.append(LEFT)
+
+        if not options:
+            options.append(int(REVERSE[heading]))
+
+        # Yanlış taraftaki düşman tercih yönünün tersine dönmez
+        if len(options) > 1 and wrong_side:
+            away = LEFT if preferred > 0 else RIGHT
+            if away in options:
+                options.remove(away)
+
+        return options
+
+    @staticmethod
+    def _next_cell(cell_x, cell_y, direction, tunnel, width, height):
+        # Tünelden çıkan düşman karşı tünele ışınlanır
+        if tunnel == direction == LEFT:
+            return TUNNEL_RIGHT_X, cell_y
+        if tunnel == direction == RIGHT:
+            return TUNNEL_LEFT_X, cell_y
+
+        next_x = cell_x + int(DIR_X[direction])
+        next_y = cell_y + int(DIR_Y[direction])
+        if 0 <= next_x < width and 0 <= next_y < height:
+            return next_x, next_y
+        return cell_x, cell_y
@@ -0,0 +1,211 @@
+# src/game_actors.py
+import time
+from src.message_system import MessageBus, Actor, Supervisor, MessageType, BackPressure
+from src.config_manager import ConfigManager
+from src.constants import Constants
+
+GAME_ENDPOINT_ID = "game"
+AUDIO_ACTOR_ID = "audio"
+PHYSICS_ACTOR_ID = "physics"
+TELEMETRY_ACTOR_ID = "telemetry"
+
+def ai_actor_id(player_number):
+    return f"ai_{player_number.value}"
+
+# Mesaj türü -> (politika, sınır). Anlık görüntü ve sonuçlarda sadece en yenisi anlamlı;
+# ses olayları sırayla çalınmalı, dolunca yeni partiler atlanır
+BACK_PRESSURE = {
+    MessageType.STATE_SNAPSHOT: (BackPressure.DROP_OLDEST, 1),
+    MessageType.ACTION: (BackPressure.DROP_OLDEST, 4),
+    MessageType.PHYSICS_UPDATE: (BackPressure.DROP_OLDEST, 1),
+    MessageType.COLLISION_RESULT: (BackPressure.DROP_OLDEST, 1),
+    MessageType.AUDIO_EVENT: (BackPressure.DROP_NEWEST, Constants.DEFAULT_AUDIO_QUEUE_SIZE),
+    MessageType.TELEMETRY: (BackPressure.DROP_OLDEST, 256)
+}
+
+class GameEndpoint(Actor):
+    """
+    Ana thread'in bus üzerindeki adresi.
+    Thread olarak başlatılmaz; gelen kutusu her frame pump() ile boşaltılır.
+    """
+
+    def __init__(self, message_bus, game):
+        super().__init__(GAME_ENDPOINT_ID, message_bus)
+        self.game = game
+        self.set_back_pressure(BACK_PRESSURE)
+        self.register_handler(MessageType.ACTION, self._on_action)
+        self.register_handler(MessageType.COLLISION_RESULT, self._on_collision_result)
+
+    def pump(self):
+        """Bekleyen tüm mesajları ana thread'de işle"""
+        processed = 0
+        while True:
+            count = self.process_messages()
+            if count == 0:
+                return processed
+            processed += count
+
+    def _on_action(self, message):
+        self.game.ai_controller.submit_action(message.data['player_number'], message.data['action'])
+
+    def _on_collision_result(self, message):
+        # Mevcut uygulama yolu (_apply_physics_results) aynen kullanılır
+        thread_manager = self.game.thread_manager
+        with thread_manager.physics_lock:
+            thread_manager.physics_results = message.data
+
+class AIActor(Actor):
+    """Oyun durumu anlık görüntüsünden karar verip ACTION mesajı gönderen AI oyuncusu"""
+
+    def __init__(self, message_bus, ai_player):
+        super().__init__(ai_actor_id(ai_player.player_number), message_bus)
+        self.ai_player = ai_player
+        self.set_back_pressure(BACK_PRESSURE)
+        self.register_handler(MessageType.STATE_SNAPSHOT, self._on_snapshot)
+
+    def _on_snapshot(self, message):
+        start = time.perf_counter()
+        action = self.ai_player.step(message.data['state'], message.data.get('time'))
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        self.send(GAME_ENDPOINT_ID, MessageType.ACTION,
+                  {'player_number': self.ai_player.player_number, 'action': action})
+        self.send(TELEMETRY_ACTOR_ID, MessageType.TELEMETRY,
+                  {'kind': f"ai_decision_p{self.ai_player.player_number.value}", 'ms': elapsed_ms})
+
+class AudioActor(Actor):
+    """Ses partilerini çalar; boşta kaldığında müzik sıralayıcısını besler"""
+
+    def __init__(self, message_bus, audio_manager):
+        super().__init__(AUDIO_ACTOR_ID, message_bus)
+        self.audio_manager = audio_manager
+        # Sıralayıcı kuyruğu boşalmadan uyanılmalı
+        self.IDLE_TIMEOUT = audio_manager.SEQUENCER_POLL_INTERVAL
+        self.set_back_pressure(BACK_PRESSURE)
+        # Bekleyen parti sınırı ses kuyruğuyla aynı (AUDIO_QUEUE_SIZE)
+        self.inbox.set_policy(MessageType.AUDIO_EVENT, BackPressure.DROP_NEWEST,
+                              audio_manager.audio_queue.maxsize or Constants.DEFAULT_AUDIO_QUEUE_SIZE)
+        self.register_handler(MessageType.AUDIO_EVENT, self._on_audio_event)
+
+    def _on_audio_event(self, message):
+        self.audio_manager.submit_batch(message.data)
+        self.audio_manager.dispatch_pending()
+
+    def on_idle(self):
+        self.audio_manager.sequencer.service()
+
+class PhysicsActor(Actor):
+    """Çarpışma işlerini hesaplayıp COLLISION_RESULT olarak geri gönderir"""
+
+    def __init__(self, message_bus, thread_manager):
+        super().__init__(PHYSICS_ACTOR_ID, message_bus)
+        self.thread_manager = thread_manager
+        self.set_back_pressure(BACK_PRESSURE)
+        self.register_handler(MessageType.PHYSICS_UPDATE, self._on_physics_update)
+
+    def _on_physics_update(self, message):
+        result = self.thread_manager._process_physics_data(message.data)
+        if result:
+            self.send(GAME_ENDPOINT_ID, MessageType.COLLISION_RESULT, result)
+
+class TelemetryActor(Actor):
+    """Süre ölçümlerini tür başına toplar (sayı, ortalama, en yüksek)"""
+
+    def __init__(self, message_bus):
+        super().__init__(TELEMETRY_ACTOR_ID, message_bus)
+        self.set_back_pressure(BACK_PRESSURE)
+        self.register_handler(MessageType.TELEMETRY, self._on_telemetry)
+        self.metrics = {}
+
+    def _on_telemetry(self, message):
+        metric = self.metrics.get(message.data['kind'])
+        if metric is None:
+            metric = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+            self.metrics[message.data['kind']] = metric
+        ms = message.data['ms']
+        metric['count'] += 1
+        metric['total_ms'] += ms
+        if ms > metric['max_ms']:
+            metric['max_ms'] = ms
+
+    def get_summary(self):
+        return {kind: {'count': metric['count'],
+                       'avg_ms': metric['total_ms'] / metric['count'],
+                       'max_ms': metric['max_ms']}
+                for kind, metric in list(self.metrics.items())}
+
+class GameActorSystem:
+    """
+    AI, ses, fizik ve telemetri alt sistemlerini MessageBus üzerinde aktör
+    olarak çalıştırır. Ana thread GameEndpoint üzerinden mesaj alıp verir;
+    çöken aktörler süpervizör tarafından yeniden başlatılır.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.bus = MessageBus()
+
+        self.supervisor = Supervisor(
+            self.bus,
+            max_restarts=ConfigManager.get_config(Constants.ACTOR_MAX_RESTARTS, Constants.DEFAULT_ACTOR_MAX_RESTARTS)
+        )
+        self.bus.register_actor(self.supervisor)
+        self.supervisor.start()
+
+        self.endpoint = GameEndpoint(self.bus, game)
+        self.bus.register_actor(self.endpoint)
+
+        self.supervisor.supervise(lambda: TelemetryActor(self.bus))
+        self.supervisor.supervise(lambda: AudioActor(self.bus, game.audio_manager))
+        self.supervisor.supervise(lambda: PhysicsActor(self.bus, game.thread_manager))
+
+        print("🎭 Aktör sistemi başlatıldı (AI, ses, fizik, telemetri)")
+
+    def add_ai_player(self, ai_player):
+        self.supervisor.supervise(lambda: AIActor(self.bus, ai_player))
+
+    def remove_ai_player(self, player_number):
+        actor_id = ai_actor_id(player_number)
+        actor = self.bus.actors.get(actor_id)
+        self.supervisor.forget(actor_id)
+        self.bus.unregister_actor(actor_id)
+        if actor is not None:
+            actor.stop()
+
+    def publish_state(self, player_number, game_state, now=None):
+        self.endpoint.send(ai_actor_id(player_number), MessageType.STATE_SNAPSHOT,
+                           {'state': game_state, 'time': now})
+
+    def submit_audio(self, batch):
+        self.endpoint.send(AUDIO_ACTOR_ID, MessageType.AUDIO_EVENT, batch)
+
+    def submit_physics(self, physics_data):
+        self.endpoint.send(PHYSICS_ACTOR_ID, MessageType.PHYSICS_UPDATE, physics_data)
+
+    def record(self, kind, ms):
+        self.endpoint.send(TELEMETRY_ACTOR_ID, MessageType.TELEMETRY, {'kind': kind, 'ms': ms})
+
+    def pump(self):
+        """Aktörlerden gelen ACTION/COLLISION_RESULT mesajlarını ana thread'de uygula"""
+        return self.endpoint.pump()
+
+    def is_healthy(self):
+        return not self.supervisor.abandoned and self.supervisor.is_alive()
+
+    def get_stats(self):
+        stats = self.bus.get_stats()
+        stats['restarts'] = self.supervisor.restarts
+        stats['abandoned'] = list(self.supervisor.abandoned)
+        stats['telemetry'] = self.telemetry_summary()
+        return stats
+
+    def telemetry_summary(self):
+        actor = self.bus.actors.get(TELEMETRY_ACTOR_ID)
+        return actor.get_summary() if actor is not None else {}
+
+    def shutdown(self):
+        actors = [actor for actor in self.bus.actors.values() if actor is not self.endpoint]
+        self.bus.shutdown_all()
+        for actor in actors:
+            if actor.is_alive():
+                actor.join(timeout=1.0)
@@ -0,0 +1,328 @@
+# src/game_env.py
+import contextlib
+import multiprocessing as mp
+import os
+import numpy as np
+from src.ai_player import AIAction
+from src.batch_simulator import (
+    CELL_WIDTH, CELL_HEIGHT, LevelTables, OBS_CHANNELS, OBS_WALL_RIGHT, OBS_WALL_DOWN, OBS_PLAYER1,
+    OBS_PLAYER2, OBS_ENEMIES, OBS_PLAYER_BULLETS, OBS_ENEMY_BULLETS
+)
+from src.bullet import BulletTargetTypes
+from src.enemy import Enemy
+from src.simple_controls import SimpleControls, PlayerNumber, PlayerType
+
+class WizardOfWorEnv:
+    """
+    Headless WizardOfWor üzerinde Gym tarzı ortam.
+    reset(seed, level) ve step(action) ile sürülür; gözlem BatchSimulator ile
+    aynı kanal düzenindeki (OBS_CHANNELS, 8, 13) uint8 ızgara tensörüdür.
+    Eylemler AIAction değerleridir (0-5), her adım frame_skip frame tekrarlanır.
+    """
+
+    ACTION_COUNT = len(AIAction)
+    # Giriş animasyonu atlanırken en fazla bu kadar frame ilerletilir
+    INTRO_FRAME_LIMIT = 600
+
+    def __init__(self, frame_skip=4, fps=60, opponent=None, death_penalty=0.0,
+                 max_steps=None, skip_level_intro=True, quiet=True):
+        """
+        Args:
+            frame_skip: Her step'te eylemin tekrarlandığı frame sayısı
+            fps: Sabit simülasyon frame hızı (dt = 1/fps)
+            opponent: None (tek oyuncu), "AI1", "AI2" veya "MC" - Player 2'yi senkron AI oynar
+            death_penalty: Can kaybı başına ödülden düşülen değer
+            max_steps: Bu kadar step sonra bölüm kesilir (truncated)
+            skip_level_intro: reset sonrası seviye giriş animasyonu atlanır
+            quiet: Oyun içi print çıktıları bastırılır
+        """
+        # Oyun modülü ağır import - sadece ortam oluşturulurken yüklenir
+        from main import WizardOfWor
+
+        self.frame_skip = frame_skip
+        self.frame_time = 1.0 / fps
+        self.opponent = opponent
+        self.death_penalty = death_penalty
+        self.max_steps = max_steps
+        self.skip_level_intro = skip_level_intro
+        self.quiet = quiet
+        self._devnull = open(os.devnull, 'w') if quiet else None
+
+        with self._output():
+            self.game = WizardOfWor(headless=True)
+            self.game.prepare_run()
+            if not self.game.assets_loaded:
+                self.game.load_game_assets()
+
+        self.observation_shape = (OBS_CHANNELS, 8, 13)
+
+        # Seviye adı -> duvar tabloları
+        self._level_tables = {}
+
+        self.steps = 0
+        self.start_stage = 0
+        self._last_score = 0
+        self._last_lives = 0
+
+    def reset(self, seed=None, level=None):
+        """
+        Yeni bölüm başlat
+
+        Args:
+            seed: Oyun ve AI rastgeleliği için tohum (None = değiştirme)
+            level: Başlangıç seviyesi (0 tabanlı, None = ilk seviye)
+
+        Returns:
+            np.ndarray: İlk gözlem
+        """
+        game = self.game
+        controller = game.ai_controller
+
+        with self._output():
+            if seed is not None:
+                game.random.seed(seed)
+                controller.seed = seed
+
+            if game.game_started:
+                game.end_game()
+            controller.stop_all()
+            game.game_over = False
+
+            # Menü ekranları atlanır
+            game.player_selection_mode = False
+            game.ai_selection_mode = False
+            game.human_ai_selection_mode = False
+
+            stage = max(0, min(level or 0, game.MAX_LEVELS - 1))
+            SimpleControls.set_player_type(PlayerNumber.PLAYER1, PlayerType.AI)
+            controller.attach_external_player(PlayerNumber.PLAYER1)
+
+            if self.opponent:
+                SimpleControls.set_player_type(PlayerNumber.PLAYER2, PlayerType.AI)
+                game.start_game(multiplayer=True, stage=stage)
+                controller.start_ai_player(PlayerNumber.PLAYER2, ai_type=self.opponent, threaded=False)
+            else:
+                game.start_game(multiplayer=False, stage=stage)
+
+            # Giriş animasyonu boyunca oyuncu hareket edemez - bekleme adımlarını atla.
+            # Tek sabit adımla ilerlenir ki bölüm her fps'de aynı simülasyon anında başlasın
+            if self.skip_level_intro:
+                for _ in range(self.INTRO_FRAME_LIMIT):
+                    if not game.level_starting:
+                        break
+                    self._advance(AIAction.NO_ACTION, game.fixed_delta_time)
+
+        self.steps = 0
+        self.start_stage = stage
+        self._last_score = game.player1.current_score
+        self._last_lives = game.player1.remaining_lives
+        return self.observation()
+
+    def step(self, action):
+        """
+        Eylemi frame_skip frame boyunca uygula
+
+        Returns:
+            tuple: (gözlem, ödül, done, info)
+        """
+        game = self.game
+        action = AIAction(int(action.value if isinstance(action, AIAction) else action))
+
+        with self._output():
+            for _ in range(self.frame_skip):
+                self._advance(action)
+                if self._finished():
+                    break
+
+        self.steps += 1
+        player = game.player1
+
+        score = player.current_score if player else self._last_score
+        lives = player.remaining_lives if player else self._last_lives
+        lives_lost = max(0, self._last_lives - lives)
+        reward = float(score - self._last_score) - self.death_penalty * lives_lost
+        self._last_score = score
+        self._last_lives = lives
+
+        level_cleared = not self._finished() and game.current_stage != self.start_stage
+        truncated = self.max_steps is not None and self.steps >= self.max_steps
+        done = self._finished() or level_cleared or truncated
+
+        info = {
+            'score': score,
+            'lives': lives,
+            'stage': game.current_stage,
+            'level_cleared': level_cleared,
+            'game_over': game.game_over,
+            'truncated': truncated and not self._finished(),
+            'steps': self.steps
+        }
+        return self.observation(), reward, done, info
+
+    def observation(self):
+        """(OBS_CHANNELS, 8, 13) uint8 ızgara gözlemi"""
+        game = self.game
+        obs = np.zeros(self.observation_shape, dtype=np.uint8)
+        level = game.current_level
+        if level is None:
+            return obs
+
+        tables = self._level_tables.get(level.name)
+        if tables is None:
+            tables = LevelTables.from_level(level)
+            self._level_tables[level.name] = tables
+        obs[OBS_WALL_RIGHT] = tables.wall_right
+        obs[OBS_WALL_DOWN] = tables.wall_down
+
+        if not game.game_started:
+            return obs
+
+        for channel, player in ((OBS_PLAYER1, game.player1), (OBS_PLAYER2, game.player2)):
+            if player is not None and player.visible:
+                self._mark(obs, channel, player.pixel_position_x + player.sprite_sheet.sprite_pivot.x,
+                           player.pixel_position_y + player.sprite_sheet.sprite_pivot.y)
+
+        for enemy in game.enemies:
+            if enemy.visible:
+                self._mark(obs, OBS_ENEMIES, enemy.pixel_position_x + enemy.sprite_sheet.sprite_pivot.x,
+                           enemy.pixel_position_y + enemy.sprite_sheet.sprite_pivot.y)
+
+        # update_bullets havuz mermilerini game.bullets'a ekler; bu adımda yeni
+        # ateşlenenler henüz eklenmemiş olabilir - her mermi bir kez sayılır
+        seen = set()
+        for bullet in list(game.bullets) + Enemy.bullet_manager.bullets():
+            if not bullet.is_alive or id(bullet) in seen:
+                continue
+            seen.add(id(bullet))
+            channel = OBS_ENEMY_BULLETS if bullet.target_type == BulletTargetTypes.PLAYER else OBS_PLAYER_BULLETS
+            self._mark(obs, channel, bullet.pixel_position_x, bullet.pixel_position_y)
+
+        return obs
+
+    def close(self):
+        with self._output():
+            self.game.ai_controller.stop_all()
+            self.game._shutdown_threads()
+
+    def _advance(self, action, frame_time=None):
+        """Tek frame: eylem gönderilir, oyunun kendi döngüsü (headless) bir frame çalışır"""
+        if frame_time is None:
+            frame_time = self.frame_time
+
+        self.game.ai_controller.submit_action(PlayerNumber.PLAYER1, action)
+        self.game.main_loop.run_frame(frame_time)
+
+    def _finished(self):
+        game = self.game
+        return game.game_over or game.game_completed
+
+    def _mark(self, obs, channel, x, y):
+        cell_x = min(max(int(x) // CELL_WIDTH, 0), obs.shape[2] - 1)
+        cell_y = min(max(int(y) // CELL_HEIGHT, 0), obs.shape[1] - 1)
+        obs[channel, cell_y, cell_x] += 1
+
+    def _output(self):
+        if not self.quiet:
+            return contextlib.nullcontext()
+        return contextlib.redirect_stdout(self._devnull)
+
+
+def _env_worker(conn, env_kwargs):
+    """Alt süreç: tek ortamı sahiplenir ve pipe üzerinden komut işler"""
+    env = WizardOfWorEnv(**env_kwargs)
+    # Son 'reset' komutunun seviyesi otomatik resetlerde de kullanılır
+    level = None
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == 'step':
+                obs, reward, done, info = env.step(data)
+                if done:
+                    # Otomatik reset - bölüm sonu gözlemi info içinde döner
+                    info['final_observation'] = obs
+                    obs = env.reset(level=level)
+                conn.send((obs, reward, done, info))
+            elif command == 'reset':
+                seed, level = data
+                conn.send(env.reset(seed=seed, level=level))
+            elif command == 'close':
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        env.close()
+        conn.close()
+
+
+class SubprocVectorEnv:
+    """
+    Her ortamı ayrı süreçte çalıştıran vektörel sarmalayıcı.
+    step/reset tüm ortamlara aynı anda gönderilir, sonuçlar yığılarak döner;
+    biten ortamlar kendiliğinden sıfırlanır.
+    """
+
+    def __init__(self, num_envs, **env_kwargs):
+        # pygame durumu fork ile kopyalanmasın diye spawn kullanılır
+        context = mp.get_context('spawn')
+        self.num_envs = num_envs
+        self._conns = []
+        self._processes = []
+        self.closed = False
+
+        for _ in range(num_envs):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_env_worker, args=(child_conn, env_kwargs), daemon=True)
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+    def reset(self, seeds=None, levels=None):
+        """
+        Tüm ortamları sıfırla
+
+        Args:
+            seeds: Ortam başına tohum listesi veya tek taban tohum (ortam i için seed + i)
+            levels: Ortam başına seviye listesi veya tek seviye
+
+        Returns:
+            np.ndarray: (num_envs, OBS_CHANNELS, 8, 13)
+        """
+        for index, conn in enumerate(self._conns):
+            conn.send(('reset', (self._pick(seeds, index, offset=True), self._pick(levels, index))))
+        return np.stack([conn.recv() for conn in self._conns])
+
+    def step(self, actions):
+        """
+        Returns:
+            tuple: (gözlemler, ödüller (N,), done (N,), info listesi)
+        """
+        for conn, action in zip(self._conns, actions):
+            conn.send(('step', int(action)))
+        results = [conn.recv() for conn in self._conns]
+
+        observations, rewards, dones, infos = zip(*results)
+        return (np.stack(observations),
+                np.array(rewards, dtype=np.float32),
+                np.array(dones, dtype=bool),
+                list(infos))
+
+    def close(self):
+        if self.closed:
+            return
+        for conn in self._conns:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        self.closed = True
+
+    @staticmethod
+    def _pick(value, index, offset=False):
+        if value is None:
+            return None
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return value[index]
+        return value + index if offset else value
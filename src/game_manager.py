@@ -3,6 +3,7 @@ import threading
 import queue
 import time
 import pygame
+from src.bullet import BulletTargetTypes
 
 class GameThreadManager:
     """Oyunun farklı bileşenlerini ayrı thread'lerde yönetir - Sadece Audio + Physics"""
@@ -20,27 +21,90 @@ class GameThreadManager:
         # Durum değişkeni
         self.running = False
     
-    def start_threads(self):
-        """Audio Manager + Physics Thread'i başlat"""
+    def start_threads(self, audio_threaded=True, physics_threaded=True, audio_backend=None,
+                      sound_directory="assets/sounds"):
+        """
+        Audio Manager + Physics Thread'i başlat
+        
+        Args:
+            audio_threaded: False ise ses komutları dispatch_pending_audio() ile işlenir
+            physics_threaded: False ise fizik işleri process_physics_pending() ile işlenir
+            audio_backend: Ses backend'i (None = pygame.mixer, headless için NullAudioBackend)
+            sound_directory: Ses bankasına başlangıçta yüklenecek dizin
+        """
         self.running = True
         
-        # Audio Manager'ı başlat
+        # Audio Manager'ı başlat - ses bankası thread başlamadan yüklenir
         from src.audio_manager import AudioManager
-        self.audio_manager = AudioManager()
-        self.audio_manager.start()
-        print("✅ Audio Manager başlatıldı")
+        self.audio_manager = AudioManager(audio_backend)
+        if sound_directory:
+            self.audio_manager.load_sound_bank(sound_directory)
+        if audio_threaded:
+            self.audio_manager.start()
+            print("✅ Audio Manager başlatıldı")
+        else:
+            print("✅ Audio Manager hazır (thread'siz)")
         
         # Physics thread'i başlat
-        self.physics_thread = threading.Thread(
-            target=self._physics_loop,
-            daemon=True,
-            name="PhysicsThread"
-        )
-        self.physics_thread.start()
-        print("✅ Physics Thread başlatıldı")
+        if physics_threaded:
+            self.physics_thread = threading.Thread(
+                target=self._physics_loop,
+                daemon=True,
+                name="PhysicsThread"
+            )
+            self.physics_thread.start()
+            print("✅ Physics Thread başlatıldı")
+        else:
+            print("✅ Physics hazır (thread'siz)")
         
         print("🚀 GameThreadManager hazır (Audio + Physics)")
     
+    def process_physics_pending(self):
+        """
+        Physics kuyruğundaki işleri çağıran thread'de işle (thread'siz mod)
+        
+        Returns:
+            int: İşlenen iş sayısı
+        """
+        processed = 0
+        
+        while True:
+            try:
+                physics_data = self.physics_queue.get(block=False)
+            except queue.Empty:
+                break
+            
+            if physics_data.get('type') != 'shutdown':
+                result = self._process_physics_data(physics_data)
+                if result:
+                    with self.physics_lock:
+                        self.physics_results = result
+                processed += 1
+            
+            self.physics_queue.task_done()
+        
+        return processed
+    
+    def process_unthreaded(self):
+        """
+        Thread'i başlatılmamış alt sistemlerin bekleyen işlerini çağıran thread'de işle
+        
+        Returns:
+            int: İşlenen fizik işi + ses komutu sayısı
+        """
+        processed = 0
+        if self.physics_thread is None:
+            processed += self.process_physics_pending()
+        if self.audio_manager and not self.audio_manager.running:
+            processed += self.dispatch_pending_audio()
+        return processed
+    
+    def dispatch_pending_audio(self):
+        """Bekleyen ses komutlarını işle (thread'siz mod)"""
+        if self.audio_manager:
+            return self.audio_manager.dispatch_pending()
+        return 0
+    
     def stop_threads(self):
         """Tüm thread'leri güvenli şekilde durdur"""
         print("🛑 Thread'ler durduruluyor...")
@@ -109,10 +173,6 @@ class GameThreadManager:
             
             if data_type == 'collision_check':
                 return self._calculate_collisions(physics_data)
-            elif data_type == 'bullet_trajectory':
-                return self._calculate_bullet_paths(physics_data)
-            elif data_type == 'movement_prediction':
-                return self._predict_movements(physics_data)
             else:
                 print(f"⚠️ Bilinmeyen physics data type: {data_type}")
                 return None
@@ -156,7 +216,10 @@ class GameThreadManager:
                         })
                         break  # Bir oyuncu vurulduysa diğerlerini kontrol etme
             
-            # Düşman çarpışması
+            # Düşman çarpışması - düşman mermileri sadece oyuncuları vurur
+            if bullet.target_type == BulletTargetTypes.PLAYER:
+                continue
+            
             for enemy in enemies:
                 if enemy and enemy.visible and bullet.origin != enemy:
                     if bullet.test_hit(enemy):
@@ -173,60 +236,6 @@ class GameThreadManager:
             'processed_bullets': len(bullets)
         }
     
-    def _calculate_bullet_paths(self, data):
-        """Mermi yollarını hesapla - gelecek için"""
-        bullet_paths = []
-        bullets = data.get('bullets', [])
-        
-        for bullet in bullets:
-            if bullet and hasattr(bullet, '_velocity'):
-                # 5 frame ileri hesapla (60fps için)
-                future_positions = []
-                for i in range(1, 6):
-                    dt = 0.016 * i  # 60fps = ~16ms per frame
-                    future_x = bullet.pixel_position_x + bullet._velocity.x * dt
-                    future_y = bullet.pixel_position_y + bullet._velocity.y * dt
-                    future_positions.append((future_x, future_y))
-                
-                bullet_paths.append({
-                    'bullet_id': id(bullet),  # Object referansı yerine ID
-                    'current_pos': (bullet.pixel_position_x, bullet.pixel_position_y),
-                    'future_positions': future_positions
-                })
-        
-        return {
-            'bullet_paths': bullet_paths, 
-            'timestamp': time.time()
-        }
-    
-    def _predict_movements(self, data):
-        """Hareket tahminleri - AI için"""
-        predictions = []
-        enemies = data.get('enemies', [])
-        
-        for enemy in enemies:
-            if enemy and enemy.visible and hasattr(enemy, 'move_direction'):
-                # Düşmanın muhtemel bir sonraki konumu
-                move_dir = enemy.move_direction
-                speed = getattr(enemy, '_speed', 20)  # Varsayılan hız
-                
-                # 1 saniye sonraki tahmini konum
-                next_x = enemy.pixel_position_x + move_dir.x * speed
-                next_y = enemy.pixel_position_y + move_dir.y * speed
-                
-                predictions.append({
-                    'enemy_id': id(enemy),
-                    'current_pos': (enemy.pixel_position_x, enemy.pixel_position_y),
-                    'predicted_position': (next_x, next_y),
-                    'confidence': 0.8,
-                    'enemy_type': enemy.__class__.__name__
-                })
-        
-        return {
-            'movement_predictions': predictions, 
-            'timestamp': time.time()
-        }
-    
     def get_thread_status(self):
         """Thread durumlarını döndür - debug için"""
         return {
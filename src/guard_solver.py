@@ -0,0 +1,207 @@
+# src/guard_solver.py
+import hashlib
+import time
+from collections import deque
+
+# Level ızgara bitleri (Level.CANT_MOVE_RIGHT / CANT_MOVE_DOWN)
+CANT_MOVE_RIGHT = 1
+CANT_MOVE_DOWN = 2
+
+# (dx, dy) - yukarı, aşağı, sol, sağ
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Oyuncu kafesleri (Level.get_random_position ile aynı)
+CAGES = {'right': (11, 7), 'left': (1, 7)}
+# Tünel hücreleri (Level._tunnel_*) - üzerinde durulursa ışınlanılır
+TUNNELS = ((1, 3), (11, 3))
+
+class GuardSolver:
+    """
+    Level ızgarasından iki oyunculu koruma hücrelerini hesaplar.
+    Her hücrenin görüş alanı duvara kadar düz koridorlardır (oyuncu sadece
+    baktığı yöne ateş eder). Hücre ağırlıkları düşman doğma noktalarından çıkan
+    en kısa yolların o hücreden geçme sıklığıyla artar; iki koruma hücresi
+    ağırlıklı görüş kapsamını en büyütecek şekilde açgözlü seçilir.
+    Sonuçlar ızgara içeriğinin özetiyle önbelleklenir - editörle kaydedilen
+    seviyeler de kod değişmeden çözülür.
+    """
+    _cache = {}
+    # id(ızgara) -> (ızgara, özet) - Level ızgarası yüklendikten sonra değişmez
+    _keys = {}
+
+    @staticmethod
+    def solve(level):
+        """
+        Returns:
+            dict: {'left': (x, y), 'right': (x, y)} - hangi taraftan çıkan oyuncunun nereyi koruyacağı
+        """
+        key = GuardSolver.level_key(level)
+        targets = GuardSolver._cache.get(key)
+        if targets is None:
+            start = time.perf_counter()
+            targets = GuardSolver.solve_grid(level._grid)
+            GuardSolver._cache[key] = targets
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            print(f"🛡️ Koruma hücreleri ({getattr(level, 'name', '?')}): "
+                  f"sol {targets['left']}, sağ {targets['right']} - {elapsed_ms:.2f} ms")
+        return targets
+
+    @staticmethod
+    def level_key(level):
+        """grid_hash'in Level ızgarası başına önbelleklenmiş hali - frame başına çağrılabilir"""
+        grid = level._grid
+        entry = GuardSolver._keys.get(id(grid))
+        if entry is None or entry[0] is not grid:
+            entry = (grid, GuardSolver.grid_hash(grid))
+            GuardSolver._keys[id(grid)] = entry
+        return entry[1]
+
+    @staticmethod
+    def grid_hash(grid):
+        """Seviye dosyasının ızgara içeriğinin özeti (yorum satırlarından bağımsız)"""
+        text = "\n".join("".join(str(cell) for cell in row) for row in grid)
+        return hashlib.sha1(text.encode('ascii')).hexdigest()
+
+    @staticmethod
+    def solve_grid(grid):
+        height = len(grid)
+        width = len(grid[0])
+        neighbors = GuardSolver._neighbors(grid, width, height)
+
+        # Oyuncuların erişebildiği hücreler (sol kafes çıkışından)
+        left_exit = (CAGES['left'][0], CAGES['left'][1] - 1)
+        cells = list(GuardSolver._distances(neighbors, left_exit).keys()) or list(neighbors.keys())
+
+        weights = GuardSolver._route_weights(neighbors, cells, width, height)
+        sight = {cell: GuardSolver._sight_line(neighbors, cell) for cell in cells}
+
+        # Kafes, çıkış ve tünel hücreleri koruma noktası olmaz
+        excluded = set(TUNNELS)
+        for cage in CAGES.values():
+            excluded.add(cage)
+            excluded.add((cage[0], cage[1] - 1))
+        candidates = [cell for cell in cells if cell not in excluded] or cells
+
+        first = max(candidates, key=lambda cell: (GuardSolver._coverage(sight[cell], weights, ()), -cell[1], -cell[0]))
+        covered = sight[first]
+        second = max((cell for cell in candidates if cell != first),
+                     key=lambda cell: (GuardSolver._coverage(sight[cell], weights, covered), -cell[1], -cell[0]),
+                     default=first)
+
+        # Her taraf kafes çıkışına yürüyerek daha yakın olan hücreyi alır
+        distances = {side: GuardSolver._distances(neighbors, (cage[0], cage[1] - 1))
+                     for side, cage in CAGES.items()}
+        far = width * height
+
+        def cost(left, right):
+            return distances['left'].get(left, far) + distances['right'].get(right, far)
+
+        if cost(first, second) <= cost(second, first):
+            return {'left': first, 'right': second}
+        return {'left': second, 'right': first}
+
+    @staticmethod
+    def _neighbors(grid, width, height):
+        """Level.can_move kurallarıyla hücre -> geçilebilen komşular"""
+        neighbors = {}
+        for y in range(1, height):
+            for x in range(1, width):
+                cell = grid[y][x]
+                open_cells = []
+                if y > 1 and not grid[y - 1][x] & CANT_MOVE_DOWN:
+                    open_cells.append((0, -1))
+                if y < height - 1 and not cell & CANT_MOVE_DOWN:
+                    open_cells.append((0, 1))
+                if x > 1 and not grid[y][x - 1] & CANT_MOVE_RIGHT:
+                    open_cells.append((-1, 0))
+                if x < width - 1 and not cell & CANT_MOVE_RIGHT:
+                    open_cells.append((1, 0))
+                neighbors[(x, y)] = open_cells
+        return neighbors
+
+    @staticmethod
+    def _distances(neighbors, start):
+        """BFS adım mesafeleri"""
+        if start not in neighbors:
+            return {}
+        distances = {start: 0}
+        queue = deque([start])
+        while queue:
+            x, y = queue.popleft()
+            for dx, dy in neighbors[(x, y)]:
+                nxt = (x + dx, y + dy)
+                if nxt not in distances:
+                    distances[nxt] = distances[(x, y)] + 1
+                    queue.append(nxt)
+        return distances
+
+    @staticmethod
+    def _route_weights(neighbors, cells, width, height):
+        """
+        Hücre ağırlığı: 1 + doğma noktalarından çıkan en kısa yol ağaçlarında
+        hücrenin altında kalan hücre sayısı (normalize)
+        """
+        # Düşmanlar iç hücrelerde doğar (Level.get_random_position)
+        spawns = [cell for cell in cells if 1 <= cell[0] <= width - 2 and 1 <= cell[1] <= height - 2]
+        traffic = dict.fromkeys(cells, 0)
+
+        for spawn in spawns:
+            parent = {spawn: None}
+            order = [spawn]
+            queue = deque([spawn])
+            while queue:
+                x, y = queue.popleft()
+                for dx, dy in neighbors[(x, y)]:
+                    nxt = (x + dx, y + dy)
+                    if nxt not in parent:
+                        parent[nxt] = (x, y)
+                        order.append(nxt)
+                        queue.append(nxt)
+
+            # Ters BFS sırasıyla alt ağaç boyutları = hücreden geçen rota sayısı
+            subtree = dict.fromkeys(order, 1)
+            for cell in reversed(order):
+                if parent[cell] is not None:
+                    subtree[parent[cell]] += subtree[cell]
+            for cell in order:
+                if cell in traffic:
+                    traffic[cell] += subtree[cell]
+
+        peak = max(traffic.values()) if traffic else 0
+        return {cell: 1.0 + (traffic[cell] / peak if peak else 0.0) for cell in cells}
+
+    @staticmethod
+    def _sight_line(neighbors, cell):
+        """Hücreden dört yöne duvara kadar görülen hücreler"""
+        visible = {cell}
+        for direction in DIRECTIONS:
+            x, y = cell
+            while direction in neighbors.get((x, y), ()):
+                x += direction[0]
+                y += direction[1]
+                visible.add((x, y))
+        return frozenset(visible)
+
+    @staticmethod
+    def _coverage(visible, weights, covered):
+        return sum(weights.get(cell, 0.0) for cell in visible if cell not in covered)
+
+
+if __name__ == "__main__":
+    # Çevrimdışı: dizindeki tüm seviyeleri çöz
+    import os
+    import sys
+    directory = sys.argv[1] if len(sys.argv) > 1 else '.'
+    for name in sorted(f for f in os.listdir(directory) if f.endswith('.txt')):
+        grid = []
+        with open(os.path.join(directory, name), 'r') as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith('--'):
+                    grid.append([int(char) if char.isdigit() else 0 for char in line])
+        if not grid:
+            continue
+        start = time.perf_counter()
+        targets = GuardSolver.solve_grid(grid)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        print(f"{name}: sol {targets['left']}, sağ {targets['right']} ({elapsed_ms:.2f} ms)")
@@ -0,0 +1,114 @@
+# src/hud_text.py
+from collections import OrderedDict
+import pygame
+
+class HudText:
+    """
+    HUD metin önbelleği.
+    Fontlar bir kez çözülür, rakamlar önceden çizilmiş glif atlasından
+    birleştirilir ve her metin yüzeyi değeri değişene kadar yeniden kullanılır.
+    """
+    DEFAULT_FONT = "Consolas"
+    # Başlangıçta çözülen (boyut, kalın) çiftleri - oyunun kullandığı fontlar
+    PRELOAD_SIZES = ((8, True), (10, True), (12, False), (14, False), (14, True), (16, True),
+                     (18, True), (28, False), (32, True), (48, False))
+    DIGITS = "0123456789-"
+    MAX_CACHED_SURFACES = 256
+
+    _fonts = {}
+    _glyphs = {}
+    _surfaces = OrderedDict()
+    _stats = {'font_loads': 0, 'renders': 0, 'hits': 0}
+
+    @staticmethod
+    def init(font_name=DEFAULT_FONT):
+        """Oyunun kullandığı fontları başlangıçta yükle"""
+        if not pygame.font.get_init():
+            pygame.font.init()
+        for size, bold in HudText.PRELOAD_SIZES:
+            HudText.get_font(size, bold, font_name)
+
+    @staticmethod
+    def get_font(size, bold=False, font_name=DEFAULT_FONT):
+        """Önbellekli SysFont - sistem font araması sadece ilk çağrıda yapılır"""
+        key = (font_name, size, bold)
+        font = HudText._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(font_name, size, bold=bold)
+            HudText._fonts[key] = font
+            HudText._stats['font_loads'] += 1
+        return font
+
+    @staticmethod
+    def render(text, size, color, bold=False, antialias=False, font_name=DEFAULT_FONT):
+        """Metni önbellekten döndür; yoksa bir kez çiz"""
+        key = ('text', text, font_name, size, bold, tuple(color), antialias)
+        surface = HudText._lookup(key)
+        if surface is None:
+            surface = HudText.get_font(size, bold, font_name).render(text, antialias, color)
+            HudText._store(key, surface)
+        return surface
+
+    @staticmethod
+    def render_number(value, size, color, bold=False, font_name=DEFAULT_FONT):
+        """Sayıyı glif atlasındaki rakamlardan birleştir - font.render çağrılmaz"""
+        text = str(value)
+        key = ('number', text, font_name, size, bold, tuple(color))
+        surface = HudText._lookup(key)
+        if surface is not None:
+            return surface
+
+        glyphs = HudText._glyph_atlas(font_name, size, bold, color)
+        if any(char not in glyphs for char in text):
+            return HudText.render(text, size, color, bold, False, font_name)
+
+        width = sum(glyphs[char].get_width() for char in text)
+        height = max(glyphs[char].get_height() for char in text)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        x = 0
+        for char in text:
+            surface.blit(glyphs[char], (x, 0))
+            x += glyphs[char].get_width()
+
+        HudText._store(key, surface)
+        return surface
+
+    @staticmethod
+    def clear():
+        HudText._surfaces.clear()
+        HudText._glyphs.clear()
+
+    @staticmethod
+    def get_stats():
+        stats = dict(HudText._stats)
+        stats['cached_surfaces'] = len(HudText._surfaces)
+        stats['fonts'] = len(HudText._fonts)
+        return stats
+
+    @staticmethod
+    def _glyph_atlas(font_name, size, bold, color):
+        """Font + renk başına rakam glifleri (bir kez çizilir)"""
+        key = (font_name, size, bold, tuple(color))
+        glyphs = HudText._glyphs.get(key)
+        if glyphs is None:
+            font = HudText.get_font(size, bold, font_name)
+            glyphs = {char: font.render(char, False, color) for char in HudText.DIGITS}
+            HudText._glyphs[key] = glyphs
+        return glyphs
+
+    @staticmethod
+    def _lookup(key):
+        surface = HudText._surfaces.get(key)
+        if surface is not None:
+            HudText._surfaces.move_to_end(key)
+            HudText._stats['hits'] += 1
+        return surface
+
+    @staticmethod
+    def _store(key, surface):
+        HudText._stats['renders'] += 1
+        HudText._surfaces[key] = surface
+        if len(HudText._surfaces) > HudText.MAX_CACHED_SURFACES:
+            # En uzun süredir kullanılmayan yüzeyi at
+            HudText._surfaces.popitem(last=False)
@@ -1,8 +1,9 @@
 # src/main_game_loop.py
 import pygame
 import time
-import threading
+from collections import deque
 from enum import Enum
+from src.simple_controls import SimpleControls
 
 class GameState(Enum):
     MENU = 0
@@ -11,331 +12,235 @@ class GameState(Enum):
     GAME_OVER = 3
     VICTORY = 4
 
+class LoopPhase(Enum):
+    """Frame fazları - her frame bu sırayla çalışır"""
+    INPUT = "input"
+    AI_SYNC = "ai_sync"
+    SIMULATE = "simulate"
+    PHYSICS_APPLY = "physics_apply"
+    RENDER = "render"
+    PRESENT = "present"
+
+class PacingPolicy(Enum):
+    """Frame'ler arası bekleme politikası"""
+    VSYNC = "vsync"         # Ekran yenilemesine kilitli - flip bekler, saat sınırlamaz
+    FIXED_60 = "fixed60"    # clock.tick ile TARGET_FPS'e sınırlı
+    UNCAPPED = "uncapped"   # Bekleme yok, gerçek frame süresi ölçülür
+    HEADLESS = "headless"   # Çizim ve bekleme yok, dt sabit 1/TARGET_FPS
+
+    @staticmethod
+    def from_name(name):
+        for policy in PacingPolicy:
+            if policy.value == str(name).strip().lower():
+                return policy
+        print(f"⚠️ Bilinmeyen döngü hızı politikası: {name} - fixed60 kullanılıyor")
+        return PacingPolicy.FIXED_60
+
 class MainGameLoop:
-    """Ana oyun döngüsü koordinatörü - Thread orchestration"""
-    
-    def __init__(self, game_instance):
+    """
+    Tek yetkili oyun döngüsü.
+    Her frame girdi -> AI senkronu -> simülasyon -> fizik uygulama -> çizim -> sunum
+    fazlarını sırayla çalıştırır ve her fazın süresini ölçer; frame'ler arası
+    bekleme PacingPolicy ile seçilir.
+    """
+    TARGET_FPS = 60
+    # Faz istatistikleri son bu kadar frame üzerinden hesaplanır
+    STATS_WINDOW = 120
+    # Performans raporu ve thread sağlık kontrolü aralığı (saniye)
+    REPORT_INTERVAL = 5.0
+
+    def __init__(self, game_instance, pacing=PacingPolicy.FIXED_60):
         self.game = game_instance  # WizardOfWor referansı
-        
-        # Thread coordination
+        self.pacing = pacing
+        self.clock = game_instance.clock
         self.running = True
-        self.game_state = GameState.MENU
-        self.target_fps = 60
-        self.clock = pygame.time.Clock()
-        
-        # Performance tracking
+
         self.frame_count = 0
-        self.last_performance_check = time.time()
-        self.frame_times = []
-        
-        # Thread synchronization
-        self.main_lock = threading.Lock()
-        self.frame_ready = threading.Event()
-        
-        # Main thread duties
-        self.duties = {
-            'event_handling': True,
-            'thread_coordination': True, 
-            'render_orchestration': True,
-            'game_state_sync': True,
-            'performance_monitoring': True
-        }
-        
-        print("🎮 MainGameLoop initialized")
-    
-    def run(self):
-        """Ana thread döngüsü - koordinasyon odaklı"""
+        # Thread'siz modda PHYSICS_APPLY'da işlenen fizik işi + ses komutu sayısı
+        self.unthreaded_jobs = 0
+        self._last_frame_time = None
+        self._last_report = time.perf_counter()
+
+        # Faz -> son STATS_WINDOW frame'in süreleri (ms)
+        self.phase_times = {phase: deque(maxlen=self.STATS_WINDOW) for phase in LoopPhase}
+        self.phase_max = {phase: 0.0 for phase in LoopPhase}
+        self.frame_times = deque(maxlen=self.STATS_WINDOW)
+        self.pacing_times = deque(maxlen=self.STATS_WINDOW)
+
+        print(f"🎮 MainGameLoop hazır ({self.pacing.value})")
+
+    def run(self, max_frames=None):
+        """
+        Döngüyü pencere kapanana (veya max_frames'e) kadar çalıştır
+
+        Returns:
+            int: Çalışan frame sayısı
+        """
         print("🚀 Main game loop başlatıldı")
-        
-        try:
-            while self.running:
-                frame_start_time = time.time()
-                
-                # 1. EVENT HANDLING (Main thread'in ana sorumluluğu)
-                self._handle_events()
-                
-                # 2. THREAD COORDINATION 
-                self._coordinate_threads()
-                
-                # 3. GAME STATE SYNCHRONIZATION
-                self._sync_game_state()
-                
-                # 4. RENDER ORCHESTRATION (Pygame render main thread'de olmalı)
-                self._orchestrate_render()
-                
-                # 5. PERFORMANCE MONITORING
-                self._monitor_performance(frame_start_time)
-                
-                # 6. FRAME RATE CONTROL
-                self.clock.tick(self.target_fps)
-                
-        except KeyboardInterrupt:
-            print("🛑 Ana döngü kullanıcı tarafından durduruldu")
-        except Exception as e:
-            print(f"❌ Ana döngü hatası: {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            self._shutdown()
-    
-    def _handle_events(self):
-        """Event handling - Main thread'in özel sorumluluğu"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                
-            elif event.type == pygame.KEYDOWN:
-                self._handle_keydown(event.key)
-                
-            elif event.type == pygame.KEYUP:
-                self._handle_keyup(event.key)
-                
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._handle_mouse(event.pos, event.button)
-    
-    def _handle_keydown(self, key):
-        """Klavye basma olayları"""
-        # Debug tuşları
-        if key == pygame.K_F10:
-            self._debug_all_threads()
-        elif key == pygame.K_F11:
-            self._toggle_performance_display()
-        elif key == pygame.K_ESCAPE:
-            if self.game_state == GameState.PLAYING:
-                self.game_state = GameState.PAUSED
-            elif self.game_state == GameState.PAUSED:
-                self.game_state = GameState.PLAYING
-        
-        # Oyun state'ine göre event'i ilet
-        if self.game_state == GameState.MENU:
-            self._handle_menu_key(key)
-        elif self.game_state == GameState.PLAYING:
-            self._handle_game_key(key)
-    
-    def _handle_keyup(self, key):
-        """Klavye bırakma olayları"""
-        # SimpleControls'a bildir
-        if hasattr(self.game, 'simple_controls'):
-            # Key release logic
-            pass
-    
-    def _handle_mouse(self, pos, button):
-        """Fare olayları"""
-        if self.game_state == GameState.MENU:
-            self.game.handle_mouse_event(pos, button)
-    
-    def _coordinate_threads(self):
-        """Thread'ler arası koordinasyon"""
-        if not self.game.thread_manager:
-            return
-        
-        # Thread sağlık kontrolü
-        thread_status = self.game.thread_manager.get_thread_status()
-        
-        # Ölü thread varsa uyar
-        if not thread_status.get('physics_thread_alive', False):
-            print("⚠️ Physics thread öldü!")
-        
-        if not thread_status.get('audio_manager_alive', False):
-            print("⚠️ Audio thread öldü!")
-        
-        # AI thread'leri kontrol et
-        if hasattr(self.game, 'ai_controller'):
-            self._coordinate_ai_threads()
-        
-        # Physics sonuçlarını işle
-        self._process_physics_results()
-        
-        # Physics'e yeni data gönder (gerekirse)
-        self._send_physics_data()
-    
-    def _coordinate_ai_threads(self):
-        """AI thread koordinasyonu"""
-        if self.game_state != GameState.PLAYING:
-            return
-            
-        # AI'lara oyun durumunu gönder
-        self.game.update_ai_game_state()
-        
-        # AI eylemlerini al
-        if self.game.ai_controller:
-            self.game.ai_controller.update_key_states()
-    
-    def _process_physics_results(self):
-        """Physics thread sonuçlarını işle"""
-        if not self.game.thread_manager:
-            return
-            
-        with self.game.thread_manager.physics_lock:
-            if self.game.thread_manager.physics_results:
-                self.game._apply_physics_results(
-                    self.game.thread_manager.physics_results
-                )
-                self.game.thread_manager.physics_results = None
-    
-    def _send_physics_data(self):
-        """Physics'e veri gönder"""
-        if self.game_state == GameState.PLAYING and self.game.bullets:
-            self.game._send_physics_data()
-    
-    def _sync_game_state(self):
-        """Oyun durumunu senkronize et"""
-        # Game state geçişlerini kontrol et
-        if self.game.game_over and self.game_state != GameState.GAME_OVER:
-            self.game_state = GameState.GAME_OVER
-            print("🎮 Game state: GAME_OVER")
-            
-        elif self.game.show_victory_screen and self.game_state != GameState.VICTORY:
-            self.game_state = GameState.VICTORY 
-            print("🎮 Game state: VICTORY")
-            
-        elif self.game.game_started and self.game_state != GameState.PLAYING:
-            self.game_state = GameState.PLAYING
-            print("🎮 Game state: PLAYING")
-            
-        elif self.game.player_selection_mode and self.game_state != GameState.MENU:
-            self.game_state = GameState.MENU
-            print("🎮 Game state: MENU")
-        
-        # State'e göre update'leri çağır
-        delta_time = self.clock.get_time() / 1000.0
-        
-        if self.game_state == GameState.PLAYING:
-            self._update_playing_state(delta_time)
-        elif self.game_state == GameState.MENU:
-            self._update_menu_state(delta_time)
-        elif self.game_state == GameState.GAME_OVER:
-            self._update_game_over_state(delta_time)
-        elif self.game_state == GameState.VICTORY:
-            self._update_victory_state(delta_time)
-    
-    def _update_playing_state(self, delta_time):
-        """Oyun state'ini güncelle"""
-        # Sadece main thread'in yapması gereken işler
-        self.game.update(delta_time)
-    
-    def _update_menu_state(self, delta_time):
-        """Menü state'ini güncelle"""
-        if self.game.player_selection_mode:
-            self.game.handle_player_selection(delta_time)
-        elif self.game.ai_selection_mode:
-            self.game.handle_ai_selection(delta_time)
-        elif self.game.human_ai_selection_mode:
-            self.game.handle_human_ai_selection(delta_time)
-    
-    def _update_game_over_state(self, delta_time):
-        """Game over state'ini güncelle"""
-        self.game.game_over_timer -= delta_time
-        if self.game.game_over_timer <= 0:
-            self.game.game_over = False
-            self.game_state = GameState.MENU
-    
-    def _update_victory_state(self, delta_time):
-        """Victory state'ini güncelle"""
-        self.game.victory_timer -= delta_time
-        if self.game.victory_timer <= 0:
-            self.game.show_victory_screen = False
-            self.game_state = GameState.MENU
-    
-    def _orchestrate_render(self):
-        """Render orchestration - Pygame render main thread'de"""
+        self._last_frame_time = time.perf_counter()
+
+        while self.running:
+            if not self.run_frame():
+                break
+            if max_frames is not None and self.frame_count >= max_frames:
+                break
+
+        return self.frame_count
+
+    def stop(self):
+        self.running = False
+
+    def run_frame(self, delta_time=None):
+        """
+        Tek frame çalıştır
+
+        Args:
+            delta_time: Frame süresi (None = politikaya göre ölç veya sabit kullan)
+
+        Returns:
+            bool: Oyun kapatılmak isteniyorsa False
+        """
+        if delta_time is None:
+            delta_time = self._frame_delta(time.perf_counter())
+
+        game = self.game
+        phases = self.frame_phases(delta_time)
         try:
-            # Render'ı organize et ama thread'lere dağıtma
-            self.game.draw()
-            
-        except Exception as e:
-            print(f"❌ Render orchestration hatası: {e}")
-    
-    def _monitor_performance(self, frame_start_time):
-        """Performance monitoring"""
-        frame_time = time.time() - frame_start_time
-        self.frame_times.append(frame_time)
+            while True:
+                if next(phases) == LoopPhase.SIMULATE and game.ai_controller.sync_mode:
+                    # Senkron AI: kararlar frame içinde, oyun saatiyle verilir
+                    game.ai_controller.tick_ai_players(game.game_time)
+        except StopIteration as done:
+            running = done.value
+
+        self._wait_for_next_frame()
+        self.monitor(delta_time)
+        return running
+
+    def frame_phases(self, delta_time):
+        """
+        Tek frame'in fazlarını sırayla çalıştıran üreteç (bekleme hariç).
+        SIMULATE fazında oyun güncellemesinden sonra LoopPhase.SIMULATE verilir;
+        adımlı AI'ları yalnız sürücü adımlar: run_frame senkron modda
+        tick_ai_players çağırır, AsyncGameLoop kendi AI görevlerini bekler.
+
+        Returns:
+            bool: process_events sonucu (StopIteration.value)
+        """
+        game = self.game
+        frame_start = time.perf_counter()
+
+        with self._phase(LoopPhase.INPUT):
+            running = game.process_events()
+
+        with self._phase(LoopPhase.AI_SYNC):
+            # AI eylemleri girdi maskelerine dönüştükten sonra girdi görüntüsü alınır
+            game._sync_ai_actions()
+            SimpleControls.get_states()
+
+        with self._phase(LoopPhase.SIMULATE):
+            game.update(delta_time)
+            # AI adımı sürücüde: run_frame senkron tick, AsyncGameLoop kendi görevleri
+            yield LoopPhase.SIMULATE
+
+        with self._phase(LoopPhase.PHYSICS_APPLY):
+            if game.thread_communication_enabled and game.thread_manager:
+                # Thread'siz modda bekleyen fizik/ses işleri burada çalışır
+                if game.actor_system is None:
+                    self.unthreaded_jobs += game.thread_manager.process_unthreaded()
+                game._apply_pending_physics()
+                game._send_data_to_threads()
+
+        if self.pacing != PacingPolicy.HEADLESS:
+            with self._phase(LoopPhase.RENDER):
+                game.draw()
+
+            with self._phase(LoopPhase.PRESENT):
+                game.present()
+
         self.frame_count += 1
-        
-        # Son 60 frame'i tut
-        if len(self.frame_times) > 60:
-            self.frame_times.pop(0)
-        
-        # 5 saniyede bir rapor et
-        current_time = time.time() 
-        if current_time - self.last_performance_check > 5.0:
-            self._report_performance()
-            self.last_performance_check = current_time
-    
-    def _report_performance(self):
-        """Performance raporu"""
-        if not self.frame_times:
+        self.frame_times.append((time.perf_counter() - frame_start) * 1000.0)
+        return running
+
+    def get_phase_stats(self):
+        """Faz başına ortalama/en yüksek süre (ms) ve bekleme süresi"""
+        stats = {}
+        for phase, times in self.phase_times.items():
+            stats[phase.value] = {
+                'avg_ms': sum(times) / len(times) if times else 0.0,
+                'max_ms': self.phase_max[phase]
+            }
+        stats['frame'] = {
+            'avg_ms': sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0,
+            'max_ms': max(self.frame_times) if self.frame_times else 0.0
+        }
+        stats['pacing'] = {
+            'avg_ms': sum(self.pacing_times) / len(self.pacing_times) if self.pacing_times else 0.0,
+            'max_ms': max(self.pacing_times) if self.pacing_times else 0.0
+        }
+        return stats
+
+    def current_state(self):
+        """Oyun bayraklarından türetilen durum - debug çıktısı için"""
+        game = self.game
+        if game.show_victory_screen:
+            return GameState.VICTORY
+        if game.game_over:
+            return GameState.GAME_OVER
+        if game.game_started:
+            return GameState.PLAYING
+        return GameState.MENU
+
+    def _frame_delta(self, now):
+        if self.pacing == PacingPolicy.HEADLESS or self._last_frame_time is None:
+            self._last_frame_time = now
+            return 1.0 / self.TARGET_FPS
+
+        delta_time = now - self._last_frame_time
+        self._last_frame_time = now
+        return delta_time
+
+    def _wait_for_next_frame(self):
+        start = time.perf_counter()
+        if self.pacing == PacingPolicy.FIXED_60:
+            self.clock.tick(self.TARGET_FPS)
+        elif self.pacing in (PacingPolicy.VSYNC, PacingPolicy.UNCAPPED):
+            # Bekleme flip'te (vsync) veya hiç yok - sadece FPS ölçümü
+            self.clock.tick()
+        self.pacing_times.append((time.perf_counter() - start) * 1000.0)
+
+    def monitor(self, delta_time):
+        """Performans sayaçları ve aralıklı thread sağlık kontrolü (frame sonunda)"""
+        game = self.game
+        if self.pacing == PacingPolicy.HEADLESS:
             return
-            
-        avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-        fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
-        max_frame_time = max(self.frame_times)
-        min_frame_time = min(self.frame_times)
-        
-        print(f"📊 MAIN THREAD PERFORMANCE:")
-        print(f"  FPS: {fps:.1f}")
-        print(f"  Avg Frame Time: {avg_frame_time*1000:.2f}ms")
-        print(f"  Min/Max: {min_frame_time*1000:.2f}ms / {max_frame_time*1000:.2f}ms")
-        
-        # Thread durumları
-        if self.game.thread_manager:
-            status = self.game.thread_manager.get_thread_status()
-            print(f"  Active Threads: {status['active_threads']}")
-            print(f"  Physics Queue: {status['physics_queue_size']}")
-    
-    def _debug_all_threads(self):
-        """Tüm thread'leri debug et"""
-        print("\n" + "="*60)
-        print("🔍 ALL THREADS DEBUG")
-        print("="*60)
-        
-        # Main thread
-        print(f"🎮 Main Thread:")
-        print(f"  State: {self.game_state}")
-        print(f"  FPS: {self.clock.get_fps():.1f}")
-        print(f"  Frame Count: {self.frame_count}")
-        
-        # Diğer thread'ler
-        if self.game.thread_manager:
-            status = self.game.thread_manager.get_thread_status()
-            print(f"\n🧵 Thread Status:")
-            for key, value in status.items():
-                print(f"  {key}: {value}")
-        
-        # AI threads
-        if hasattr(self.game, 'ai_controller'):
-            print(f"\n🤖 AI Threads:")
-            print(f"  AI1 Active: {self.game.ai_controller.ai_player1 is not None}")
-            print(f"  AI2 Active: {self.game.ai_controller.ai_player2 is not None}")
-        
-        print("="*60 + "\n")
-    
-    def _toggle_performance_display(self):
-        """Performance display'i aç/kapat"""
-        self.game.performance_logging_enabled = not self.game.performance_logging_enabled
-        status = "AÇIK" if self.game.performance_logging_enabled else "KAPALI"
-        print(f"📊 Performance display: {status}")
-    
-    def _handle_menu_key(self, key):
-        """Menü tuşları"""
-        # Menü navigation'ını game instance'a ilet
-        pass
-    
-    def _handle_game_key(self, key):
-        """Oyun tuşları"""
-        # Game input'ları SimpleControls'a iletilecek
-        pass
-    
-    def _shutdown(self):
-        """Main thread shutdown"""
-        print("🛑 Main thread kapatılıyor...")
-        
-        # Diğer thread'leri durdur
-        if self.game.thread_manager:
-            self.game.thread_manager.stop_threads()
-        
-        # AI controller'ı durdur
-        if hasattr(self.game, 'ai_controller'):
-            self.game.ai_controller.stop_all()
-        
-        print("🏁 Main thread kapatıldı")
\ No newline at end of file
+
+        game._update_performance_monitoring(pygame.time.get_ticks(), delta_time)
+
+        # Thread sağlığı frame başına değil, rapor aralığında kontrol edilir
+        now = time.perf_counter()
+        if now - self._last_report >= self.REPORT_INTERVAL:
+            self._last_report = now
+            if game.thread_communication_enabled and not game._check_thread_health():
+                print("⚠️ Thread sağlık kontrolü başarısız!")
+
+    def _phase(self, phase):
+        return _PhaseTimer(self, phase)
+
+class _PhaseTimer:
+    """Faz süresini ölçen bağlam yöneticisi"""
+    __slots__ = ('loop', 'phase', 'start')
+
+    def __init__(self, loop, phase):
+        self.loop = loop
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, traceback):
+        elapsed_ms = (time.perf_counter() - self.start) * 1000.0
+        self.loop.phase_times[self.phase].append(elapsed_ms)
+        if elapsed_ms > self.loop.phase_max[self.phase]:
+            self.loop.phase_max[self.phase] = elapsed_ms
+        return False
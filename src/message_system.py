@@ -1,8 +1,8 @@
 
 import threading
-import queue
+import itertools
 import time
-import uuid
+from collections import deque
 from enum import Enum
 from typing import Dict, Any, List
 
@@ -14,19 +14,117 @@ class MessageType(Enum):
     LEVEL_LOAD = 5
     INPUT_EVENT = 6
     GAME_EVENT = 7
+    # Oyun alt sistemleri arası tipli mesajlar
+    STATE_SNAPSHOT = 8
+    ACTION = 9
+    COLLISION_RESULT = 10
+    AUDIO_EVENT = 11
+    TELEMETRY = 12
+    ACTOR_FAILED = 13
     SHUTDOWN = 99
 
+class BackPressure(Enum):
+    """Mesaj türü başına gelen kutusu doluluk politikası"""
+    UNBOUNDED = 0
+    DROP_OLDEST = 1   # Sınır dolunca en eski mesaj atılır (LATEST için sınır = 1)
+    DROP_NEWEST = 2   # Sınır dolunca yeni mesaj reddedilir
+
+# uuid4 yerine ucuz artan kimlik - itertools.count GIL altında atomik
+_message_ids = itertools.count(1)
+
 class Message:
+    __slots__ = ('id', 'type', 'sender_id', 'data', 'timestamp', 'priority')
+    
     def __init__(self, msg_type, sender_id, data=None, priority=0):
-        self.id = uuid.uuid4()
+        self.id = next(_message_ids)
         self.type = msg_type
         self.sender_id = sender_id
         self.data = data
-        self.timestamp = time.time()
+        self.timestamp = time.perf_counter()  # Monotonik - gecikme ölçümü için
         self.priority = priority  # 0 (normal) - 10 (en yüksek)
 
+class Mailbox:
+    """
+    Çok üreticili / tek tüketicili gelen kutusu.
+    Her öncelik seviyesi ayrı bir deque'dur; append/popleft GIL altında atomik
+    olduğu için gönderimde kilit alınmaz. Condition sadece tüketici beklerken
+    uyandırmak için kullanılır.
+    """
+    PRIORITY_LEVELS = 11
+    
+    def __init__(self):
+        self._lanes = [deque() for _ in range(self.PRIORITY_LEVELS)]
+        # Mesaj türü -> (politika, sınır, deque) - sınırlı türler ayrı kuyrukta tutulur
+        self._bounded = {}
+        self._condition = threading.Condition(threading.Lock())
+        self._waiting = False
+        self.dropped = 0
+    
+    def set_policy(self, msg_type, policy, limit=1):
+        """Mesaj türü için doluluk politikası - aktör başlamadan ayarlanmalı"""
+        if policy == BackPressure.UNBOUNDED:
+            self._bounded.pop(msg_type, None)
+            return
+        # DROP_OLDEST deque maxlen ile kilitsiz uygulanır
+        lane = deque(maxlen=limit if policy == BackPressure.DROP_OLDEST else None)
+        self._bounded[msg_type] = (policy, limit, lane)
+    
+    def put(self, message):
+        """Mesajı ekle; politika nedeniyle atıldıysa False"""
+        bounded = self._bounded.get(message.type)
+        if bounded is None:
+            priority = min(max(message.priority, 0), self.PRIORITY_LEVELS - 1)
+            self._lanes[priority].append(message)
+        else:
+            policy, limit, lane = bounded
+            if len(lane) >= limit:
+                self.dropped += 1
+                if policy == BackPressure.DROP_NEWEST:
+                    return False
+            lane.append(message)
+        
+        # Tüketici bekliyorsa uyandır - yoksa kilide hiç dokunulmaz
+        if self._waiting:
+            with self._condition:
+                self._condition.notify()
+        return True
+    
+    def drain(self, max_messages):
+        """En yüksek öncelikten başlayarak en fazla max_messages mesaj al (sınırlı türler en son)"""
+        batch = []
+        lanes = list(reversed(self._lanes))
+        lanes.extend(lane for _, _, lane in self._bounded.values())
+        for lane in lanes:
+            while lane and len(batch) < max_messages:
+                batch.append(lane.popleft())
+            if len(batch) >= max_messages:
+                break
+        return batch
+    
+    def wait(self, timeout):
+        """Mesaj gelene kadar (veya timeout dolana kadar) bekle"""
+        with self._condition:
+            self._waiting = True
+            try:
+                if self.empty():
+                    self._condition.wait(timeout)
+            finally:
+                self._waiting = False
+    
+    def wake(self):
+        with self._condition:
+            self._condition.notify()
+    
+    def empty(self):
+        return not any(self._lanes) and not any(lane for _, _, lane in self._bounded.values())
+    
+    def qsize(self):
+        return (sum(len(lane) for lane in self._lanes) +
+                sum(len(lane) for _, _, lane in self._bounded.values()))
+
 class MessageBus:
     def __init__(self):
+        # Kopyala-yaz kayıt: yönlendirme kilitsiz okur, sadece kayıt değişiklikleri kilitlenir
         self.actors = {}
         self.lock = threading.Lock()
         self.stats = {
@@ -38,99 +136,142 @@ class MessageBus:
     def register_actor(self, actor):
         """Aktörü mesaj sistemine kaydeder"""
         with self.lock:
-            self.actors[actor.actor_id] = actor
+            actors = dict(self.actors)
+            actors[actor.actor_id] = actor
+            self.actors = actors
     
     def unregister_actor(self, actor_id):
         """Aktörü mesaj sisteminden çıkarır"""
         with self.lock:
             if actor_id in self.actors:
-                del self.actors[actor_id]
+                actors = dict(self.actors)
+                del actors[actor_id]
+                self.actors = actors
     
     def route_message(self, target_id, message):
         """Mesajı hedef aktöre yönlendirir"""
-        with self.lock:
-            if target_id in self.actors:
-                self.actors[target_id].receive(message)
-                self.stats['routed_messages'] += 1
-            else:
-                self.stats['dropped_messages'] += 1
+        actor = self.actors.get(target_id)
+        if actor is not None:
+            actor.receive(message)
+            self.stats['routed_messages'] += 1
+        else:
+            self.stats['dropped_messages'] += 1
     
     def broadcast_message(self, message):
         """Mesajı tüm aktörlere yayınlar"""
-        with self.lock:
-            for actor_id, actor in self.actors.items():
-                if actor_id != message.sender_id:  # Gönderene geri gönderme
-                    actor.receive(message)
-            self.stats['broadcast_messages'] += 1
+        for actor_id, actor in self.actors.items():
+            if actor_id != message.sender_id:  # Gönderene geri gönderme
+                actor.receive(message)
+        self.stats['broadcast_messages'] += 1
     
     def shutdown_all(self):
         """Tüm aktörlere kapatma mesajı gönderir"""
-        shutdown_msg = Message(MessageType.SHUTDOWN, "SYSTEM")
-        with self.lock:
-            for actor in self.actors.values():
-                actor.receive(shutdown_msg)
-
-    # message_system.py içinde devam eder
+        shutdown_msg = Message(MessageType.SHUTDOWN, "SYSTEM", priority=10)
+        for actor in self.actors.values():
+            actor.receive(shutdown_msg)
+    
+    def get_stats(self):
+        """Bus sayaçları ve aktör başına verim/gecikme özeti"""
+        stats = dict(self.stats)
+        stats['actors'] = {actor_id: actor.get_stats() for actor_id, actor in self.actors.items()}
+        return stats
 
 class Actor(threading.Thread):
+    # Tek uyanışta işlenen en fazla mesaj
+    BATCH_SIZE = 64
+    # Mesaj yokken running kontrolü için en uzun bekleme (saniye)
+    IDLE_TIMEOUT = 0.1
+    
     def __init__(self, actor_id, message_bus):
         super().__init__()
         self.actor_id = actor_id
         self.message_bus = message_bus
-        self.inbox = queue.PriorityQueue()
+        self.inbox = Mailbox()
         self.running = True
         self.handlers = {}  # Mesaj işleyicileri
         self.state = {}  # Aktörün durumu
         self.daemon = True
         self.last_activity = time.time()
-        self.sleeping = False
         self.lock = threading.RLock()  # Yeniden girişli kilit
+        # Çökünce haber verilecek süpervizör (None = denetimsiz)
+        self.supervisor_id = None
+        self.stats = {
+            'received': 0,
+            'processed': 0,
+            'batches': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0
+        }
     
     def register_handler(self, msg_type, handler_func):
         """Mesaj türü için bir işleyici fonksiyon kaydeder"""
         self.handlers[msg_type] = handler_func
     
+    def set_back_pressure(self, policies):
+        """{MessageType: (BackPressure, sınır)} tablosunu gelen kutusuna uygula"""
+        for msg_type, (policy, limit) in policies.items():
+            self.inbox.set_policy(msg_type, policy, limit)
+    
     def send(self, target_id, msg_type, data=None, priority=0):
         """Başka bir aktöre mesaj gönderir"""
         message = Message(msg_type, self.actor_id, data, priority)
         self.message_bus.route_message(target_id, message)
-        
+    
     def broadcast(self, msg_type, data=None, priority=0):
         """Tüm aktörlere mesaj yayınlar"""
         message = Message(msg_type, self.actor_id, data, priority)
         self.message_bus.broadcast_message(message)
     
     def receive(self, message):
-        """Mesajı gelen kutusuna ekler"""
-        self.inbox.put((10-message.priority, message))  # Öncelik tersine çevrilir
-        
-        # Uyku modundaysa uyandır
-        if self.sleeping:
-            with self.lock:
-                self.sleeping = False
+        """Mesajı gelen kutusuna ekler - bekleyen aktör condition ile uyanır"""
+        if self.inbox.put(message):
+            self.stats['received'] += 1
     
-    def process_messages(self, max_messages=10):
-        """Belirli sayıda mesajı işler"""
-        processed = 0
+    def process_messages(self, max_messages=None):
+        """Gelen kutusunu tek partide boşaltır"""
+        batch = self.inbox.drain(max_messages or self.BATCH_SIZE)
+        if not batch:
+            return 0
         
-        while processed < max_messages and not self.inbox.empty():
-            try:
-                _, message = self.inbox.get(block=False)
-                self._handle_message(message)
-                self.inbox.task_done()
-                processed += 1
-                self.last_activity = time.time()
-            except queue.Empty:
+        now = time.perf_counter()
+        stats = self.stats
+        for message in batch:
+            latency = now - message.timestamp
+            stats['total_latency'] += latency
+            if latency > stats['max_latency']:
+                stats['max_latency'] = latency
+            self._handle_message(message)
+            if not self.running:
                 break
         
-        return processed
+        stats['processed'] += len(batch)
+        stats['batches'] += 1
+        self.last_activity = time.time()
+        return len(batch)
+    
+    def get_stats(self):
+        stats = dict(self.stats)
+        processed = stats['processed']
+        stats['avg_latency_ms'] = stats.pop('total_latency') / processed * 1000.0 if processed else 0.0
+        stats['max_latency_ms'] = stats.pop('max_latency') * 1000.0
+        stats['pending'] = self.inbox.qsize()
+        stats['dropped'] = self.inbox.dropped
+        return stats
+    
+    def stop(self):
+        self.running = False
+        self.inbox.wake()
+    
+    def on_idle(self):
+        """Mesaj gelmeden bekleme süresi dolduğunda çağrılır - alt sınıflar için"""
+        pass
     
     def _handle_message(self, message):
         """Mesajı uygun işleyiciye yönlendirir"""
         if message.type == MessageType.SHUTDOWN:
             self.running = False
             return
-            
+        
         if message.type in self.handlers:
             with self.lock:
                 self.handlers[message.type](message)
@@ -139,12 +280,142 @@ class Actor(threading.Thread):
     
     def run(self):
         """Aktör ana döngüsü"""
-        while self.running:
-            processed = self.process_messages()
-            
-            # Hiç mesaj işlenmediyse uyku moduna geç
-            if processed == 0:
-                if time.time() - self.last_activity > 0.1:  # 100ms aktivite olmazsa
-                    with self.lock:
-                        self.sleeping = True
-                time.sleep(0.001)  # CPU kullanımını azalt
\ No newline at end of file
+        try:
+            while self.running:
+                if self.process_messages() == 0:
+                    # Mesaj yoksa uyku - yeni mesaj condition üzerinden uyandırır
+                    self.inbox.wait(self.IDLE_TIMEOUT)
+                    self.on_idle()
+        except Exception as e:
+            self.running = False
+            print(f"💥 Aktör {self.actor_id} çöktü: {e}")
+            if self.supervisor_id is not None:
+                self.send(self.supervisor_id, MessageType.ACTOR_FAILED,
+                          {'actor': self, 'error': repr(e)}, priority=10)
+
+class Supervisor(Actor):
+    """
+    Çöken aktörleri fabrika fonksiyonlarıyla yeniden başlatır.
+    Yeni aktör eskisinin gelen kutusunu devralır, bekleyen mesajlar kaybolmaz.
+    restart_window saniye içinde max_restarts'tan fazla çöken aktör bırakılır.
+    """
+    SUPERVISOR_ID = "supervisor"
+    
+    def __init__(self, message_bus, max_restarts=3, restart_window=10.0):
+        super().__init__(self.SUPERVISOR_ID, message_bus)
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self._factories = {}
+        self._restart_times = {}
+        self.restarts = 0
+        self.abandoned = []
+        self.register_handler(MessageType.ACTOR_FAILED, self._on_actor_failed)
+    
+    def supervise(self, factory):
+        """factory() ile aktör oluştur, kaydet ve başlat"""
+        actor = factory()
+        self._factories[actor.actor_id] = factory
+        self._restart_times[actor.actor_id] = deque()
+        self._launch(actor)
+        return actor
+    
+    def forget(self, actor_id):
+        """Aktörü denetimden çıkar (durdurulmadan önce çağrılır)"""
+        self._factories.pop(actor_id, None)
+        self._restart_times.pop(actor_id, None)
+    
+    def _launch(self, actor):
+        actor.supervisor_id = self.actor_id
+        self.message_bus.register_actor(actor)
+        actor.start()
+    
+    def _on_actor_failed(self, message):
+        failed = message.data['actor']
+        actor_id = failed.actor_id
+        factory = self._factories.get(actor_id)
+        if factory is None:
+            return
+        
+        now = time.time()
+        history = self._restart_times[actor_id]
+        while history and now - history[0] > self.restart_window:
+            history.popleft()
+        
+        if len(history) >= self.max_restarts:
+            print(f"❌ Aktör {actor_id} çok sık çöktü, yeniden başlatılmıyor: {message.data['error']}")
+            self.forget(actor_id)
+            self.message_bus.unregister_actor(actor_id)
+            self.abandoned.append(actor_id)
+            return
+        
+        history.append(now)
+        actor = factory()
+        actor.inbox = failed.inbox
+        self._launch(actor)
+        self.restarts += 1
+        print(f"♻️ Aktör {actor_id} yeniden başlatıldı ({len(history)}/{self.max_restarts})")
+
+
+def benchmark_routing(message_count=200000, producers=1, actor_count=1):
+    """
+    Yönlendirme mikro-benchmark'ı: producers thread'i actor_count aktöre
+    toplam message_count mesaj gönderir.
+    
+    Returns:
+        dict: saniyedeki mesaj sayısı ve ortalama/en yüksek gecikme (ms)
+    """
+    bus = MessageBus()
+    done = threading.Event()
+    target = message_count
+    counter = itertools.count(1)
+    
+    def on_message(message):
+        if next(counter) == target:
+            done.set()
+    
+    actors = []
+    for index in range(actor_count):
+        actor = Actor(f"bench_{index}", bus)
+        actor.register_handler(MessageType.GAME_EVENT, on_message)
+        bus.register_actor(actor)
+        actor.start()
+        actors.append(actor)
+    
+    per_producer = message_count // producers
+    target = per_producer * producers
+    
+    def produce(producer_index):
+        route = bus.route_message
+        for i in range(per_producer):
+            route(f"bench_{(producer_index + i) % actor_count}",
+                  Message(MessageType.GAME_EVENT, "bench", i))
+    
+    threads = [threading.Thread(target=produce, args=(index,)) for index in range(producers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.wait(timeout=60)
+    elapsed = time.perf_counter() - start
+    
+    for actor in actors:
+        actor.stop()
+        actor.join(timeout=1)
+    
+    actor_stats = [actor.get_stats() for actor in actors]
+    processed = sum(stats['processed'] for stats in actor_stats)
+    return {
+        'messages': processed,
+        'seconds': elapsed,
+        'messages_per_second': processed / elapsed if elapsed > 0 else 0.0,
+        'avg_latency_ms': sum(stats['avg_latency_ms'] * stats['processed'] for stats in actor_stats) / max(processed, 1),
+        'max_latency_ms': max(stats['max_latency_ms'] for stats in actor_stats)
+    }
+
+
+if __name__ == "__main__":
+    for producers, actor_count in ((1, 1), (4, 1), (4, 4)):
+        result = benchmark_routing(producers=producers, actor_count=actor_count)
+        print(f"📨 {producers} üretici -> {actor_count} aktör: {result['messages_per_second']:,.0f} mesaj/s, "
+              f"ortalama gecikme {result['avg_latency_ms']:.2f} ms, en yüksek {result['max_latency_ms']:.2f} ms")
@@ -1,51 +1,41 @@
 # src/music_manager.py
-import pygame
+from src.audio_events import AudioEvents
+from src.audio_manager import SoundCategory
 
 class MusicManager:
+    """Nota/boss müziği zamanlaması - sesler AudioEvents üzerinden ses thread'inde çalar"""
+    
     def __init__(self):
         self._is_music_playing = False
         self._current_tempo_bps = 0
-        self._current_musique_time = 0
+        self._current_tempo_bpm = 0
         self._music_note_sounds = []
-        self._music_note_instances = []
-        self._current_music_note = 0
         
         self._tempos = [30.0, 40.0, 60.0, 120.0, 300.0]  # TEMPO_1,2,3,4,5
         
         self._worluk_intro = None
-        self._worluk_intro_instance = None
         self._worluk_loop = None
-        self._worluk_loop_instance = None
         
         self._is_boss_music = False
-        self._is_boss_intro_playing = False
     
     def load_music_sounds(self, sound_paths):
         # sound_paths: Dictionary olarak ses dosyalarının yollarını içermeli
         # Örnek: {'c_long': 'assets/sounds/C-long.wav', 'g_sharp_long': 'assets/sounds/G#-long.wav', ...}
+        # Sesler ses bankasında önceden yüklü - burada sadece yollar tutulur
         
-        # Ana müzik notalarını yükle
+        # Ana müzik notaları
         if 'c_long' in sound_paths and 'g_sharp_long' in sound_paths:
             self._music_note_sounds = [
-                pygame.mixer.Sound(sound_paths['c_long']),
-                pygame.mixer.Sound(sound_paths['g_sharp_long'])
-            ]
-            
-            # Ses örnekleri oluştur
-            self._music_note_instances = [
-                self._music_note_sounds[0],
-                self._music_note_sounds[1]
+                sound_paths['c_long'],
+                sound_paths['g_sharp_long']
             ]
         
-        # Boss müziklerini yükle
+        # Boss müzikleri
         if 'worluk_intro' in sound_paths:
-            self._worluk_intro = pygame.mixer.Sound(sound_paths['worluk_intro'])
-            self._worluk_intro_instance = self._worluk_intro
+            self._worluk_intro = sound_paths['worluk_intro']
         
         if 'worluk_loop' in sound_paths:
-            self._worluk_loop = pygame.mixer.Sound(sound_paths['worluk_loop'])
-            self._worluk_loop_instance = self._worluk_loop
-            # Sonsuz döngü ayarı pygame'de direk olarak yok, manuel olarak tekrar çalamak gerekebilir
+            self._worluk_loop = sound_paths['worluk_loop']
     
     def _set_tempo(self, tempo_bpm):
         self._current_tempo_bps = tempo_bpm / 60
@@ -53,59 +43,36 @@ class MusicManager:
     def start_music(self, tempo):
         self._is_boss_music = False
         self._set_tempo(tempo)
-        self._current_musique_time = 0
-        self._current_music_note = 0
+        self._current_tempo_bpm = tempo
         
-        if self._music_note_instances and len(self._music_note_instances) > 0:
-            self._music_note_instances[self._current_music_note].play()
+        if self._music_note_sounds:
+            # Vuruşlar ses thread'indeki sıralayıcıda önceden kuyruğa alınır
+            AudioEvents.start_heartbeat(self._music_note_sounds, tempo)
             self._is_music_playing = True
     
     def stop_music(self):
         self._is_music_playing = False
         self._is_boss_music = False
-        self._is_boss_intro_playing = False
-        
-        if self._music_note_instances and len(self._music_note_instances) > self._current_music_note:
-            self._music_note_instances[self._current_music_note].stop()
         
-        if self._worluk_intro_instance:
-            self._worluk_intro_instance.stop()
-        
-        if self._worluk_loop_instance:
-            self._worluk_loop_instance.stop()
+        AudioEvents.stop_sequencer()
+        # Notalar ve boss müziği aynı kanal kategorisinde
+        AudioEvents.stop(category=SoundCategory.MUSIC)
     
     def start_boss_music(self):
         self._is_boss_music = True
-        self._is_boss_intro_playing = True
         
-        if self._worluk_intro_instance:
-            self._worluk_intro_instance.play()
+        if self._worluk_intro or self._worluk_loop:
+            # Giriş bittiğinde döngü aynı kanalda boşluksuz devam eder
+            AudioEvents.start_intro_loop(self._worluk_intro, self._worluk_loop)
             self._is_music_playing = True
-            self._current_musique_time = 0
     
     def update(self, delta_time, level_threshold):
-        if self._is_music_playing:
-            self._current_musique_time += delta_time
-            
-            if self._is_boss_music:
-                if self._is_boss_intro_playing and self._worluk_intro and self._current_musique_time >= self._worluk_intro.get_length():
-                    if self._worluk_intro_instance:
-                        self._worluk_intro_instance.stop()
-                    
-                    if self._worluk_loop_instance:
-                        self._worluk_loop_instance.play(-1)  # -1: sonsuz döngü
-                        self._is_boss_intro_playing = False
-            else:
-                previous_tempo = self._current_tempo_bps
-                self._set_tempo(self._tempos[level_threshold])
-                
-                if self._current_musique_time > 1 / self._current_tempo_bps:
-                    if self._music_note_instances and len(self._music_note_instances) > self._current_music_note:
-                        self._music_note_instances[self._current_music_note].stop()
-                        self._current_music_note = 1 - self._current_music_note  # 0->1 veya 1->0
-                        self._music_note_instances[self._current_music_note].play()
-                        
-                        if previous_tempo != self._current_tempo_bps:
-                            self._current_musique_time = 0
-                        else:
-                            self._current_musique_time = self._current_musique_time - 1.0 / self._current_tempo_bps
\ No newline at end of file
+        # Zamanlama sıralayıcıda - burada sadece eşik değişince tempo gönderilir
+        if not self._is_music_playing or self._is_boss_music:
+            return
+        
+        tempo = self._tempos[level_threshold]
+        if tempo != self._current_tempo_bpm:
+            self._set_tempo(tempo)
+            self._current_tempo_bpm = tempo
+            AudioEvents.set_tempo(tempo)
@@ -0,0 +1,222 @@
+# src/path_benchmark.py
+import json
+import math
+import sys
+import time
+from src.level import Level
+from src.batch_simulator import load_level_tables
+from src.pathfinding_astar import find_path_astar, CachedAStar
+from src.pathfinding_greedy import find_path_greedy
+from src.pathfinding_dstar import DStarLite
+from src.utility_ai import DistanceTable
+
+class GridLevel(Level):
+    """
+    Level'in yalnız ızgara kısmı: yol bulucuların okuduğu alanlar ve
+    Level.is_walkable kuralı. Görüntü/ses yüklenmez, pygame ekranı gerekmez.
+    """
+
+    def __init__(self, grid, name):
+        self.name = name
+        self._grid = grid
+        self._width = len(grid[0])
+        self._height = len(grid)
+
+def percentile(values, percent):
+    """Sıralı listede en yakın sıra yüzdeliği"""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, math.ceil(percent / 100.0 * len(values)) - 1))
+    return values[rank]
+
+class PathBenchmark:
+    """
+    Seviyelerdeki tüm (başlangıç, hedef) hücre çiftleri üzerinde yol bulucuları
+    ölçer: sorgu gecikmesi (p50/p99), genişletilen düğüm sayısı ve A*'a göre
+    yol uzunluğu farkı (A* en kısa yolu verir).
+    - astar / greedy: her sorgu bağımsız
+    - astar_cached: önbellek bir tur ısıtıldıktan sonraki (isabetli) tur
+    - dstar: çiftler hedefe göre gruplanır (hedef sabit, başlangıç değişir)
+    - distance_table: hazır mesafe tablosundan step_towards ile yol çıkarma
+      (LevelTables.can_move grafiği; kenar satır/sütun kapalı)
+    """
+    PLANNERS = ('astar', 'greedy', 'astar_cached', 'dstar', 'distance_table')
+
+    def __init__(self, levels):
+        self.levels = levels
+
+    @staticmethod
+    def from_directory(directory='.'):
+        levels = [GridLevel(tables.grid.tolist(), tables.name) for tables in load_level_tables(directory)]
+        return PathBenchmark(levels)
+
+    def run(self):
+        """
+        Returns:
+            dict: JSON'a yazılabilir sonuç - 'planners' tüm seviyelerin toplamı,
+                  'per_level' seviye başına aynı özet
+        """
+        totals = {name: self._empty_samples() for name in self.PLANNERS}
+        per_level = {}
+        pair_count = 0
+
+        for level in self.levels:
+            cells = [(x, y) for y in range(level._height) for x in range(level._width)]
+            pairs = [(start, goal) for goal in cells for start in cells if start != goal]
+            pair_count += len(pairs)
+
+            samples = self._measure_level(level, pairs)
+            per_level[level.name] = {name: self._summary(sample) for name, sample in samples.items()}
+            for name, sample in samples.items():
+                for field, values in sample.items():
+                    totals[name][field].extend(values)
+
+        return {
+            'levels': [level.name for level in self.levels],
+            'pairs': pair_count,
+            'planners': {name: self._summary(sample) for name, sample in totals.items()},
+            'per_level': per_level
+        }
+
+    def _measure_level(self, level, pairs):
+        clock = time.perf_counter
+        samples = {name: self._empty_samples() for name in self.PLANNERS}
+        optimal = {}
+        stats = {}
+
+        sample = samples['astar']
+        for start, goal in pairs:
+            begin = clock()
+            path = find_path_astar(start, goal, level, stats=stats)
+            sample['latency_us'].append((clock() - begin) * 1e6)
+            sample['expansions'].append(stats['expansions'])
+            optimal[(start, goal)] = len(path)
+        self._record_found(sample, pairs, optimal, optimal)
+
+        sample = samples['greedy']
+        lengths = {}
+        for start, goal in pairs:
+            begin = clock()
+            path = find_path_greedy(start, goal, level, stats=stats)
+            sample['latency_us'].append((clock() - begin) * 1e6)
+            sample['expansions'].append(stats['expansions'])
+            lengths[(start, goal)] = len(path)
+        self._record_found(sample, pairs, lengths, optimal)
+
+        sample = samples['astar_cached']
+        cached = CachedAStar(max_entries=len(pairs))
+        for start, goal in pairs:
+            cached.find_path(start, goal, level)
+        lengths = {}
+        for start, goal in pairs:
+            begin = clock()
+            path = cached.find_path(start, goal, level, stats=stats)
+            sample['latency_us'].append((clock() - begin) * 1e6)
+            sample['expansions'].append(stats['expansions'])
+            lengths[(start, goal)] = len(path)
+        self._record_found(sample, pairs, lengths, optimal)
+
+        # Çiftler zaten hedefe göre gruplu; D* her hedef değişiminde sıfırlanır
+        sample = samples['dstar']
+        planner = DStarLite(level)
+        lengths = {}
+        for start, goal in pairs:
+            begin = clock()
+            path = planner.find_path(start, goal)
+            sample['latency_us'].append((clock() - begin) * 1e6)
+            sample['expansions'].append(planner.last_expansions)
+            lengths[(start, goal)] = len(path)
+        self._record_found(sample, pairs, lengths, optimal)
+
+        sample = samples['distance_table']
+        table = DistanceTable.for_level(level)
+        lengths = {}
+        for start, goal in pairs:
+            begin = clock()
+            length = self._table_path_length(table, start, goal)
+            sample['latency_us'].append((clock() - begin) * 1e6)
+            lengths[(start, goal)] = length
+        self._record_found(sample, pairs, lengths, optimal)
+
+        return samples
+
+    @staticmethod
+    def _table_path_length(table, start, goal):
+        """step_towards ile yürüyerek yol uzunluğu (ulaşılamıyorsa 0, find_path_* gibi)"""
+        current = table.index(*start)
+        target = table.index(*goal)
+        length = 0
+        while current != target:
+            direction = table.step_towards(current, target)
+            if direction < 0:
+                return 0
+            current = table.neighbor_list[current][direction]
+            length += 1
+        return length
+
+    @staticmethod
+    def _empty_samples():
+        return {'latency_us': [], 'expansions': [], 'found': [], 'extra_steps': [], 'missed': []}
+
+    @staticmethod
+    def _record_found(sample, pairs, lengths, optimal):
+        """A* ile karşılaştırma: bulunan yollarda fazladan adım, A*'ın bulup bulamadığı çiftler"""
+        for pair in pairs:
+            length, best = lengths[pair], optimal[pair]
+            sample['found'].append(1 if length else 0)
+            if length and best:
+                sample['extra_steps'].append(length - best)
+            elif best:
+                sample['missed'].append(1)
+
+    @staticmethod
+    def _summary(sample):
+        latency = sorted(sample['latency_us'])
+        expansions = sorted(sample['expansions'])
+        extra = sample['extra_steps']
+        suboptimal = [steps for steps in extra if steps > 0]
+        return {
+            'queries': len(latency),
+            'p50_us': round(percentile(latency, 50), 2),
+            'p99_us': round(percentile(latency, 99), 2),
+            'mean_us': round(sum(latency) / len(latency), 2) if latency else 0.0,
+            'expansions_mean': round(sum(expansions) / len(expansions), 2) if expansions else None,
+            'expansions_p99': percentile(expansions, 99) if expansions else None,
+            'found': sum(sample['found']),
+            'missed': len(sample['missed']),
+            'suboptimal': len(suboptimal),
+            'extra_steps_mean': round(sum(suboptimal) / len(suboptimal), 2) if suboptimal else 0.0,
+            'extra_steps_max': max(suboptimal) if suboptimal else 0
+        }
+
+def print_report(result):
+    print(f"📊 Yol bulma ölçümü: {len(result['levels'])} seviye, {result['pairs']} çift")
+    print(f"{'planlayıcı':<16}{'p50 µs':>9}{'p99 µs':>9}{'genişl.':>9}{'bulunan':>9}"
+          f"{'kaçan':>7}{'uzun':>7}{'+adım':>7}{'maks':>6}")
+    for name, summary in result['planners'].items():
+        expansions = summary['expansions_mean']
+        print(f"{name:<16}{summary['p50_us']:>9.1f}{summary['p99_us']:>9.1f}"
+              f"{expansions if expansions is not None else '-':>9}{summary['found']:>9}"
+              f"{summary['missed']:>7}{summary['suboptimal']:>7}"
+              f"{summary['extra_steps_mean']:>7}{summary['extra_steps_max']:>6}")
+
+if __name__ == "__main__":
+    # python -m src.path_benchmark [dizin] [--json=dosya]  ('--json=-' yalnız JSON'u stdout'a yazar)
+    directory = '.'
+    json_path = None
+    for arg in sys.argv[1:]:
+        if arg.startswith('--json='):
+            json_path = arg.split('=', 1)[1]
+        else:
+            directory = arg
+
+    result = PathBenchmark.from_directory(directory).run()
+    if json_path == '-':
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(result)
+        if json_path:
+            with open(json_path, 'w') as file:
+                json.dump(result, file, indent=2)
+            print(f"💾 JSON yazıldı: {json_path}")
@@ -1,22 +1,70 @@
 import heapq
+from collections import OrderedDict
+from src.guard_solver import GuardSolver
+
+# Ek maliyet katmanında bir hücrenin alabileceği en büyük değer (bytearray)
+MAX_CELL_COST = 255
 
 def manhattan_distance(a, b):
     """Heuristic: Manhattan mesafesi"""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def find_path_astar(start, goal, level):
+class CostOverlay:
+    """
+    Hücre başına ek giriş maliyeti (0-255), y * width + x indeksli bytearray.
+    Hücreye girmenin toplam maliyeti 1 + ek maliyet olduğundan Manhattan
+    sezgiseli kabul edilebilir kalır. İçerik her değiştiğinde generation
+    artar; önbellekli sorgular bununla geçersizlenir.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        self.generation = 0
+
+    def assign(self, costs):
+        """
+        Katmanı baştan kur
+
+        Args:
+            costs: {(x, y): ek maliyet} - listede olmayan hücreler 0
+        """
+        cells = bytearray(self.width * self.height)
+        for (x, y), cost in costs.items():
+            if 0 <= x < self.width and 0 <= y < self.height:
+                cells[y * self.width + x] = max(0, min(MAX_CELL_COST, int(cost)))
+        if cells != self.cells:
+            self.cells = cells
+            self.generation += 1
+
+    def cost(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        return 0
+
+def find_path_astar(start, goal, level, overlay=None, stats=None):
     """
     A* algoritması ile grid tabanlı yol bulma.
     start, goal: (x, y) koordinatları
     level: level nesnesi, is_walkable(x, y) fonksiyonu içermeli
+    overlay: CostOverlay - hücreye girme ek maliyeti (None = her adım 1)
+    stats: Verilirse stats['expansions'] genişletilen düğüm sayısıyla doldurulur
     """
+    extra = overlay.cells if overlay is not None else None
+    width = overlay.width if overlay is not None else 0
+
     open_set = []
     heapq.heappush(open_set, (0 + manhattan_distance(start, goal), 0, start))
     came_from = {start: None}
     cost_so_far = {start: 0}
+    expansions = 0
 
     while open_set:
         _, current_cost, current = heapq.heappop(open_set)
+        if current_cost > cost_so_far[current]:
+            continue  # Daha ucuz yoldan zaten genişletildi
+        expansions += 1
 
         if current == goal:
             break
@@ -30,12 +78,17 @@ def find_path_astar(start, goal, level):
                 continue
 
             new_cost = current_cost + 1
+            if extra is not None:
+                new_cost += extra[next_pos[1] * width + next_pos[0]]
             if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
                 cost_so_far[next_pos] = new_cost
                 priority = new_cost + manhattan_distance(next_pos, goal)
                 heapq.heappush(open_set, (priority, new_cost, next_pos))
                 came_from[next_pos] = current
 
+    if stats is not None:
+        stats['expansions'] = expansions
+
     # Yol oluşturuluyor
     path = []
     curr = goal
@@ -45,5 +98,49 @@ def find_path_astar(start, goal, level):
         path.append(curr)
         curr = came_from[curr]
     path.reverse()
-    print(f"[A*] path from {start} to {goal} → {path}")
     return path
+
+class CachedAStar:
+    """
+    Aynı seviye ve aynı overlay neslinde tekrarlanan sorgular için find_path_astar
+    önbelleği. Overlay değişince (generation) ya da seviye değişince önbellek boşalır;
+    dolunca en eski sorgu atılır.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._paths = OrderedDict()
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    def find_path(self, start, goal, level, overlay=None, stats=None):
+        """find_path_astar ile aynı; dönen liste çağırana aittir"""
+        version = (GuardSolver.level_key(level), id(overlay), overlay.generation if overlay is not None else -1)
+        if version != self._version:
+            self._paths.clear()
+            self._version = version
+
+        key = (start, goal)
+        path = self._paths.get(key)
+        if path is not None:
+            self.hits += 1
+            if stats is not None:
+                stats['expansions'] = 0
+            return list(path)
+
+        self.misses += 1
+        path = find_path_astar(start, goal, level, overlay, stats)
+        self._paths[key] = tuple(path)
+        if len(self._paths) > self.max_entries:
+            self._paths.popitem(last=False)
+        return path
+
+    def get_stats(self):
+        queries = self.hits + self.misses
+        return {
+            'queries': queries,
+            'hits': self.hits,
+            'hit_rate': self.hits / queries if queries else 0.0,
+            'entries': len(self._paths)
+        }
@@ -0,0 +1,255 @@
+# src/pathfinding_dstar.py
+import heapq
+from src.guard_solver import GuardSolver
+
+INF = float('inf')
+
+# Komşu sırası find_path_astar ile aynı: yukarı, sağ, aşağı, sol
+NEIGHBOR_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+class DStarLite:
+    """
+    Level ızgarası üzerinde artımlı yol bulucu (D* Lite).
+    Arama hedeften başlangıca doğru yapılır; g değerleri sorgular arasında saklanır:
+    - Başlangıç (AI) hareket edince sadece anahtar kayması (km) güncellenir
+    - Hedef sanal bir düğüme 0 maliyetli kenarla bağlıdır; hedef bir hücre
+      kayınca yalnızca eski ve yeni hedef hücrenin kenarı değişir (daha uzak
+      sıçramada arama sıfırlanır)
+    - set_cell_costs()/apply_overlay() ile hücreye girme maliyeti değişen
+      (ör. tehlikeli) hücrelerin komşuları onarılır
+    find_path_astar ile aynı yol biçimini döndürür; sorgu başına genişletme sayısı tutulur.
+    """
+    # Hücreye girmenin varsayılan maliyeti
+    BASE_COST = 1
+
+    def __init__(self, level):
+        self.width = level._width
+        self.height = level._height
+        self.level_key = GuardSolver.level_key(level)
+        count = self.width * self.height
+
+        # Hücre indeksi y * width + x; kenarlar Level.is_walkable ile (iki yönlü)
+        self._neighbors = []
+        for index in range(count):
+            x, y = index % self.width, index // self.width
+            self._neighbors.append([
+                (y + dy) * self.width + (x + dx) for dx, dy in NEIGHBOR_STEPS
+                if level.is_walkable(x, y, x + dx, y + dy)
+            ])
+
+        self._cost = [self.BASE_COST] * count
+        self._overlay_version = None
+        self._xs = [index % self.width for index in range(count)]
+        self._ys = [index // self.width for index in range(count)]
+        # Sanal hedef düğümü: tek öncülü geçerli hedef hücre
+        self._virtual_goal = count
+        self._goal = None
+        self._start = None
+        self._last_start = None
+        self._km = 0
+        self._g = []
+        self._rhs = []
+        self._open = {}
+        self._heap = []
+
+        self.queries = 0
+        self.total_expansions = 0
+        self.last_expansions = 0
+        self.resets = 0
+
+    # ------------------------------------------------------------------
+    # Sorgu
+    # ------------------------------------------------------------------
+
+    def find_path(self, start, goal):
+        """
+        Args:
+            start, goal: (x, y) hücreleri
+
+        Returns:
+            list: start hariç goal dahil hücre listesi, ulaşılamıyorsa []
+        """
+        self.queries += 1
+        self.last_expansions = 0
+        if not (self._inside(start) and self._inside(goal)):
+            return []
+        if start == goal:
+            return []
+
+        start_index = self._index(start)
+        goal_index = self._index(goal)
+
+        # Hedef birden fazla hücre sıçradıysa onarım yeni aramadan pahalıdır
+        if self._goal is None or self._heuristic(self._goal, goal_index) > self.BASE_COST:
+            self._reset(start_index, goal_index)
+        else:
+            if start_index != self._start:
+                self._km += self._heuristic(self._last_start, start_index)
+                self._last_start = start_index
+                self._start = start_index
+            if goal_index != self._goal:
+                previous = self._goal
+                self._goal = goal_index
+                self._update_vertex(previous)
+                self._update_vertex(goal_index)
+
+        self._compute_shortest_path()
+        self.total_expansions += self.last_expansions
+        return self._extract_path()
+
+    def set_cell_costs(self, costs):
+        """
+        Hücreye girme maliyetlerini ayarla; listede olmayan hücreler BASE_COST'a döner
+
+        Args:
+            costs: {(x, y): maliyet (>= BASE_COST)}
+        """
+        self._overlay_version = None
+        self._set_costs({self._index(cell): cost for cell, cost in costs.items() if self._inside(cell)})
+
+    def apply_overlay(self, overlay):
+        """CostOverlay'i uygula (giriş maliyeti BASE_COST + ek maliyet); nesil aynıysa iş yok"""
+        version = (id(overlay), overlay.generation)
+        if version == self._overlay_version:
+            return
+        self._overlay_version = version
+        self._set_costs({index: self.BASE_COST + extra for index, extra in enumerate(overlay.cells) if extra})
+
+    def _set_costs(self, wanted):
+        changed = [index for index, cost in enumerate(self._cost)
+                   if cost != wanted.get(index, self.BASE_COST)]
+        for index in changed:
+            self._cost[index] = wanted.get(index, self.BASE_COST)
+        if self._goal is None:
+            return
+        for index in changed:
+            for neighbor in self._neighbors[index]:
+                self._update_vertex(neighbor)
+
+    def get_stats(self):
+        return {
+            'queries': self.queries,
+            'expansions': self.total_expansions,
+            'avg_expansions': self.total_expansions / self.queries if self.queries else 0.0,
+            'last_expansions': self.last_expansions,
+            'resets': self.resets
+        }
+
+    # ------------------------------------------------------------------
+    # D* Lite
+    # ------------------------------------------------------------------
+
+    def _reset(self, start, goal):
+        count = len(self._cost) + 1
+        self._g = [INF] * count
+        self._rhs = [INF] * count
+        self._open = {}
+        self._heap = []
+        self._km = 0
+        self._start = self._last_start = start
+        self._goal = goal
+        self._rhs[self._virtual_goal] = 0
+        self._push(self._virtual_goal)
+        self.resets += 1
+
+    def _heuristic(self, a, b):
+        """Manhattan - her kenar en az BASE_COST olduğundan kabul edilebilir"""
+        if b == self._virtual_goal:
+            b = self._goal
+        return (abs(self._xs[a] - self._xs[b]) + abs(self._ys[a] - self._ys[b])) * self.BASE_COST
+
+    def _key(self, index):
+        best = min(self._g[index], self._rhs[index])
+        return (best + self._heuristic(self._start, index) + self._km, best)
+
+    def _push(self, index):
+        key = self._key(index)
+        self._open[index] = key
+        heapq.heappush(self._heap, (key, index))
+
+    def _top(self):
+        """Geçerli en küçük anahtarlı kayıt (eski kayıtlar atılır)"""
+        heap, open_keys = self._heap, self._open
+        while heap:
+            key, index = heap[0]
+            if open_keys.get(index) == key:
+                return key, index
+            heapq.heappop(heap)
+        return None
+
+    def _update_vertex(self, index):
+        g = self._g
+        if index != self._virtual_goal:
+            # rhs = min(kenar + g) ardıllar üzerinden; hedef hücre sanal hedefe 0 maliyetle bağlı
+            cost = self._cost
+            best = g[self._virtual_goal] if index == self._goal else INF
+            for neighbor in self._neighbors[index]:
+                value = cost[neighbor] + g[neighbor]
+                if value < best:
+                    best = value
+            self._rhs[index] = best
+        if g[index] != self._rhs[index]:
+            self._push(index)
+        else:
+            self._open.pop(index, None)
+
+    def _predecessors(self, index):
+        if index == self._virtual_goal:
+            return (self._goal,)
+        return self._neighbors[index]
+
+    def _compute_shortest_path(self):
+        start = self._start
+        g, rhs = self._g, self._rhs
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            key, index = top
+            if key >= self._key(start) and rhs[start] <= g[start]:
+                break
+
+            new_key = self._key(index)
+            if key < new_key:
+                self._push(index)
+                continue
+
+            heapq.heappop(self._heap)
+            del self._open[index]
+            self.last_expansions += 1
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]
+            else:
+                g[index] = INF
+                self._update_vertex(index)
+            for predecessor in self._predecessors(index):
+                self._update_vertex(predecessor)
+
+    def _extract_path(self):
+        """Başlangıçtan en küçük (kenar + g) komşuyu izleyerek hedefe yürü"""
+        g = self._g
+        current = self._start
+        # Arama başlangıç düşük tutarlıyken (g > rhs) durabilir; mesafe rhs'tedir
+        if self._rhs[current] == INF:
+            return []
+
+        path = []
+        for _ in range(len(self._cost)):
+            if current == self._goal:
+                return path
+            best, best_value = None, INF
+            for neighbor in self._neighbors[current]:
+                value = self._cost[neighbor] + g[neighbor]
+                if value < best_value:
+                    best, best_value = neighbor, value
+            if best is None:
+                return []
+            current = best
+            path.append((current % self.width, current // self.width))
+        return []
+
+    def _index(self, cell):
+        return cell[1] * self.width + cell[0]
+
+    def _inside(self, cell):
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
@@ -4,19 +4,22 @@ def manhattan_distance(a, b):
     """Heuristic: Manhattan mesafesi"""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def find_path_greedy(start, goal, level):
+def find_path_greedy(start, goal, level, stats=None):
     """
     Greedy Best-First Search ile yol bulur.
     start: (x, y)
     goal: (x, y)
-    level: Level nesnesi (level.is_walkable(x, y) fonksiyonuna sahip olmalı)
+    level: Level nesnesi (level.is_walkable(from_x, from_y, to_x, to_y) fonksiyonuna sahip olmalı)
+    stats: Verilirse stats['expansions'] genişletilen düğüm sayısıyla doldurulur
     """
     frontier = []
     heapq.heappush(frontier, (manhattan_distance(start, goal), start))
     came_from = {start: None}
+    expansions = 0
 
     while frontier:
         _, current = heapq.heappop(frontier)
+        expansions += 1
 
         if current == goal:
             break
@@ -24,10 +27,13 @@ def find_path_greedy(start, goal, level):
         x, y = current
         for dx, dy in [(0, -1), (1, 0), (0, 1), (-1, 0)]:  # yukarı, sağ, aşağı, sol
             next_pos = (x + dx, y + dy)
-            if level.is_walkable(*next_pos) and next_pos not in came_from:
+            if level.is_walkable(x, y, next_pos[0], next_pos[1]) and next_pos not in came_from:
                 heapq.heappush(frontier, (manhattan_distance(next_pos, goal), next_pos))
                 came_from[next_pos] = current
 
+    if stats is not None:
+        stats['expansions'] = expansions
+
     # Yol oluşturuluyor
     path = []
     curr = goal
@@ -37,5 +43,4 @@ def find_path_greedy(start, goal, level):
         path.append(curr)
         curr = came_from[curr]
     path.reverse()
-    print(f"[GREEDY] path from {start} to {goal} → {path}")
-    return path
\ No newline at end of file
+    return path
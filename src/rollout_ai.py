@@ -0,0 +1,393 @@
+# src/rollout_ai.py
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+import numpy as np
+from src.ai_player import AIPlayerBase, AIAction
+from src.batch_simulator import (
+    BatchSimulator, LevelTables, UP, DOWN, LEFT, RIGHT, SHOOT, CELL_WIDTH, CELL_HEIGHT
+)
+from src.config_manager import ConfigManager
+from src.constants import Constants
+from src.guard_solver import GuardSolver
+
+# Aday eylemler - indeksler AIAction değerleriyle aynı (MOVE_UP=0 ... NO_ACTION=5)
+CANDIDATES = 6
+
+class RolloutPlanner:
+    """
+    Aday eylemleri kısa ileri simülasyonlarla (rollout) puanlar.
+    Oyun durumu BatchSimulator'ın tek oyunluk durum sözlüğüne çevrilir ve
+    (aday x rollout) oyuna kopyalanır: her oyun ilk COMMIT_FRAMES frame adayını,
+    sonra rastgele varsayılan politikayı oynar. İşçi thread'leri kendi
+    simülatörlerinde paketleri bütçe dolana kadar koşturur; süresi dolan paket
+    ulaştığı derinlikte değerlendirilir (paketteki tüm adaylar aynı derinlikte).
+    """
+    # Rollout'lar 30 Hz adımlanır: ufuk başına yarı maliyet
+    FRAME_TIME = 1.0 / 30
+    # Adayın uygulandığı frame sayısı (~bir dönüş ve bir hücre adımı)
+    COMMIT_FRAMES = 6
+    # Varsayılan politika: frame başına yön değiştirme ve ateş olasılığı
+    TURN_CHANCE = 0.15
+    FIRE_CHANCE = 0.1
+    # Rollout içinde can kaybı (puan cinsinden)
+    DEATH_PENALTY = 1000.0
+    MAX_ENEMIES = 8
+    LATENCY_HISTORY = 240
+    # Frame süresi tahmininin yumuşatma katsayısı (bütçe aşımını önlemek için)
+    FRAME_COST_SMOOTHING = 0.1
+    # İşçiler bütçenin bu kadarında durur; kalanı toplama ve thread geçişleri için
+    WORKER_BUDGET_SHARE = 0.85
+
+    def __init__(self, budget_ms, horizon, rollouts_per_action, workers, seed=None):
+        """
+        Args:
+            budget_ms: Karar başına süre bütçesi (yakalama + rollout'lar)
+            horizon: Rollout uzunluğu (FRAME_TIME'lık frame)
+            rollouts_per_action: İşçi paketinde aday başına rollout
+            workers: İşçi thread sayısı (her birinin kendi simülatörü var)
+            seed: Rastgelelik tohumu (None = rastgele)
+        """
+        self.budget_ms = budget_ms
+        self.horizon = max(1, horizon)
+        self.rollouts_per_action = max(1, rollouts_per_action)
+        self.workers = max(1, workers)
+        self._seeds = np.random.SeedSequence(seed)
+
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='rollout')
+        self._pending = []
+        # Bir simülasyon frame'inin tahmini süresi: işçi sığmayacak frame'e başlamaz
+        self._frame_seconds = 0.0
+        self._level_key = None
+        # İşçi başına (simülatör, rastgele üreteç)
+        self._sims = []
+
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Değerlendirme
+    # ------------------------------------------------------------------
+
+    def evaluate(self, ai):
+        """
+        AI'ın son oyun durumundan aday eylemleri puanla
+
+        Returns:
+            np.ndarray: (CANDIDATES,) ortalama getiri, durum eksikse None
+        """
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000.0
+        worker_deadline = start + self.budget_ms * self.WORKER_BUDGET_SHARE / 1000.0
+        if not ai.level or not ai.player_position:
+            return None
+
+        # Önceki kararın geç kalan paketi simülatörü bırakmadan yeniden yazılmasın
+        if self._pending:
+            wait(self._pending)
+            self._pending = []
+
+        self._prepare(ai.level)
+        root = self.capture(ai)
+        me = ai.player_number.value
+        enemies_can_fire = any(enemy.get('can_fire', True) for enemy in ai.enemies)
+
+        futures = [self._pool.submit(self._run, sim, rng, root, me, enemies_can_fire, worker_deadline)
+                   for sim, rng in self._sims]
+        done, not_done = wait(futures, timeout=max(0.0, deadline - time.perf_counter()))
+        self._pending = list(not_done)
+
+        totals = np.zeros(CANDIDATES)
+        counts = np.zeros(CANDIDATES)
+        rollouts = frames = 0
+        for future in done:
+            batch_totals, batch_counts, batch_frames = future.result()
+            totals += batch_totals
+            counts += batch_counts
+            rollouts += int(batch_counts.sum())
+            frames += batch_frames
+
+        self._record(start, rollouts, frames, len(not_done))
+        if rollouts == 0:
+            return None
+        return totals / np.maximum(counts, 1)
+
+    def _run(self, sim, rng, root, me, enemies_can_fire, deadline):
+        """İşçi: bütçe dolana kadar paket paket rollout"""
+        totals = np.zeros(CANDIDATES)
+        counts = np.zeros(CANDIDATES)
+        frames = 0
+        sim.enemies_can_fire = enemies_can_fire
+        while time.perf_counter() + self._frame_seconds < deadline:
+            returns, depth = self._rollout(sim, rng, root, me, deadline)
+            np.add.at(totals, self._candidates, returns)
+            counts += self.rollouts_per_action
+            frames += depth * sim.num_games
+            if depth < self.horizon:
+                break
+        return totals, counts, frames
+
+    def _rollout(self, sim, rng, root, me, deadline):
+        """Tek paket: tüm oyunlar kökten başlar; (getiriler, ulaşılan derinlik)"""
+        sim.set_state(root)
+        games, players = sim.num_games, sim.num_players
+        lives = sim.p_lives[:, me].copy()
+        returns = np.zeros(games)
+        heading = rng.integers(0, 4, (games, players))
+
+        depth = 0
+        now = time.perf_counter()
+        while depth < self.horizon:
+            # En az bir frame; sonra bir frame daha sığmıyorsa dur
+            if depth and now + self._frame_seconds >= deadline:
+                break
+
+            turn = rng.random((games, players)) < self.TURN_CHANCE
+            heading[turn] = rng.integers(0, 4, int(turn.sum()))
+            actions = np.where(rng.random((games, players)) < self.FIRE_CHANCE, SHOOT, heading)
+            if depth < self.COMMIT_FRAMES:
+                actions[:, me] = self._candidates
+
+            rewards, dones = sim.step(actions)
+            returns += rewards[:, me]
+            depth += 1
+
+            previous, now = now, time.perf_counter()
+            self._frame_seconds += self.FRAME_COST_SMOOTHING * (now - previous - self._frame_seconds)
+            if dones.all():
+                break
+
+        returns -= (sim.p_lives[:, me] < lives) * self.DEATH_PENALTY
+        return returns, depth
+
+    # ------------------------------------------------------------------
+    # Durum yakalama
+    # ------------------------------------------------------------------
+
+    def capture(self, ai):
+        """AI'ın gördüğü oyun durumunu tek oyunluk simülatör durumuna çevir"""
+        state = self._sims[0][0].empty_state()
+        level = ai.level
+        state['tunnels_open'][0] = getattr(level, 'tunnels_open', True)
+        state['tunnel_timer'][0] = getattr(level, '_tunnel_timer', 0.0)
+
+        me = ai.player_number.value
+        self._place_player(state, me, ai.player_position, ai.player_direction, ai.player_in_cage)
+        if ai.other_player_position:
+            self._place_player(state, 1 - me, ai.other_player_position,
+                               ai.other_player_direction, ai.other_player_in_cage)
+        else:
+            # Diğer oyuncu yok: görünmez ve geri dönmez
+            state['p_lives'][0, 1 - me] = -1
+
+        enemy_positions = []
+        for index, enemy in enumerate(ai.enemies[:self.MAX_ENEMIES]):
+            x, y = enemy['position']
+            direction = self._direction(enemy.get('direction'))
+            state['e_cell'][0, index], state['e_progress'][0, index] = self._enemy_cell(x, y, direction)
+            state['e_dir'][0, index] = UP if direction is None else direction
+            state['e_alive'][0, index] = True
+            enemy_positions.append((x, y))
+
+        slot = 0
+        for bullet in ai.bullets:
+            owner = bullet.get('player_number')
+            if owner is not None:
+                state['pb_pos'][0, owner.value] = bullet['position']
+                state['pb_vel'][0, owner.value] = bullet['velocity']
+                state['pb_alive'][0, owner.value] = True
+            elif slot < state['eb_alive'].shape[1]:
+                state['eb_pos'][0, slot] = bullet['position']
+                state['eb_vel'][0, slot] = bullet['velocity']
+                state['eb_alive'][0, slot] = True
+                state['eb_owner'][0, slot] = self._nearest(enemy_positions, bullet['position'])
+                slot += 1
+        return state
+
+    def _place_player(self, state, index, position, direction, in_cage):
+        x, y = position
+        state['p_cell'][0, index] = (int(round(x / CELL_WIDTH)), int(round(y / CELL_HEIGHT)))
+        heading = self._direction(direction)
+        state['p_dir'][0, index] = UP if heading is None else heading
+        state['p_visible'][0, index] = True
+        state['p_in_cage'][0, index] = bool(in_cage)
+        state['p_lives'][0, index] = 1
+
+    @staticmethod
+    def _direction(vector):
+        """Hareket vektörü -> yön kodu (hareketsizse None)"""
+        if not vector:
+            return None
+        dx, dy = vector
+        if dx > 0:
+            return RIGHT
+        if dx < 0:
+            return LEFT
+        if dy > 0:
+            return DOWN
+        if dy < 0:
+            return UP
+        return None
+
+    @staticmethod
+    def _enemy_cell(x, y, direction):
+        """
+        Piksel konumu -> (çıkış hücresi, ilerleme).
+        Simülatörde konum = hücre + yön * ilerleme olduğundan sola/yukarı giden
+        düşmanın çıkış hücresi yukarı yuvarlanır.
+        """
+        if direction == RIGHT:
+            cell_x = x // CELL_WIDTH
+            return (cell_x, round(y / CELL_HEIGHT)), x - cell_x * CELL_WIDTH
+        if direction == LEFT:
+            cell_x = -(-x // CELL_WIDTH)
+            return (cell_x, round(y / CELL_HEIGHT)), cell_x * CELL_WIDTH - x
+        if direction == DOWN:
+            cell_y = y // CELL_HEIGHT
+            return (round(x / CELL_WIDTH), cell_y), y - cell_y * CELL_HEIGHT
+        if direction == UP:
+            cell_y = -(-y // CELL_HEIGHT)
+            return (round(x / CELL_WIDTH), cell_y), cell_y * CELL_HEIGHT - y
+        return (round(x / CELL_WIDTH), round(y / CELL_HEIGHT)), 0.0
+
+    @staticmethod
+    def _nearest(positions, point):
+        if not positions:
+            return 0
+        return min(range(len(positions)),
+                   key=lambda i: abs(positions[i][0] - point[0]) + abs(positions[i][1] - point[1]))
+
+    def _prepare(self, level):
+        """Seviye değiştiyse işçi simülatörlerini yeni tablolarla kur"""
+        key = GuardSolver.level_key(level)
+        if key == self._level_key:
+            return
+        self._level_key = key
+        tables = [LevelTables.from_level(level)]
+        games = CANDIDATES * self.rollouts_per_action
+        self._sims = []
+        for seed in self._seeds.spawn(self.workers):
+            sim_seed, policy_seed = seed.spawn(2)
+            sim = BatchSimulator(games, tables, num_players=2, num_enemies=self.MAX_ENEMIES,
+                                 frame_time=self.FRAME_TIME, auto_reset=False,
+                                 seed=sim_seed)
+            self._sims.append((sim, np.random.default_rng(policy_seed)))
+        # Oyun g'nin adayı g % CANDIDATES
+        self._candidates = np.arange(games) % CANDIDATES
+
+    # ------------------------------------------------------------------
+    # İstatistikler
+    # ------------------------------------------------------------------
+
+    def _record(self, start, rollouts, frames, late):
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.decisions += 1
+        self.rollouts += rollouts
+        self.frames += frames
+        self.total_ms += elapsed_ms
+        self.recent_ms.append(elapsed_ms)
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        if elapsed_ms > self.budget_ms:
+            self.overruns += 1
+        if late:
+            self.late_batches += late
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: decisions, rollouts, rollouts_per_decision, avg_depth, avg_ms, p95_ms,
+                  max_ms, overruns, late_batches, budget_ms
+        """
+        recent = sorted(self.recent_ms)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {
+            'decisions': self.decisions,
+            'rollouts': self.rollouts,
+            'rollouts_per_decision': self.rollouts / self.decisions if self.decisions else 0.0,
+            'avg_depth': self.frames / self.rollouts if self.rollouts else 0.0,
+            'avg_ms': self.total_ms / self.decisions if self.decisions else 0.0,
+            'p95_ms': p95,
+            'max_ms': self.max_ms,
+            'overruns': self.overruns,
+            'late_batches': self.late_batches,
+            'budget_ms': self.budget_ms
+        }
+
+    def reset_stats(self):
+        self.decisions = 0
+        self.rollouts = 0
+        self.frames = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.overruns = 0
+        self.late_batches = 0
+        self.recent_ms = deque(maxlen=self.LATENCY_HISTORY)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
+
+
+class AIPlayerRollout(AIPlayerBase):
+    """
+    Monte Carlo AI (MC): ızgara hücresinde her yeni oyun durumunda aday
+    eylemleri RolloutPlanner ile ileri simüle eder, en yüksek ortalama
+    getiriyi seçer. Rollout'lar adayları ayırt etmiyorsa (yakında ne puan
+    ne tehlike var) karar UtilityScorer'a bırakılır.
+    """
+
+    # Aday ortalamaları bundan az ayrışıyorsa rollout kararı verilmez (puan)
+    MIN_SPREAD = 1.0
+    # Aynı hücrede yeniden planlama aralığı (saniye)
+    REPLAN_INTERVAL = 0.1
+
+    def __init__(self, player_number, game_state_queue, action_queue, seed=None):
+        super().__init__(player_number, game_state_queue, action_queue, seed)
+        get = ConfigManager.get_config
+        self.planner = RolloutPlanner(
+            get(Constants.ROLLOUT_BUDGET_MS, Constants.DEFAULT_ROLLOUT_BUDGET_MS),
+            get(Constants.ROLLOUT_HORIZON, Constants.DEFAULT_ROLLOUT_HORIZON),
+            get(Constants.ROLLOUTS_PER_ACTION, Constants.DEFAULT_ROLLOUTS_PER_ACTION),
+            get(Constants.ROLLOUT_WORKERS, Constants.DEFAULT_ROLLOUT_WORKERS),
+            seed
+        )
+        # Rollout'lar yeni gelen durumda, hücre değişince ya da REPLAN_INTERVAL'da bir koşar;
+        # aradaki kararlar son planı tekrarlar
+        self._fresh_state = False
+        self._planned_action = None
+        self._planned_position = None
+        self._planned_time = 0.0
+
+    def _decide_from_state(self, game_state):
+        self._fresh_state = True
+        return super()._decide_from_state(game_state)
+
+    def decide_action(self):
+        if self.player_in_cage or not self.is_on_grid_cell():
+            return super().decide_action()
+
+        now = self._now()
+        replan = self._fresh_state and (self.player_position != self._planned_position or
+                                        now - self._planned_time >= self.REPLAN_INTERVAL)
+        self._fresh_state = False
+        if not replan:
+            if self._planned_action is not None and self._planned_action != AIAction.SHOOT:
+                return self._planned_action
+            return super().decide_action()
+        self._planned_position = self.player_position
+        self._planned_time = now
+
+        values = self.planner.evaluate(self)
+        if values is None or values.max() - values.min() < self.MIN_SPREAD:
+            self._planned_action = None
+            return super().decide_action()
+
+        best = np.flatnonzero(values >= values.max() - 1e-9)
+        action = AIAction(int(self.random.choice(list(best))))
+        if action == AIAction.SHOOT:
+            self.memory['last_firing_time'] = now
+        self._planned_action = action
+        return action
+
+    def stop(self):
+        super().stop()
+        self.planner.shutdown()
@@ -2,6 +2,7 @@
 import pygame
 from src.character import Character
 from src.bullet import Bullet, BulletTargetTypes
+from src.audio_events import AudioEvents
 
 class ShootingCharacter(Character):
     def __init__(self, sprite_sheet, shoot_sound=None):
@@ -17,8 +18,9 @@ class ShootingCharacter(Character):
     def fire(self, target_type, speed):
         self._bullet = Bullet(self, target_type, speed)
         
+        # shoot_sound bir SoundEvent - ses thread'inde çalar
         if self._shoot_sound:
-            self._shoot_sound.play()
+            AudioEvents.emit(self._shoot_sound)
         
         return self._bullet
     
@@ -1,6 +1,7 @@
 # src/simple_controls.py
 import pygame
 from enum import Enum
+from typing import NamedTuple
 
 class PlayerNumber(Enum):
     PLAYER1 = 0
@@ -10,74 +11,83 @@ class PlayerType(Enum):
     HUMAN = 0
     AI = 1
 
-class SimpleControls:
-    _keys = {
-        pygame.K_LEFT: False,
-        pygame.K_RIGHT: False,
-        pygame.K_UP: False,
-        pygame.K_DOWN: False,
-        pygame.K_SPACE: False,
-        pygame.K_RETURN: False,
-        pygame.K_w: False,
-        pygame.K_a: False,
-        pygame.K_s: False,
-        pygame.K_d: False,
-        pygame.K_g: False,
-        pygame.K_j: False,
-        pygame.K_y: False,
-        pygame.K_h: False,
-        pygame.K_f: False,
-        pygame.K_F1: False,
-        pygame.K_F2: False,
-        pygame.K_F3: False,
-        pygame.K_F4: False,
-        pygame.K_F5: False,
-        pygame.K_F6: False, 
-        pygame.K_ESCAPE: False,
-    }
+class InputBit:
+    """Oyuncu ve sistem girdi maskelerindeki bitler"""
+    LEFT = 1
+    RIGHT = 2
+    UP = 4
+    DOWN = 8
+    A = 16
+    B = 32
+    
+    # Sistem tuşları (oyuncudan bağımsız)
+    START = 1
+    SELECT = 2
+    P1_AI_TOGGLE = 4
+    P2_AI_TOGGLE = 8
+    BOTH_AI_TOGGLE = 16
+    CHEAT_KILL = 32
+    ESCAPE = 64
 
-    # Yeni eklenecek değişken
-    _key_down_processed = {
-        pygame.K_LEFT: False,
-        pygame.K_RIGHT: False,
-        pygame.K_UP: False,
-        pygame.K_DOWN: False,
-        pygame.K_SPACE: False,
-        pygame.K_RETURN: False,
-        pygame.K_w: False,
-        pygame.K_a: False,
-        pygame.K_s: False,
-        pygame.K_d: False,
-        pygame.K_g: False,
-        pygame.K_j: False,
-        pygame.K_y: False, 
-        pygame.K_h: False,
-        pygame.K_f: False,
-        pygame.K_F1: False,
-        pygame.K_F2: False,
-        pygame.K_F3: False,
-        pygame.K_F4: False,
-        pygame.K_F5: False,
-        pygame.K_F6: False, 
-        pygame.K_ESCAPE: False,
+class InputSnapshot(NamedTuple):
+    """Bir frame'in değişmez girdi görüntüsü - kayıt/tekrar oynatma birimi"""
+    frame: int
+    masks: tuple        # (P1, P2) basılı bitler
+    pressed: tuple      # (P1, P2) bu frame yeni basılan bitler
+    system: int
+    system_pressed: int
+
+class SimpleControls:
+    """
+    Girdi katmanı. get_states() her frame oyuncu başına tek bir bit maskesi üretir:
+    insan oyuncular klavyeden okunur, AI oyuncuların maskesi boştur. Kenar tespiti
+    önceki maskeyle XOR üzerinden yapılır; headless modda klavye hiç okunmaz.
+    """
+    # Bit -> tuşlar (P2 için iki ayrı tuş takımı desteklenir)
+    _PLAYER_BINDINGS = {
+        PlayerNumber.PLAYER1: (
+            (InputBit.LEFT, (pygame.K_LEFT,)),
+            (InputBit.RIGHT, (pygame.K_RIGHT,)),
+            (InputBit.UP, (pygame.K_UP,)),
+            (InputBit.DOWN, (pygame.K_DOWN,)),
+            (InputBit.A, (pygame.K_SPACE,)),
+            (InputBit.B, (pygame.K_RETURN,)),
+        ),
+        PlayerNumber.PLAYER2: (
+            (InputBit.LEFT, (pygame.K_g, pygame.K_a)),
+            (InputBit.RIGHT, (pygame.K_j, pygame.K_d)),
+            (InputBit.UP, (pygame.K_y, pygame.K_w)),
+            (InputBit.DOWN, (pygame.K_h, pygame.K_s)),
+            (InputBit.A, (pygame.K_f,)),
+            (InputBit.B, (pygame.K_d,)),
+        )
     }
-    
-    # AI kontrolcüsüne referans
-    _ai_controller = None
+    _SYSTEM_BINDINGS = (
+        (InputBit.START, pygame.K_F1),
+        (InputBit.SELECT, pygame.K_F2),
+        (InputBit.P1_AI_TOGGLE, pygame.K_F3),
+        (InputBit.P2_AI_TOGGLE, pygame.K_F4),
+        (InputBit.BOTH_AI_TOGGLE, pygame.K_F5),
+        (InputBit.CHEAT_KILL, pygame.K_F6),
+        (InputBit.ESCAPE, pygame.K_ESCAPE),
+    )
     
     # Oyuncu tiplerini tut
     _player_types = {
         PlayerNumber.PLAYER1: PlayerType.HUMAN,
         PlayerNumber.PLAYER2: PlayerType.HUMAN
     }
-
-    _previous_keys = {}
-    _key_just_pressed = {}
     
-    @staticmethod
-    def set_ai_controller(ai_controller):
-        """AI Kontrolcüsünü ayarla"""
-        SimpleControls._ai_controller = ai_controller
+    # False ise (headless) klavye okunmaz, sadece AI / tekrar kaynakları kullanılır
+    _keyboard_enabled = True
+    
+    _snapshot = InputSnapshot(0, (0, 0), (0, 0), 0, 0)
+    # Basılmış ama henüz is_*_newly_pressed ile tüketilmemiş bitler
+    _unconsumed = [0, 0]
+    
+    # Kayıt ve tekrar oynatma
+    _recording = None
+    _replay = None
     
     @staticmethod
     def set_player_type(player_number, player_type):
@@ -89,223 +99,193 @@ class SimpleControls:
         """Oyuncu tipini döndür"""
         return SimpleControls._player_types.get(player_number, PlayerType.HUMAN)
     
+    @staticmethod
+    def set_keyboard_enabled(enabled):
+        SimpleControls._keyboard_enabled = enabled
+    
     @staticmethod
     def get_states():
-        # Gerçek klavye durumlarını al
-        keys = pygame.key.get_pressed()
-
-        # Her bir tuş için güncelleme
-        for key in SimpleControls._keys:
-            # Tuş şu anda basılı mı?
-            current_key_state = keys[key]
-            
-            # Tuşun eski durumunu kaydet
-            SimpleControls._keys[key] = current_key_state
-            
-            # Tuş bırakıldıysa, işlenme durumunu sıfırla
-            if not current_key_state:
-                SimpleControls._key_down_processed[key] = False
-        
-        # Oyuncu 1 kontrolleri
-        SimpleControls._keys[pygame.K_LEFT] = keys[pygame.K_LEFT]
-        SimpleControls._keys[pygame.K_RIGHT] = keys[pygame.K_RIGHT]
-        SimpleControls._keys[pygame.K_UP] = keys[pygame.K_UP]
-        SimpleControls._keys[pygame.K_DOWN] = keys[pygame.K_DOWN]
-        SimpleControls._keys[pygame.K_SPACE] = keys[pygame.K_SPACE]
-        SimpleControls._keys[pygame.K_RETURN] = keys[pygame.K_RETURN]
+        """Bu frame'in girdi görüntüsünü oluştur"""
+        previous = SimpleControls._snapshot
         
-        # Oyuncu 2 WASD kontrolleri
-        SimpleControls._keys[pygame.K_w] = keys[pygame.K_w]
-        SimpleControls._keys[pygame.K_a] = keys[pygame.K_a]
-        SimpleControls._keys[pygame.K_s] = keys[pygame.K_s]
-        SimpleControls._keys[pygame.K_d] = keys[pygame.K_d]
-        
-        # Oyuncu 2 orjinal kontrolleri
-        SimpleControls._keys[pygame.K_g] = keys[pygame.K_g]
-        SimpleControls._keys[pygame.K_j] = keys[pygame.K_j]
-        SimpleControls._keys[pygame.K_y] = keys[pygame.K_y]
-        SimpleControls._keys[pygame.K_h] = keys[pygame.K_h]
-        SimpleControls._keys[pygame.K_f] = keys[pygame.K_f]
-        
-        # Sistem kontrolleri
-        SimpleControls._keys[pygame.K_F1] = keys[pygame.K_F1]
-        SimpleControls._keys[pygame.K_F2] = keys[pygame.K_F2]
-        SimpleControls._keys[pygame.K_F3] = keys[pygame.K_F3]
-        SimpleControls._keys[pygame.K_F4] = keys[pygame.K_F4]
-        SimpleControls._keys[pygame.K_F5] = keys[pygame.K_F5]
-        SimpleControls._keys[pygame.K_F6] = keys[pygame.K_F6]  # F6 tuşunu ekledik
-        SimpleControls._keys[pygame.K_ESCAPE] = keys[pygame.K_ESCAPE]
-
-        # "Yeni basılmış" tuşları belirle
-        for key in SimpleControls._keys:
-            SimpleControls._key_just_pressed[key] = (
-                SimpleControls._keys[key] and not SimpleControls._previous_keys.get(key, False)
+        if SimpleControls._replay is not None:
+            snapshot = SimpleControls._next_replay_snapshot(previous)
+        else:
+            keys = pygame.key.get_pressed() if SimpleControls._keyboard_enabled else None
+            masks = (SimpleControls._player_mask(PlayerNumber.PLAYER1, keys),
+                     SimpleControls._player_mask(PlayerNumber.PLAYER2, keys))
+            system = SimpleControls._system_mask(keys)
+            
+            # Yeni basılanlar: önceki maskede olmayan bitler
+            snapshot = InputSnapshot(
+                previous.frame + 1,
+                masks,
+                ((masks[0] ^ previous.masks[0]) & masks[0], (masks[1] ^ previous.masks[1]) & masks[1]),
+                system,
+                (system ^ previous.system) & system
             )
-
         
-        # AI kontrolcüsü varsa, simüle edilmiş tuşları ekle
-        if SimpleControls._ai_controller:
-            SimpleControls._ai_controller.update_key_states()
-            
-            # AI tuş durumlarını entegre et
-            for key in SimpleControls._ai_controller.key_states:
-                # AI kontrolleri insan kontrollerini geçersiz kılar
-                # ama sadece ilgili oyuncu AI ise
-                if key in [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_SPACE] and \
-                   SimpleControls._player_types[PlayerNumber.PLAYER1] == PlayerType.AI:
-                    SimpleControls._keys[key] |= SimpleControls._ai_controller.key_states[key]
-                
-                elif key in [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_f] and \
-                     SimpleControls._player_types[PlayerNumber.PLAYER2] == PlayerType.AI:
-                    SimpleControls._keys[key] |= SimpleControls._ai_controller.key_states[key]
+        # Bırakılan tuşun tüketilmemiş basışı da düşer
+        unconsumed = SimpleControls._unconsumed
+        for index in (0, 1):
+            unconsumed[index] = (unconsumed[index] | snapshot.pressed[index]) & snapshot.masks[index]
+        
+        SimpleControls._snapshot = snapshot
+        if SimpleControls._recording is not None:
+            SimpleControls._recording.append(snapshot)
+        return snapshot
     
     @staticmethod
-    def is_any_move_key_down(player_number):
-        return (SimpleControls.is_left_down(player_number) or
-                SimpleControls.is_right_down(player_number) or
-                SimpleControls.is_up_down(player_number) or
-                SimpleControls.is_down_down(player_number))
+    def snapshot():
+        """Son get_states() görüntüsü"""
+        return SimpleControls._snapshot
     
     @staticmethod
-    def is_left_down(player_number):
-        if player_number == PlayerNumber.PLAYER1 and SimpleControls._keys[pygame.K_LEFT]:
-            return True
-        elif player_number == PlayerNumber.PLAYER2 and (SimpleControls._keys[pygame.K_g] or SimpleControls._keys[pygame.K_a]):
-            return True
-        return False
+    def start_recording():
+        SimpleControls._recording = []
     
-     # Yeni metot: Tuşa basıldı ve henüz işlenmedi mi?
     @staticmethod
-    def is_key_newly_pressed(key):
-        # Tuş basılı mı ve henüz işlenmemiş mi?
-        if SimpleControls._keys.get(key, False) and not SimpleControls._key_down_processed.get(key, False):
-            # İşlendi olarak işaretle
-            SimpleControls._key_down_processed[key] = True
-            return True
-        return False
+    def stop_recording():
+        """Kaydedilen görüntü listesini döndür"""
+        recording = SimpleControls._recording or []
+        SimpleControls._recording = None
+        return recording
     
-    # Yeni hareket kontrolleri - sadece işlenmemiş basışları kontrol eder
     @staticmethod
-    def is_left_newly_pressed(player_number):
-        if player_number == PlayerNumber.PLAYER1:
-            return SimpleControls.is_key_newly_pressed(pygame.K_LEFT)
-        elif player_number == PlayerNumber.PLAYER2:
-            return (SimpleControls.is_key_newly_pressed(pygame.K_g) or 
-                    SimpleControls.is_key_newly_pressed(pygame.K_a))
-        return False
+    def replay(snapshots):
+        """Sonraki get_states() çağrıları kaynak yerine bu görüntüleri sırayla verir"""
+        SimpleControls._replay = iter(snapshots)
     
     @staticmethod
-    def is_right_newly_pressed(player_number):
-        if player_number == PlayerNumber.PLAYER1:
-            return SimpleControls.is_key_newly_pressed(pygame.K_RIGHT)
-        elif player_number == PlayerNumber.PLAYER2:
-            return (SimpleControls.is_key_newly_pressed(pygame.K_j) or 
-                    SimpleControls.is_key_newly_pressed(pygame.K_d))
-        return False
+    def _next_replay_snapshot(previous):
+        snapshot = next(SimpleControls._replay, None)
+        if snapshot is None:
+            # Kayıt bitti - girdi yok
+            SimpleControls._replay = None
+            return InputSnapshot(previous.frame + 1, (0, 0), (0, 0), 0, 0)
+        return snapshot
     
     @staticmethod
-    def is_up_newly_pressed(player_number):
-        if player_number == PlayerNumber.PLAYER1:
-            return SimpleControls.is_key_newly_pressed(pygame.K_UP)
-        elif player_number == PlayerNumber.PLAYER2:
-            return (SimpleControls.is_key_newly_pressed(pygame.K_y) or 
-                    SimpleControls.is_key_newly_pressed(pygame.K_w))
-        return False
+    def _player_mask(player_number, keys):
+        # AI oyuncular klavyeden okunmaz - komutları AIController'dan doğrudan gelir
+        if keys is None or SimpleControls._player_types[player_number] == PlayerType.AI:
+            return 0
+        
+        mask = 0
+        for bit, key_codes in SimpleControls._PLAYER_BINDINGS[player_number]:
+            for key in key_codes:
+                if keys[key]:
+                    mask |= bit
+                    break
+        return mask
     
     @staticmethod
-    def is_down_newly_pressed(player_number):
-        if player_number == PlayerNumber.PLAYER1:
-            return SimpleControls.is_key_newly_pressed(pygame.K_DOWN)
-        elif player_number == PlayerNumber.PLAYER2:
-            return (SimpleControls.is_key_newly_pressed(pygame.K_h) or 
-                    SimpleControls.is_key_newly_pressed(pygame.K_s))
-        return False
+    def _system_mask(keys):
+        if keys is None:
+            return 0
+        
+        mask = 0
+        for bit, key in SimpleControls._SYSTEM_BINDINGS:
+            if keys[key]:
+                mask |= bit
+        return mask
     
     @staticmethod
-    def is_a_newly_pressed(player_number):
-        if player_number == PlayerNumber.PLAYER1:
-            return SimpleControls.is_key_newly_pressed(pygame.K_SPACE)
-        elif player_number == PlayerNumber.PLAYER2:
-            return SimpleControls.is_key_newly_pressed(pygame.K_f)
-        return False
+    def _down(player_number, bit):
+        return SimpleControls._snapshot.masks[player_number.value] & bit != 0
     
     @staticmethod
-    def is_right_down(player_number):
-        if player_number == PlayerNumber.PLAYER1 and SimpleControls._keys[pygame.K_RIGHT]:
-            return True
-        elif player_number == PlayerNumber.PLAYER2 and (SimpleControls._keys[pygame.K_j] or SimpleControls._keys[pygame.K_d]):
+    def _consume(player_number, bit):
+        """Basış henüz işlenmediyse True döndür ve işlendi olarak işaretle"""
+        index = player_number.value
+        if SimpleControls._unconsumed[index] & bit:
+            SimpleControls._unconsumed[index] &= ~bit
             return True
         return False
- 
+    
     @staticmethod
-    def is_left_just_pressed(player_number):
-         if player_number == PlayerNumber.PLAYER1:
-                return SimpleControls._key_just_pressed.get(pygame.K_LEFT, False)
-         elif player_number == PlayerNumber.PLAYER2:
-                return (SimpleControls._key_just_pressed.get(pygame.K_g, False) or 
-                    SimpleControls._key_just_pressed.get(pygame.K_a, False))
-         return False
+    def is_any_move_key_down(player_number):
+        move_bits = InputBit.LEFT | InputBit.RIGHT | InputBit.UP | InputBit.DOWN
+        return SimpleControls._down(player_number, move_bits)
+    
+    @staticmethod
+    def is_left_down(player_number):
+        return SimpleControls._down(player_number, InputBit.LEFT)
+    
+    @staticmethod
+    def is_right_down(player_number):
+        return SimpleControls._down(player_number, InputBit.RIGHT)
     
     @staticmethod
     def is_up_down(player_number):
-        if player_number == PlayerNumber.PLAYER1 and SimpleControls._keys[pygame.K_UP]:
-            return True
-        elif player_number == PlayerNumber.PLAYER2 and (SimpleControls._keys[pygame.K_y] or SimpleControls._keys[pygame.K_w]):
-            return True
-        return False
+        return SimpleControls._down(player_number, InputBit.UP)
     
     @staticmethod
     def is_down_down(player_number):
-        if player_number == PlayerNumber.PLAYER1 and SimpleControls._keys[pygame.K_DOWN]:
-            return True
-        elif player_number == PlayerNumber.PLAYER2 and (SimpleControls._keys[pygame.K_h] or SimpleControls._keys[pygame.K_s]):
-            return True
-        return False
+        return SimpleControls._down(player_number, InputBit.DOWN)
     
     @staticmethod
     def is_a_down(player_number):
-        if player_number == PlayerNumber.PLAYER1 and SimpleControls._keys[pygame.K_SPACE]:
-            return True
-        elif player_number == PlayerNumber.PLAYER2 and SimpleControls._keys[pygame.K_f]:
-            return True
-        return False
+        return SimpleControls._down(player_number, InputBit.A)
     
     @staticmethod
     def is_b_down(player_number):
-        if player_number == PlayerNumber.PLAYER1 and SimpleControls._keys[pygame.K_RETURN]:
-            return True
-        elif player_number == PlayerNumber.PLAYER2 and SimpleControls._keys[pygame.K_d]:
-            return True
-        return False
+        return SimpleControls._down(player_number, InputBit.B)
+    
+    # Sadece işlenmemiş basışları kontrol eder - basılı tutmak tekrar tetiklemez
+    @staticmethod
+    def is_left_newly_pressed(player_number):
+        return SimpleControls._consume(player_number, InputBit.LEFT)
+    
+    @staticmethod
+    def is_right_newly_pressed(player_number):
+        return SimpleControls._consume(player_number, InputBit.RIGHT)
+    
+    @staticmethod
+    def is_up_newly_pressed(player_number):
+        return SimpleControls._consume(player_number, InputBit.UP)
+    
+    @staticmethod
+    def is_down_newly_pressed(player_number):
+        return SimpleControls._consume(player_number, InputBit.DOWN)
+    
+    @staticmethod
+    def is_a_newly_pressed(player_number):
+        return SimpleControls._consume(player_number, InputBit.A)
+    
+    @staticmethod
+    def is_left_just_pressed(player_number):
+        """Sadece bu frame basıldıysa True (tüketmez)"""
+        return SimpleControls._snapshot.pressed[player_number.value] & InputBit.LEFT != 0
     
     @staticmethod
     def is_start_down():
-        return SimpleControls._keys[pygame.K_F1]
+        return SimpleControls._snapshot.system & InputBit.START != 0
     
     @staticmethod
     def is_select_down():
-        return SimpleControls._keys[pygame.K_F2]
+        return SimpleControls._snapshot.system & InputBit.SELECT != 0
     
     @staticmethod
     def is_p1_ai_toggle_down():
         """F3 tuşu Player 1'i AI/insan arasında değiştirir"""
-        return SimpleControls._keys[pygame.K_F3]
+        return SimpleControls._snapshot.system & InputBit.P1_AI_TOGGLE != 0
     
     @staticmethod
     def is_p2_ai_toggle_down():
         """F4 tuşu Player 2'yi AI/insan arasında değiştirir"""
-        return SimpleControls._keys[pygame.K_F4]
+        return SimpleControls._snapshot.system & InputBit.P2_AI_TOGGLE != 0
     
     @staticmethod
     def is_both_ai_toggle_down():
         """F5 tuşu her iki oyuncuyu da AI yapar"""
-        return SimpleControls._keys[pygame.K_F5]
+        return SimpleControls._snapshot.system & InputBit.BOTH_AI_TOGGLE != 0
     
     @staticmethod
     def is_escape_down():
-        return SimpleControls._keys[pygame.K_ESCAPE]
+        return SimpleControls._snapshot.system & InputBit.ESCAPE != 0
     
     @staticmethod
     def is_cheat_kill_down():
         """F6 tuşu düşmanları öldüren hile"""
-        return SimpleControls._keys[pygame.K_F6]
\ No newline at end of file
+        return SimpleControls._snapshot.system & InputBit.CHEAT_KILL != 0
@@ -0,0 +1,179 @@
+# src/team_planner.py
+import math
+import time
+from typing import NamedTuple
+import numpy as np
+from src.batch_simulator import CELL_WIDTH, CELL_HEIGHT
+from src.utility_ai import DistanceTable
+
+# Ulaşılamayan hedefin atama maliyeti (hücre)
+UNREACHABLE = 1000.0
+
+class TeamIntent(NamedTuple):
+    """Planlayıcının bir oyuncuya bu frame verdiği görev"""
+    role: str               # 'hunt' (düşman hedefi) veya 'zone' (bölge devriyesi)
+    target_cell: tuple      # (x, y) gidilecek hücre
+    enemy_index: int        # Hedef düşmanın 'enemies' listesindeki sırası, yoksa -1
+    zone: tuple             # (x_min, x_max) sorumlu olunan sütun aralığı
+
+def solve_assignment(cost):
+    """
+    Macar algoritması (potansiyelli, O(n^2 m)) - satır başına bir sütun.
+    Satır sayısı sütun sayısından fazla olamaz. Matrisler küçük (oyuncu x düşman)
+    olduğundan düz listelerle çalışır.
+
+    Returns:
+        list: assignment[satır] = sütun
+    """
+    cost = cost.tolist() if hasattr(cost, 'tolist') else cost
+    rows, cols = len(cost), len(cost[0])
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (cols + 1)
+    # owner[j] = j. sütuna atanmış satır (1 tabanlı, 0 = boş)
+    owner = [0] * (cols + 1)
+    way = [0] * (cols + 1)
+
+    for row in range(1, rows + 1):
+        owner[0] = row
+        column = 0
+        min_slack = [math.inf] * (cols + 1)
+        used = [False] * (cols + 1)
+        while True:
+            used[column] = True
+            current = owner[column]
+            costs = cost[current - 1]
+            delta = math.inf
+            next_column = 0
+            for j in range(1, cols + 1):
+                if not used[j]:
+                    slack = costs[j - 1] - u[current] - v[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        way[j] = column
+                    if min_slack[j] < delta:
+                        delta = min_slack[j]
+                        next_column = j
+            for j in range(cols + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            column = next_column
+            if owner[column] == 0:
+                break
+
+        # Artırıcı yol boyunca atamaları kaydır
+        while column:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+
+    assignment = [-1] * rows
+    for column in range(1, cols + 1):
+        if owner[column]:
+            assignment[owner[column] - 1] = column - 1
+    return assignment
+
+class TeamPlanner:
+    """
+    İşbirliği modunda takım planlayıcısı (ana thread, frame başına bir kez).
+    Tek dünya modeli kurulur: oyuncu ve düşman hücreleri, DistanceTable yol
+    uzunlukları. Düşman hedefleri oyunculara Macar algoritmasıyla (toplam yol
+    en kısa) atanır; hedefsiz kalan oyuncu kendi yarı sahasında tahmini düşman
+    yoğunluğunun en yüksek olduğu hücreye devriye gider. Her AI niyetini
+    oyun durumundaki 'team_intent' ile alır.
+    """
+
+    def __init__(self):
+        self.plans = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def plan(self, players, enemies, level, prediction=None):
+        """
+        Args:
+            players: Player nesneleri (None olabilir)
+            enemies: Enemy nesneleri (oyun durumundaki sırayla)
+            level: Geçerli Level
+            prediction: Bu frame'in EnemyPrediction'ı (zon hedefi için)
+
+        Returns:
+            dict: PlayerNumber -> TeamIntent
+        """
+        start = time.perf_counter()
+        table = DistanceTable.for_level(level)
+        active = [player for player in players if player is not None and player.visible]
+        if not active:
+            return {}
+
+        player_cells = [self._cell(table, player) for player in active]
+        targets = [(index, self._cell(table, enemy)) for index, enemy in enumerate(enemies) if enemy.visible]
+        zones = self._zones(table, len(active))
+
+        intents = {}
+        unassigned = list(range(len(active)))
+        if targets:
+            # Satırlar oyuncular, sütunlar düşmanlar; daha az düşman varsa tersine çöz
+            cost = np.minimum(table.distances[np.ix_(player_cells, [cell for _, cell in targets])], UNREACHABLE)
+            if len(active) <= len(targets):
+                pairs = list(enumerate(solve_assignment(cost)))
+            else:
+                pairs = [(row, column) for column, row in enumerate(solve_assignment(cost.T))]
+
+            for row, column in pairs:
+                if column < 0 or cost[row, column] >= UNREACHABLE:
+                    continue
+                enemy_index, target_cell = targets[column]
+                intents[active[row].player_number] = TeamIntent(
+                    'hunt', table.cell(target_cell), enemy_index, zones[0])
+                unassigned.remove(row)
+
+        # Bölgeler de oyunculara aynı çözücüyle dağıtılır (herkes kendine yakın yarıyı alır)
+        zone_cost = np.array([[abs(table.cell(cell)[0] - (zone[0] + zone[1]) / 2.0) for zone in zones]
+                              for cell in player_cells])
+        for row, column in enumerate(solve_assignment(zone_cost)):
+            zone = zones[column]
+            player_number = active[row].player_number
+            if row in unassigned:
+                intents[player_number] = TeamIntent(
+                    'zone', self._patrol_cell(table, zone, prediction), -1, zone)
+            else:
+                intents[player_number] = intents[player_number]._replace(zone=zone)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.plans += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        return intents
+
+    def get_stats(self):
+        return {
+            'plans': self.plans,
+            'avg_ms': self.total_ms / self.plans if self.plans else 0.0,
+            'max_ms': self.max_ms
+        }
+
+    @staticmethod
+    def _cell(table, character):
+        return table.index(character.pixel_position_x // CELL_WIDTH, character.pixel_position_y // CELL_HEIGHT)
+
+    @staticmethod
+    def _zones(table, count):
+        """Oyun alanı (kenar sütunları hariç) oyuncu sayısı kadar sütun aralığına bölünür"""
+        first, last = 1, table.width - 2
+        span = (last - first + 1) / count
+        return [(first + int(round(span * index)), first + int(round(span * (index + 1))) - 1)
+                for index in range(count)]
+
+    @staticmethod
+    def _patrol_cell(table, zone, prediction):
+        """Bölgede tahmini düşman yoğunluğu en yüksek hücre, tahmin yoksa bölge ortası"""
+        columns = slice(zone[0], zone[1] + 1)
+        if prediction is not None and prediction.enemy_count:
+            occupancy = prediction.occupancy(prediction.horizon)[:, columns]
+            if occupancy.max() > 0:
+                grid_y, grid_x = np.unravel_index(int(np.argmax(occupancy)), occupancy.shape)
+                return int(grid_x) + zone[0], int(grid_y)
+        return (zone[0] + zone[1]) // 2, table.height // 2
@@ -0,0 +1,417 @@
+# src/utility_ai.py
+import math
+import time
+from typing import NamedTuple
+import numpy as np
+from src.batch_simulator import (
+    LevelTables, UP, DOWN, LEFT, RIGHT, SHOOT, DIR_X, DIR_Y, REVERSE
+)
+from src.guard_solver import GuardSolver
+
+# Aday eylem sayısı - indeksler AIAction değerleriyle aynı (MOVE_UP=0 ... NO_ACTION=5)
+CANDIDATES = 6
+MOVES = (UP, DOWN, LEFT, RIGHT)
+
+class DistanceTable:
+    """
+    Seviyenin tüm hücre çiftleri arası en kısa yol uzunlukları (Level.can_move kuralları).
+    BFS katmanları boolean matris çarpımıyla tüm kaynaklar için aynı anda ilerletilir.
+    Tablo ızgara özetiyle önbelleklenir; karar başına sadece indekslenir.
+    """
+    _cache = {}
+
+    def __init__(self, tables):
+        self.width = tables.width
+        self.height = tables.height
+        self.count = self.width * self.height
+        cells = np.arange(self.count)
+        can_move = tables.can_move.reshape(self.count, 4)
+
+        # (N, 4) yöndeki komşu hücre, geçilemiyorsa kendisi
+        neighbors = np.repeat(cells[:, None], 4, axis=1)
+        for direction in MOVES:
+            shifted = cells + int(DIR_Y[direction]) * self.width + int(DIR_X[direction])
+            neighbors[:, direction] = np.where(can_move[:, direction], shifted, cells)
+
+        adjacency = np.zeros((self.count, self.count), dtype=np.float32)
+        for direction in MOVES:
+            open_cells = cells[can_move[:, direction]]
+            adjacency[open_cells, neighbors[open_cells, direction]] = 1.0
+
+        # distances[a, b] = a'dan b'ye adım sayısı (ulaşılamıyorsa inf)
+        distances = np.full((self.count, self.count), np.inf)
+        np.fill_diagonal(distances, 0.0)
+        reached = np.eye(self.count, dtype=bool)
+        frontier = reached.astype(np.float32)
+        step = 0
+        while True:
+            step += 1
+            layer = ((frontier @ adjacency) > 0) & ~reached
+            if not layer.any():
+                break
+            distances[layer] = step
+            reached |= layer
+            frontier = layer.astype(np.float32)
+        self.distances = distances
+
+        # (N, 4) hücreden yöne duvara kadar görülen hücre sayısı
+        sight = np.zeros((self.count, 4), dtype=np.int64)
+        for direction in MOVES:
+            for cell in range(self.count):
+                current = cell
+                while can_move[current, direction] and sight[cell, direction] < self.count:
+                    current = neighbors[current, direction]
+                    sight[cell, direction] += 1
+
+        # Karar başına tekil okumalar için liste kopyaları
+        self.neighbors = neighbors
+        self.can_move = can_move.tolist()
+        self.neighbor_list = neighbors.tolist()
+        self.sight = sight.tolist()
+        self.cell_x = cells % self.width
+        self.cell_y = cells // self.width
+
+    @staticmethod
+    def for_level(level):
+        key = GuardSolver.level_key(level)
+        table = DistanceTable._cache.get(key)
+        if table is None:
+            table = DistanceTable(LevelTables.from_level(level))
+            DistanceTable._cache[key] = table
+        return table
+
+    def index(self, grid_x, grid_y):
+        grid_x = min(max(int(grid_x), 0), self.width - 1)
+        grid_y = min(max(int(grid_y), 0), self.height - 1)
+        return grid_y * self.width + grid_x
+
+    def cell(self, index):
+        return int(index % self.width), int(index // self.width)
+
+    def step_towards(self, start, goal):
+        """start'tan goal'a yolu kısaltan ilk yön, yoksa -1"""
+        row = self.distances[:, goal]
+        best = -1
+        best_cost = row[start]
+        for direction, allowed in enumerate(self.can_move[start]):
+            if allowed:
+                cost = row[self.neighbor_list[start][direction]]
+                if cost < best_cost:
+                    best_cost = cost
+                    best = direction
+        return best
+
+class EnemyFeature(NamedTuple):
+    index: int          # 'enemies' listesindeki sıra
+    cell: int           # Tablo indeksi
+    dx: float           # Oyuncuya göre piksel farkı
+    dy: float
+    distance: float     # Piksel mesafesi
+    path: float         # Hücre yolu uzunluğu (ulaşılamıyorsa inf)
+    in_sight: bool      # Aynı satır/sütunda ve arada duvar yok
+
+class DecisionFeatures(NamedTuple):
+    """Bir karar için bir kez hesaplanan ortak özellikler"""
+    now: float
+    table: DistanceTable
+    cell: int               # Oyuncu hücresi (tablo indeksi)
+    position: tuple         # Oyuncu pikseli (x, y)
+    facing: int             # Baktığı yön (UP..RIGHT), yoksa -1
+    open_moves: list        # [4] geçilebilir yönler
+    safe_moves: list        # [4] sonraki hücrenin SAFE_DISTANCE yakınında düşman yok
+    enemies: list           # Görünür düşmanlar (EnemyFeature)
+
+class UtilityScorer:
+    """
+    Yardımcı (utility) karar motoru.
+    Ortak özellikler karar başına bir kez çıkarılır (mesafeler, hizalar, görüş,
+    mesafe tablosundan yol uzunlukları); her strateji terimi 6 adaylık bir katkı
+    satırı yazar, AI'ın weights ağırlıklarıyla ölçeklenmiş satırlar tek matriste
+    toplanır. Önerilmeyen adaylar elenir, eşitlik tohumlu gürültüyle bozulur.
+    Terim başına süre ve son kararın katkıları hata ayıklama için tutulur.
+    """
+    TERMS = ('threat', 'shoot', 'hunt', 'cooperation', 'explore')
+    # Düşman bu mesafedeyse (px) gidilecek hücre güvenli sayılmaz
+    SAFE_DISTANCE = 15
+    SHOOT_COOLDOWN = 0.4
+
+    def __init__(self):
+        self.timings = {name: [0, 0.0, 0.0] for name in ('features',) + self.TERMS}
+        # Son karar: terim -> katkı satırı, toplam puanlar
+        self.last_contributions = {}
+        self.last_scores = None
+        self._turn_for_shot = -1
+
+    def decide(self, ai):
+        """
+        Returns:
+            int: Seçilen aday indeksi (AIAction değeri), önerilen eylem yoksa None
+        """
+        start = time.perf_counter()
+        features = self._features(ai)
+        self._record('features', start)
+        if features is None:
+            return None
+
+        self._turn_for_shot = -1
+        rows = []
+        for name in self.TERMS:
+            start = time.perf_counter()
+            row = [0.0] * CANDIDATES
+            getattr(self, '_' + name)(ai, features, row)
+            self._record(name, start)
+            rows.append(row)
+
+        matrix = np.array(rows)
+        scores = matrix.sum(axis=0)
+        proposed = (matrix != 0.0).any(axis=0)
+        self.last_contributions = dict(zip(self.TERMS, matrix))
+        self.last_scores = scores
+        if not proposed.any():
+            return None
+
+        noise = np.array([ai.random.uniform(0, 1) for _ in range(CANDIDATES)])
+        choice = int(np.argmax(np.where(proposed, scores + noise, -np.inf)))
+        self._commit(ai, features, choice)
+        return choice
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: terim -> count, avg_ms, max_ms
+        """
+        return {name: {'count': count,
+                       'avg_ms': total_ms / count if count else 0.0,
+                       'max_ms': max_ms}
+                for name, (count, total_ms, max_ms) in self.timings.items()}
+
+    def reset_stats(self):
+        for timing in self.timings.values():
+            timing[:] = [0, 0.0, 0.0]
+
+    def _record(self, name, start):
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        timing = self.timings[name]
+        timing[0] += 1
+        timing[1] += elapsed_ms
+        if elapsed_ms > timing[2]:
+            timing[2] = elapsed_ms
+
+    def _commit(self, ai, features, choice):
+        """Hafıza yan etkileri sadece seçilen eylem için uygulanır"""
+        if choice == SHOOT:
+            ai.memory['last_firing_time'] = features.now
+            ai.memory.pop('shoot_after_turn', None)
+        elif choice == self._turn_for_shot:
+            ai.memory['shoot_after_turn'] = True
+
+    def _features(self, ai):
+        if not ai.player_position or not ai.level:
+            return None
+
+        table = DistanceTable.for_level(ai.level)
+        cell_w, cell_h = ai.memory['cell_size']
+        player_x, player_y = ai.player_position
+        grid_x = min(max(int(player_x // cell_w), 0), table.width - 1)
+        grid_y = min(max(int(player_y // cell_h), 0), table.height - 1)
+        cell = grid_y * table.width + grid_x
+        sight = table.sight[cell]
+        distances = table.distances[cell]
+
+        facing = -1
+        if ai.player_direction:
+            dx, dy = ai.player_direction
+            if dx > 0:
+                facing = RIGHT
+            elif dx < 0:
+                facing = LEFT
+            elif dy > 0:
+                facing = DOWN
+            elif dy < 0:
+                facing = UP
+
+        # Sonraki hücre pikselleri
+        steps = [(player_x + int(DIR_X[move]) * cell_w, player_y + int(DIR_Y[move]) * cell_h) for move in MOVES]
+        safe_moves = [True] * 4
+
+        enemies = []
+        for index, enemy in enumerate(ai.enemies):
+            position = enemy.get('position')
+            if not position or not enemy.get('visible', True):
+                continue
+            enemy_x, enemy_y = position
+            dx = enemy_x - player_x
+            dy = enemy_y - player_y
+
+            enemy_grid_x = min(max(int(enemy_x // cell_w), 0), table.width - 1)
+            enemy_grid_y = min(max(int(enemy_y // cell_h), 0), table.height - 1)
+            offset_x = enemy_grid_x - grid_x
+            offset_y = enemy_grid_y - grid_y
+            if offset_y == 0:
+                in_sight = abs(offset_x) <= sight[RIGHT if offset_x > 0 else LEFT]
+            elif offset_x == 0:
+                in_sight = abs(offset_y) <= sight[DOWN if offset_y > 0 else UP]
+            else:
+                in_sight = False
+
+            enemy_cell = enemy_grid_y * table.width + enemy_grid_x
+            enemies.append(EnemyFeature(index, enemy_cell, dx, dy, math.hypot(dx, dy),
+                                        float(distances[enemy_cell]), in_sight))
+
+            for move, (step_x, step_y) in enumerate(steps):
+                if safe_moves[move] and math.hypot(enemy_x - step_x, enemy_y - step_y) < self.SAFE_DISTANCE:
+                    safe_moves[move] = False
+
+        return DecisionFeatures(
+            now=ai._now(),
+            table=table,
+            cell=cell,
+            position=(player_x, player_y),
+            facing=facing,
+            open_moves=table.can_move[cell],
+            safe_moves=safe_moves,
+            enemies=enemies
+        )
+
+    @staticmethod
+    def _axis_direction(enemy, horizontal):
+        if horizontal:
+            return RIGHT if enemy.dx > 0 else LEFT
+        return DOWN if enemy.dy > 0 else UP
+
+    def _threat(self, ai, features, row):
+        """En yakın hizalı düşman: ona bakıyorsak ateş, değilsek ona dön"""
+        aligned = [enemy for enemy in features.enemies if abs(enemy.dy) < 6 or abs(enemy.dx) < 6]
+        if not aligned:
+            return
+
+        nearest = min(aligned, key=lambda enemy: enemy.distance)
+        direction = self._axis_direction(nearest, abs(nearest.dy) < 6)
+        if direction == features.facing:
+            if 10 < nearest.distance < 60:
+                row[SHOOT] = ai.weights['shoot_enemy'] * 1.8
+        elif nearest.distance > 10:
+            row[direction] = ai.weights['hunt'] * 1.2
+
+    def _shoot(self, ai, features, row):
+        """Görüş hattındaki düşmana ateş / dönüş, yoksa önden atış; ara sıra rastgele ateş"""
+        weight = ai.weights['shoot_enemy']
+        since_fire = features.now - ai.memory.get('last_firing_time', 0)
+
+        if ai.random.random() < 0.1 and since_fire > 0.8:
+            row[SHOOT] = weight
+
+        if since_fire < self.SHOOT_COOLDOWN:
+            return
+
+        targets = [enemy for enemy in features.enemies
+                   if enemy.in_sight and (abs(enemy.dy) < 8 or abs(enemy.dx) < 8)]
+        if targets:
+            nearest = min(targets, key=lambda enemy: enemy.distance)
+            direction = self._axis_direction(nearest, abs(nearest.dy) < 8)
+            if direction == features.facing:
+                if ai.memory.get('shoot_after_turn') or ai.random.random() < 0.9:
+                    row[SHOOT] = weight
+            elif features.safe_moves[direction]:
+                row[direction] = weight * 0.8
+                self._turn_for_shot = direction
+        elif ai.lead_target_in_line():
+            row[SHOOT] = weight
+
+    def _hunt(self, ai, features, row):
+        """Skor / yol uzunluğu oranı en iyi düşmanın karşılaşma hücresine doğru"""
+        table = features.table
+        candidates = features.enemies
+        # Takım planı varsa sadece atanan düşman, devriyedeyse sadece kendi bölgesindekiler
+        intent = ai.team_intent
+        if intent is not None:
+            if intent.enemy_index >= 0:
+                candidates = [enemy for enemy in candidates if enemy.index == intent.enemy_index]
+            else:
+                candidates = [enemy for enemy in candidates
+                              if intent.zone[0] <= enemy.cell % table.width <= intent.zone[1]]
+
+        best = None
+        best_value = -1.0
+        for enemy in candidates:
+            if 0 < enemy.path < math.inf:
+                value = ai.enemies[enemy.index].get('score', 100) / enemy.path
+                if value > best_value:
+                    best_value = value
+                    best = enemy
+        if best is None:
+            return
+
+        target = best.cell
+        # Düşmanın şimdiki yerine değil, yolda karşılaşılacağı hücreye git
+        prediction = ai.enemy_prediction
+        if prediction is not None and best.index < prediction.enemy_count:
+            lead = table.index(*prediction.most_likely_cell(best.index, int(best.path) // 2))
+            if lead != features.cell and table.distances[features.cell, lead] < math.inf:
+                target = lead
+
+        weight = ai.weights['hunt']
+        direction = table.step_towards(features.cell, target)
+        if direction >= 0 and features.safe_moves[direction]:
+            row[direction] = weight
+
+        # Ava giderken ara sıra ateş (AI tipine göre)
+        if ai.HUNT_FIRE_CHANCE and ai.random.random() < ai.HUNT_FIRE_CHANCE:
+            if features.now - ai.memory.get('last_firing_time', 0) > 0.6:
+                row[SHOOT] = weight
+
+    def _cooperation(self, ai, features, row):
+        """İşbirliği modunda takım planlayıcısının verdiği hedef/devriye hücresine doğru"""
+        intent = ai.team_intent
+        if intent is None:
+            return
+
+        table = features.table
+        direction = table.step_towards(features.cell, table.index(*intent.target_cell))
+        if direction >= 0 and features.safe_moves[direction]:
+            row[direction] = ai.weights['cooperation']
+
+    def _explore(self, ai, features, row):
+        """Açık komşular: ziyaret edilmemiş > düşman ısısı > diğerleri; geri dönüş cezalı"""
+        weight = ai.weights['exploration']
+        table = features.table
+        memory = ai.grid_memory
+
+        # Uzun süre aynı yerde kaldıysa uzak, tercihen ziyaret edilmemiş bir hedefe git
+        if ai.memory.get('stuck_counter', 0) > 2:
+            grid_x, grid_y = table.cell(features.cell)
+            far = ((np.abs(table.cell_x - grid_x) > 3) | (np.abs(table.cell_y - grid_y) > 3)) & \
+                np.isfinite(table.distances[features.cell])
+            if memory.width == table.width:
+                raw = memory.visited_bits.to_bytes((max(table.count, memory.width * memory.height) + 7) // 8, 'little')
+                visited = np.unpackbits(np.frombuffer(raw, dtype=np.uint8), bitorder='little')[:table.count]
+                unvisited = far & (visited == 0)
+                if unvisited.any():
+                    far = unvisited
+            targets = np.flatnonzero(far)
+            if len(targets):
+                direction = table.step_towards(features.cell, int(targets[ai.random.randrange(len(targets))]))
+                if direction >= 0:
+                    row[direction] = weight
+                    return
+
+        open_moves = features.open_moves
+        open_count = sum(open_moves)
+        if not open_count:
+            return
+
+        neighbors = table.neighbor_list[features.cell]
+        last_move = getattr(ai.memory.get('last_action'), 'value', -1)
+        reverse = int(REVERSE[last_move]) if 0 <= last_move < 4 and open_count > 1 else -1
+        for direction in MOVES:
+            if not open_moves[direction]:
+                continue
+            next_x, next_y = table.cell(neighbors[direction])
+            value = 0.5 if memory.visited(next_x, next_y) else 1.0
+            value += 0.25 * min(1.0, memory.heat(next_x, next_y, features.now))
+            # Mevcut yönde devam eğilimi, geri dönüş cezası
+            if direction == features.facing:
+                value += 0.25
+            if direction == reverse:
+                value *= 0.5
+            row[direction] = value * weight
@@ -126,16 +126,19 @@ class Wizard(Enemy):
             self.look_to(new_direction)
             
             # Ateş et (eğer başka düşman ateş etmiyorsa)
-            if not Enemy.is_any_enemy_firing():
+            if Enemy.bullet_manager.can_fire(self):
                 self.fire()
                 
             CameraShake.shake(1, 100, 0.2)
     
+    def movement_distance(self, delta_time):
+        # 60 FPS frame'i başına 0.2 piksel
+        return 0.2 * (Constants.REFERENCE_FRAME_RATE * delta_time)
+    
     def move(self, delta_time):
         """Wizard'ın hareketini kontrol et"""
         # Hareket etmeden önce yeni pozisyonu kontrol et
-        movement_scale = 0.2
-        new_position = self._position + self._move_direction * movement_scale
+        new_position = self._position + self._move_direction * self.movement_distance(delta_time)
         
         if self.can_move_to_position(new_position.x, new_position.y):
             # Güvenli hareket